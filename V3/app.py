@@ -1,33 +1,111 @@
 import streamlit as st
 import pandas as pd
-from io import StringIO
 from cleaner_utils import (
     smart_title_text,
     find_duplicates_and_uniques,
     count_ids,
-    remove_duplicates,
-    trim_whitespace,
-    capitalize_names,
-    drop_blank_rows,
-    fill_missing_values,
-    fix_text_case,
-    find_and_replace,
-    convert_numbers,
-    split_column,
     ids_to_lines,
     ids_to_csv,
     detect_and_clean_junk_characters,
-    run_ocr_on_image,
     get_tesseract_languages,
+    TALL_IMAGE_HEIGHT,
+    compact_frame,
+    parse_stop_words,
+    NAME_STOP_WORDS,
+    TEXT_STOP_WORDS,
+    scan_junk_characters,
 )
-from PIL import Image
+from pipeline import CleaningPipeline, make_step
+from profiling import PROFILERS
+from streaming import clean_csv_in_chunks, STREAMING_OPERATIONS, DEFAULT_CHUNK_ROWS
+from ocr_cache import OCRCache, cached_ocr
+from ocr_batch import batch_ocr, iter_image_files, results_to_frame
+from parallel import available_cores
+from export import ExportCache, EXPORT_FORMATS, available_formats, export_file_name
+from loader import (
+    INPUT_EXTENSIONS,
+    CSV_ENGINES,
+    input_format,
+    csv_read_options,
+    parse_dtype_hints,
+    parse_usecols,
+    FrameCache,
+    content_digest,
+    cached_load,
+)
+from id_tools import (
+    COUNT_SEPARATORS,
+    CONVERT_SEPARATORS,
+    iter_file_pieces,
+    iter_column_pieces,
+    count_ids_in,
+    find_duplicates_and_uniques_in,
+    convert_ids,
+    id_keys_in,
+    IdComparison,
+)
+from fuzzy import find_near_duplicates, DEFAULT_THRESHOLD
 
 import os
+import json
+import tempfile
 
 if "ocr_text" not in st.session_state:
     st.session_state.ocr_text = ""
 
 st.set_page_config(page_title="CSV Cleaner & Text Utilities", layout="wide")
+
+
+@st.cache_resource
+def get_ocr_cache():
+    # one on-disk cache per process, shared by every session
+    return OCRCache()
+
+
+# Larger result tables are cut to this many rows on screen; the download has them all
+TABLE_DISPLAY_ROWS = 10_000
+
+
+ID_SOURCES = ["Text box", "Uploaded TXT / CSV file", "Column of the loaded CSV"]
+NAME_SOURCES = ["Text box (one value per line)", "Column of the loaded CSV"]
+
+
+def show_converted_ids(path, count, title, file_name):
+    # large lists are never put in a widget: show the count, a preview and the file
+    st.write(f"**{title}:** {count:,} values")
+    with open(path, encoding="utf-8") as converted:
+        st.code(converted.read(2000), language="text")
+
+    def read_converted():
+        with open(path, "rb") as converted:
+            return converted.read()
+
+    st.download_button(f"📥 Download {title}", data=read_converted, file_name=file_name,
+                       mime="text/plain", on_click="ignore")
+
+
+def show_count_table(table, title, file_name):
+    st.write(f"**{title}:** {len(table):,}")
+    if table.empty:
+        return
+    st.dataframe(table.head(TABLE_DISPLAY_ROWS), hide_index=True)
+    if len(table) > TABLE_DISPLAY_ROWS:
+        st.caption(f"Showing the first {TABLE_DISPLAY_ROWS:,} rows; download the table for all of them.")
+    # on_click="ignore": downloading must not rerun the script and clear the results
+    st.download_button(
+        label=f"📥 Download {title} (CSV)",
+        data=table.to_csv(index=False),
+        file_name=file_name,
+        mime="text/csv",
+        on_click="ignore",
+    )
+
+
+@st.cache_resource
+def get_frame_cache():
+    # parsed uploads, shared by every session so the same file is parsed once
+    return FrameCache()
+
 st.title("🧹 CSV & Text Utilities Platform")
 
 TAB1, TAB2, TAB3 = st.tabs([
@@ -36,87 +114,234 @@ TAB1, TAB2, TAB3 = st.tabs([
     "🖼️ Image to Text (OCR)"
 ])
 
-with TAB1:
-    st.header("CSV Cleaning Operations")
+def select_cleaning_steps(allowed=None):
+    """Render the operation checkboxes and return the ticked steps in order."""
+    steps = []
+    def offer(name, label, help=None):
+        return (allowed is None or name in allowed) and st.checkbox(label, help=help)
 
-    uploaded_file = st.file_uploader("Upload CSV File", type="csv")
-    if "csv_df" not in st.session_state:
-        st.session_state.csv_df = None
-    if "csv_logs" not in st.session_state:
-        st.session_state.csv_logs = []
+    if offer("remove_duplicates", "Remove Duplicates"):
+        keep = st.selectbox("Keep Occurrence", ["first", "last"])
+        steps.append(make_step("remove_duplicates", keep=keep))
 
+    if offer("trim_whitespace", "Trim Whitespace"):
+        steps.append(make_step("trim_whitespace"))
 
-    if uploaded_file:
-        st.session_state.csv_df = pd.read_csv(uploaded_file)
-        st.success("File uploaded and loaded successfully!")
-        st.write(st.session_state.csv_df.head())
+    if offer("capitalize_names", "Capitalize Names"):
+        name_stop_words = st.text_input("Words kept lowercase", ", ".join(sorted(NAME_STOP_WORDS)))
+        steps.append(make_step("capitalize_names", stop_words=tuple(sorted(parse_stop_words(name_stop_words)))))
 
-    if st.session_state.csv_df is not None:
-        with st.expander("Select and Apply Operations Step-by-Step"):
-            if st.checkbox("Remove Duplicates"):
-                st.session_state.csv_df, msg = remove_duplicates(st.session_state.csv_df)
-                st.session_state.csv_logs.append(msg)
-                st.success(msg)
+    if offer("drop_blank_rows", "Drop Blank Rows"):
+        steps.append(make_step("drop_blank_rows"))
 
-            if st.checkbox("Trim Whitespace"):
-                st.session_state.csv_df, msg = trim_whitespace(st.session_state.csv_df)
-                st.session_state.csv_logs.append(msg)
-                st.success(msg)
+    if offer("fill_missing_values", "Fill Missing Values"):
+        fill_val = st.text_input("Fill Value", "Missing")
+        steps.append(make_step("fill_missing_values", fill_value=fill_val))
 
-            if st.checkbox("Capitalize Names"):
-                st.session_state.csv_df, msg = capitalize_names(st.session_state.csv_df)
-                st.session_state.csv_logs.append(msg)
-                st.success(msg)
+    if offer("fix_text_case", "Fix Text Case"):
+        case_mode = st.selectbox("Case Mode", ["lower", "upper", "title"])
+        steps.append(make_step("fix_text_case", mode=case_mode))
 
-            if st.checkbox("Drop Blank Rows"):
-                st.session_state.csv_df, msg = drop_blank_rows(st.session_state.csv_df)
-                st.session_state.csv_logs.append(msg)
-                st.success(msg)
+    if offer("find_and_replace", "Find and Replace"):
+        find_val = st.text_input("Find", "null")
+        replace_val = st.text_input("Replace with", "NA")
+        steps.append(make_step("find_and_replace", find_val=find_val, replace_val=replace_val))
 
-            if st.checkbox("Fill Missing Values"):
-                fill_val = st.text_input("Fill Value", "Missing")
-                st.session_state.csv_df, msg = fill_missing_values(st.session_state.csv_df, fill_val)
-                st.session_state.csv_logs.append(msg)
-                st.success(msg)
+    if offer("convert_numbers", "Convert Numbers"):
+        steps.append(make_step("convert_numbers"))
 
-            if st.checkbox("Fix Text Case"):
-                case_mode = st.selectbox("Case Mode", ["lower", "upper", "title"])
-                st.session_state.csv_df, msg = fix_text_case(st.session_state.csv_df, mode=case_mode)
-                st.session_state.csv_logs.append(msg)
-                st.success(msg)
+    if offer("infer_types", "Infer Column Types", help="Samples each text column, then converts it to a compact numeric, boolean, datetime or category type"):
+        max_failed = st.slider("Max failed values (%)", 0, 20, 0)
+        steps.append(make_step("infer_types", max_failure_ratio=max_failed / 100))
 
-            if st.checkbox("Find and Replace"):
-                find_val = st.text_input("Find", "null")
-                replace_val = st.text_input("Replace with", "NA")
-                st.session_state.csv_df, msg = find_and_replace(st.session_state.csv_df, find_val, replace_val)
-                st.session_state.csv_logs.append(msg)
-                st.success(msg)
+    if offer("clean_junk_characters", "Clean Junk Characters", help="Replaces homoglyphs, zero-width and accented characters in every text column"):
+        steps.append(make_step("clean_junk_characters"))
 
-            if st.checkbox("Convert Numbers"):
-                st.session_state.csv_df, msg = convert_numbers(st.session_state.csv_df)
-                st.session_state.csv_logs.append(msg)
-                st.success(msg)
+    if offer("split_column", "Split Column"):
+        split_col = st.text_input("Column to Split", "Full Name")
+        delim = st.text_input("Delimiter", " ")
+        steps.append(make_step("split_column", col=split_col, delimiter=delim))
 
-            if st.checkbox("Split Column"):
-                split_col = st.text_input("Column to Split", "Full Name")
-                delim = st.text_input("Delimiter", " ")
-                st.session_state.csv_df, msg = split_column(st.session_state.csv_df, split_col, delimiter=delim)
-                st.session_state.csv_logs.append(msg)
+    return steps
+
+
+with TAB1:
+    st.header("CSV Cleaning Operations")
+
+    stream_mode = st.checkbox(
+        "Streaming mode (files larger than memory)",
+        help="Reads the CSV in chunks and writes the cleaned rows straight to disk. Duplicates are removed with a compact row-hash index."
+    )
+    uploaded_file = st.file_uploader(
+        "Upload Data File", type=INPUT_EXTENSIONS,
+        help="CSV / TSV (also .gz or .zip compressed), Parquet or Feather"
+    )
+    if "csv_df" not in st.session_state:
+        st.session_state.csv_df = None
+    if "csv_logs" not in st.session_state:
+        st.session_state.csv_logs = []
+    if "csv_pipeline" not in st.session_state:
+        st.session_state.csv_pipeline = None
+        st.session_state.csv_upload_key = None
+    if "stream_output" not in st.session_state:
+        st.session_state.stream_output = None
+    if "csv_exports" not in st.session_state:
+        st.session_state.csv_exports = ExportCache()
+
+
+    if stream_mode:
+        chunk_rows = st.number_input("Rows per chunk", min_value=1_000, value=DEFAULT_CHUNK_ROWS, step=10_000)
+        with st.expander("Select Streaming Operations", expanded=True):
+            stream_steps = select_cleaning_steps(allowed=STREAMING_OPERATIONS)
+
+        if uploaded_file and input_format(uploaded_file.name) != "csv":
+            st.error("Streaming mode reads CSV / TSV files only; load Parquet and Feather files normally.")
+        elif uploaded_file and st.button("▶️ Run Streaming Clean"):
+            # outputs can be several GB: drop the previous one before writing the next
+            previous_output = st.session_state.stream_output
+            if previous_output and os.path.exists(previous_output):
+                os.remove(previous_output)
+            st.session_state.stream_output = None
+            with st.spinner("Cleaning in chunks..."):
+                output_path, logs, rows = clean_csv_in_chunks(
+                    uploaded_file, stream_steps, chunk_rows=int(chunk_rows), **csv_read_options(uploaded_file.name)
+                )
+            st.session_state.stream_output = output_path
+            st.session_state.csv_logs = logs
+
+        if st.session_state.stream_output and os.path.exists(st.session_state.stream_output):
+            stream_output = st.session_state.stream_output
+
+            def read_stream_output():
+                with open(stream_output, "rb") as cleaned_file:
+                    return cleaned_file.read()
+
+            # the file is only read when the button is clicked, not on every rerun
+            st.download_button(
+                label="📥 Download Cleaned CSV",
+                data=read_stream_output,
+                file_name="cleaned_data.csv",
+                mime="text/csv"
+            )
+            with st.expander("🔍 Cleaning Log"):
+                for log in st.session_state.csv_logs:
+                    st.write("- " + log)
+
+    else:
+        compact_mode = st.checkbox(
+            "Compact mode (category / Arrow strings)",
+            help="Stores low-cardinality text columns as category and other text as Arrow-backed strings to cut memory use"
+        )
+        with st.expander("Load Options"):
+            csv_engine = st.selectbox(
+                "CSV parser", CSV_ENGINES,
+                help="pyarrow parses on all cores and is usually several times faster; it reads ISO dates as dates, not text. With column types set, the C parser is used"
+            )
+            usecols_text = st.text_input("Columns to load (comma-separated, empty = all)", "")
+            dtype_text = st.text_input("Column types (e.g. OrgID: str, Amount: float64)", "")
+
+    if not stream_mode and uploaded_file:
+        # Hash the content once per upload, then parse only when the content or a
+        # load option changes; reruns reuse the pipeline and its cleaning steps
+        if st.session_state.get("csv_file_id") != uploaded_file.file_id:
+            st.session_state.csv_file_id = uploaded_file.file_id
+            st.session_state.csv_digest = content_digest(uploaded_file)
+        upload_key = (st.session_state.csv_digest, compact_mode, csv_engine, usecols_text, dtype_text)
+        if st.session_state.csv_upload_key != upload_key:
+            try:
+                loaded_df, load_stats, from_cache = cached_load(
+                    uploaded_file, get_frame_cache(), digest=st.session_state.csv_digest, engine=csv_engine,
+                    usecols=parse_usecols(usecols_text), dtype=parse_dtype_hints(dtype_text) or None
+                )
+            except Exception as e:
+                st.error(f"Could not load {uploaded_file.name}: {e}")
+                st.session_state.csv_pipeline = None
+                st.session_state.csv_upload_key = None
+            else:
+                load_stats = dict(load_stats, from_cache=from_cache)
+                if compact_mode:
+                    # the cached frame is shared with other sessions: compact a shallow copy
+                    loaded_df, compact_msg = compact_frame(loaded_df.copy(deep=False))
+                    st.info(compact_msg)
+                    load_stats["memory_mb"] = loaded_df.memory_usage(deep=True).sum() / 1024 ** 2
+                st.session_state.csv_pipeline = CleaningPipeline(loaded_df)
+                st.session_state.csv_upload_key = upload_key
+                st.session_state.csv_load_stats = load_stats
+        if st.session_state.csv_pipeline is not None:
+            load_stats = st.session_state.csv_load_stats
+            origin = "shared cache, first parsed" if load_stats["from_cache"] else "parsed"
+            st.success(
+                f"Loaded {load_stats['rows']:,} rows × {load_stats['columns']} columns ({origin} "
+                f"in {load_stats['seconds']:.2f}s, {load_stats['memory_mb']:.1f} MB in memory)"
+            )
+            st.write(st.session_state.csv_pipeline.original.head())
+
+    if not stream_mode and st.session_state.csv_pipeline is not None:
+        with st.expander("Select and Apply Operations Step-by-Step"):
+            steps = select_cleaning_steps()
+            profiler = st.selectbox("Profile operations", PROFILERS, help="Capture a cProfile / pyinstrument report for every step")
+            copy_free = st.checkbox(
+                "Copy-free mode (low memory)",
+                help="Copy-on-write instead of copying the frame for every step; consecutive row filters are applied with one combined mask"
+            )
+            workers = st.number_input(
+                "CPU cores", min_value=1, max_value=available_cores(), value=1,
+                help="Split column-wise steps (and name capitalization by rows) across cores; small files always run on one"
+            )
+
+            # Only steps that changed since the last rerun are recomputed
+            pipeline = st.session_state.csv_pipeline
+            pipeline.set_profiler(profiler)
+            pipeline.set_copy_free(copy_free)
+            pipeline.set_workers(workers)
+            pipeline.set_steps(steps)
+            st.session_state.csv_df, st.session_state.csv_logs = pipeline.run()
+            for msg in st.session_state.csv_logs:
                 st.success(msg)
 
         st.subheader("Cleaned Data Preview")
         st.dataframe(st.session_state.csv_df.head())
 
+        if st.button("🔎 Scan for Junk Characters"):
+            junk_columns, junk_codepoints = scan_junk_characters(st.session_state.csv_df)
+            if junk_columns.empty:
+                st.success("No junk characters found")
+            else:
+                st.dataframe(junk_columns)
+                st.dataframe(junk_codepoints)
+
+        export_format = st.selectbox(
+            "Download format", available_formats(),
+            help="Parquet and gzip-compressed CSV are much smaller and faster to write than plain CSV"
+        )
+        # The export is written when the button is clicked and reused until the steps or file change
+        cleaned_df, exports = st.session_state.csv_df, st.session_state.csv_exports
+        data_version = (st.session_state.csv_upload_key, tuple(st.session_state.csv_pipeline.steps))
         st.download_button(
-            label="📥 Download Cleaned CSV",
-            data=st.session_state.csv_df.to_csv(index=False).encode('utf-8'),
-            file_name="cleaned_data.csv",
-            mime="text/csv"
+            label=f"📥 Download Cleaned {export_format}",
+            data=lambda: exports.read(cleaned_df, data_version, export_format),
+            file_name=export_file_name(export_format),
+            mime=EXPORT_FORMATS[export_format][1]
         )
 
         with st.expander("🔍 Cleaning Log"):
-            for log in st.session_state.csv_logs:
-                st.write("- " + log)
+            for msg, metrics in st.session_state.csv_pipeline.step_logs:
+                # steps of a combined batch share the timing shown on the batch's last step
+                st.write("- " + msg + (f" ({metrics['Wall (s)']}s)" if metrics else ""))
+
+            step_metrics = st.session_state.csv_pipeline.metrics
+            if step_metrics:
+                st.dataframe(pd.DataFrame(step_metrics).drop(columns="Profile", errors="ignore"))
+                st.download_button(
+                    label="📥 Download Step Metrics (JSON)",
+                    data=json.dumps(step_metrics, indent=2),
+                    file_name="cleaning_metrics.json",
+                    mime="application/json"
+                )
+                for metrics in step_metrics:
+                    if "Profile" in metrics:
+                        st.caption(f"Profile: {metrics['Step']}")
+                        st.code(metrics["Profile"], language="text")
 
 with TAB2:
     st.subheader("🆎 Text Processing Tools")
@@ -125,11 +350,12 @@ with TAB2:
     # ✍ TEXT CLEANUP
     with st.expander("✍ Text Cleanup"):
 
+        title_stop_words = st.text_input("Smart Title: words kept lowercase", ", ".join(sorted(TEXT_STOP_WORDS)))
         col1, col2, col3, col4 = st.columns(4)
     
         with col1:
             if st.button("🧠 Convert to Smart Title", help="Input: Sentence with inconsistent Capitalization || Output: Text will be in Title format"):
-                result = smart_title_text(text_input)
+                result = smart_title_text(text_input, parse_stop_words(title_stop_words))
                 st.code(result)
                 
         with col2:
@@ -141,32 +367,118 @@ with TAB2:
                 st.code(cleaned, language="text")
 
     with st.expander("📊 ID Utilities"):
-    
+
+        # files and CSV columns are read piece by piece, so millions of IDs never pass through the text box
+        id_source = st.radio("Read IDs from", ID_SOURCES, horizontal=True)
+        id_file = id_column = None
+        if id_source == ID_SOURCES[1]:
+            id_file = st.file_uploader("Upload an ID list (TXT / CSV)", type=["txt", "csv"], key="id_file")
+        elif id_source == ID_SOURCES[2]:
+            if st.session_state.get("csv_df") is None:
+                st.info("Load a CSV in the CSV Cleaning tab first.")
+            else:
+                id_column = st.selectbox("ID column", list(st.session_state.csv_df.columns))
+        if "id_tools_dir" not in st.session_state:
+            st.session_state.id_tools_dir = tempfile.mkdtemp(prefix="csv-cleaner-ids-")
+
+        def id_pieces(separators):
+            if id_file is not None:
+                return iter_file_pieces(id_file, separators)
+            if id_column is not None:
+                return iter_column_pieces(st.session_state.csv_df[id_column])
+            return []
+
+        use_text_box = id_source == ID_SOURCES[0]
         col5, col6, col7, col8 = st.columns(4)
                 
     
         with col5:
-            if st.button("🔍 Count IDs", help="Input: 8 digit Id's OR numbers || Output: count of first 8 digit of numeric text || Tip: useful in counting OrgId's in a input text"):
-                count_df = count_ids(text_input)
-                st.dataframe(count_df)
+            count_clicked = st.button("🔍 Count IDs", help="Input: 8 digit Id's OR numbers || Output: count of every standalone 8 digit number (not digits inside longer numbers) || Tip: useful in counting OrgId's in a input text")
     
         with col6:
-            if st.button("🧬 Find Duplicates & Unique Values", help="Input: 8 digit Id's OR numbers || Output: saparate duplicate and unique first 8 digit number/OrgId || Tip: useful in find duplicate OrgId's in a input text"):
-                dupes, uniques = find_duplicates_and_uniques(text_input)
-                st.write(f"**Duplicates:** {dupes}")
-                st.write(f"**Unique Values:** {uniques}")
+            dupes_clicked = st.button("🧬 Find Duplicates & Unique Values", help="Input: 8 digit Id's OR numbers || Output: saparate duplicate and unique first 8 digit number/OrgId || Tip: useful in find duplicate OrgId's in a input text")
                 
     
         with col7:
-            if st.button("➡️ Comma → Lines", help="Input: 8 Digit OrgId's/Numbers in a comma separated format || Output: 8 digit Id's/numbers in separate lines || Tip: useful in quickly converting the format"):
+            to_lines_clicked = st.button("➡️ Comma → Lines", help="Input: 8 Digit OrgId's/Numbers in a comma separated format || Output: 8 digit Id's/numbers in separate lines || Tip: useful in quickly converting the format")
+            if to_lines_clicked and use_text_box:
                 result = ids_to_lines(text_input)
                 st.text_area("Converted to Line Format:", result, height=150, key="to_lines")
     
         with col8:
-            if st.button("➡️ Lines → Comma", help="Input: 8 Digit OrgId's/Numbers in a new-line separated format || Output: 8 digit Id's/numbers in a comma separated format || Tip: useful in quickly converting the format"):
+            to_csv_clicked = st.button("➡️ Lines → Comma", help="Input: 8 Digit OrgId's/Numbers in a new-line separated format || Output: 8 digit Id's/numbers in a comma separated format || Tip: useful in quickly converting the format")
+            if to_csv_clicked and use_text_box:
                 result = ids_to_csv(text_input)
                 st.text_area("Converted to CSV Format:", result, height=150, key="to_csv")
 
+        # full-width results below the buttons
+        if count_clicked:
+            counts = count_ids(text_input) if use_text_box else count_ids_in(id_pieces(COUNT_SEPARATORS))
+            show_count_table(counts, "IDs", "id_counts.csv")
+        if dupes_clicked:
+            if use_text_box:
+                dupes, uniques = find_duplicates_and_uniques(text_input)
+            else:
+                dupes, uniques = find_duplicates_and_uniques_in(id_pieces(COUNT_SEPARATORS))
+            show_count_table(dupes, "Duplicates", "duplicates.csv")
+            show_count_table(uniques, "Unique Values", "unique_values.csv")
+        if to_lines_clicked and not use_text_box:
+            path, count = convert_ids(id_pieces(CONVERT_SEPARATORS), "\n",
+                                      os.path.join(st.session_state.id_tools_dir, "ids_lines.txt"))
+            show_converted_ids(path, count, "IDs as Lines", "ids_lines.txt")
+        if to_csv_clicked and not use_text_box:
+            path, count = convert_ids(id_pieces(CONVERT_SEPARATORS), ",",
+                                      os.path.join(st.session_state.id_tools_dir, "ids.csv"))
+            show_converted_ids(path, count, "IDs as CSV", "ids.csv")
+
+    with st.expander("🆚 Compare Two ID Lists"):
+        st.caption("New vs old, found vs expected: numeric IDs (6–15 digits) from a pasted list or an uploaded TXT / CSV file on each side.")
+        left_col, right_col = st.columns(2)
+        with left_col:
+            left_text = st.text_area("Left list", height=120, key="compare_left_text")
+            left_file = st.file_uploader("…or upload the left list", type=["txt", "csv"], key="compare_left_file")
+        with right_col:
+            right_text = st.text_area("Right list", height=120, key="compare_right_text")
+            right_file = st.file_uploader("…or upload the right list", type=["txt", "csv"], key="compare_right_file")
+
+        if st.button("🆚 Compare Lists"):
+            # an uploaded file wins over the text box on its side
+            left_keys = id_keys_in(iter_file_pieces(left_file) if left_file else [left_text])
+            right_keys = id_keys_in(iter_file_pieces(right_file) if right_file else [right_text])
+            st.session_state.id_comparison = IdComparison(left_keys, right_keys)
+
+        comparison = st.session_state.get("id_comparison")
+        if comparison is not None:
+            st.dataframe(comparison.summary(), hide_index=True)
+            table_name = st.selectbox("Show", IdComparison.TABLES)
+            show_count_table(comparison.table(table_name), table_name,
+                             table_name.lower().replace(" ", "_") + ".csv")
+
+    with st.expander("🔗 Near-Duplicate Names"):
+        st.caption("Groups spellings of the same name or institution, e.g. \"Univ. of Oxford\" and \"University of Oxford\".")
+        name_source = st.radio("Read names from", NAME_SOURCES, horizontal=True)
+        name_column = None
+        if name_source == NAME_SOURCES[1]:
+            if st.session_state.get("csv_df") is None:
+                st.info("Load a CSV in the CSV Cleaning tab first.")
+            else:
+                name_column = st.selectbox("Name column", list(st.session_state.csv_df.columns))
+        threshold = st.slider("Minimum similarity", 0.3, 1.0, DEFAULT_THRESHOLD, 0.05,
+                              help="Estimated overlap of 3-letter sequences after normalizing case, punctuation and common abbreviations")
+
+        if st.button("🔗 Find Near-Duplicates"):
+            if name_column is not None:
+                names = st.session_state.csv_df[name_column]
+            else:
+                names = text_input.splitlines() if name_source == NAME_SOURCES[0] else []
+            st.session_state.near_duplicates = find_near_duplicates(names, threshold)
+
+        clusters = st.session_state.get("near_duplicates")
+        if clusters is not None:
+            st.caption(f"{clusters['Cluster'].max() if len(clusters) else 0:,} clusters; "
+                       "each starts with its most frequent value, and Score is the similarity to it.")
+            show_count_table(clusters, "Near-duplicate values", "near_duplicates.csv")
+
 with TAB3:
     st.header("🖼️ Image to Text (OCR)")
     st.caption(
@@ -174,12 +486,22 @@ with TAB3:
         "Select the correct OCR language for best accuracy."
     )
 
-    uploaded_image = st.file_uploader(
-        "Upload image (PNG / JPG / JPEG)",
-        type=["png", "jpg", "jpeg"]
-    )
+    batch_mode = st.checkbox("Batch mode (many images or a ZIP archive)")
+    if batch_mode:
+        uploaded_images = st.file_uploader(
+            "Upload images (PNG / JPG / JPEG) or ZIP archives",
+            type=["png", "jpg", "jpeg", "zip"],
+            accept_multiple_files=True
+        )
+        uploaded_image = None
+    else:
+        uploaded_image = st.file_uploader(
+            "Upload image (PNG / JPG / JPEG)",
+            type=["png", "jpg", "jpeg"]
+        )
 
-    lang_map = get_tesseract_languages()
+    # the language list is cached for the whole process
+    lang_map = get_tesseract_languages(refresh=st.button("🔄 Refresh OCR languages"))
 
     if not lang_map:
         st.error("No Tesseract languages found. Check Tesseract installation.")
@@ -201,7 +523,27 @@ with TAB3:
                 index=0
             )
 
+        if batch_mode and uploaded_images and st.button(f"▶️ Run Batch OCR ({available_cores()} cores)"):
+            files = list(iter_image_files(uploaded_images))
+            progress = st.progress(0.0, text=f"OCR 0 / {len(files)} images")
+            results = []
+            for result in batch_ocr(files, lang=ocr_lang_code, ocr_mode=ocr_mode, cache=get_ocr_cache()):
+                results.append(result)
+                progress.progress(len(results) / len(files), text=f"OCR {len(results)} / {len(files)} images")
+            st.session_state.ocr_batch_results = results_to_frame(results)
+
+        if batch_mode and st.session_state.get("ocr_batch_results") is not None:
+            st.dataframe(st.session_state.ocr_batch_results)
+            st.download_button(
+                label="📥 Download OCR Results (CSV)",
+                data=st.session_state.ocr_batch_results.to_csv(index=False).encode('utf-8'),
+                file_name="ocr_results.csv",
+                mime="text/csv"
+            )
+
         if uploaded_image:
+            from PIL import Image  # only needed once an image is uploaded
+
             image = Image.open(uploaded_image)
 
             col_img, col_txt = st.columns([1, 1])
@@ -213,12 +555,17 @@ with TAB3:
             with col_txt:
                 st.subheader("Extracted Text")
 
-                with st.spinner("Running OCR..."):
-                    extracted_text = run_ocr_on_image(
+                tiled = image.height > TALL_IMAGE_HEIGHT
+                with st.spinner("Running tiled OCR on tall image..." if tiled else "Running OCR..."):
+                    extracted_text, from_cache = cached_ocr(
                         image,
                         lang=ocr_lang_code,
-                        ocr_mode=ocr_mode
+                        ocr_mode=ocr_mode,
+                        cache=get_ocr_cache(),
+                        tiled=tiled
                     )
+                if from_cache:
+                    st.caption("⚡ Loaded from OCR cache")
 
                 st.session_state.ocr_text = st.text_area(
                     "OCR Output (editable)",
@@ -227,19 +574,3 @@ with TAB3:
                 )
 
             st.info("Tip: If text looks like gibberish, the OCR language is incorrect. ""Select the correct language and re-run.")
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
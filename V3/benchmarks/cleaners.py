@@ -0,0 +1,247 @@
+"""
+Benchmark suite for the cleaner functions.
+
+Times every cleaner on synthetic data at several sizes, records the peak
+resident memory each one adds (measured in a fresh process per case, so Arrow
+buffers count too; Linux only), and writes the results as JSON so runs can be
+compared between versions.
+
+Usage (from V3/):
+  python benchmarks/cleaners.py --sizes 10000 100000 -o bench_new.json
+  python benchmarks/cleaners.py --sizes 10000 100000 --compare bench_old.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cleaner_utils import (  # noqa: E402
+    remove_duplicates,
+    trim_whitespace,
+    capitalize_names,
+    fix_text_case,
+    find_and_replace,
+    convert_numbers,
+    split_column,
+    fused_string_transform,
+    find_duplicates_and_uniques,
+    count_ids,
+    detect_and_clean_junk_characters,
+    HOMOGLYPHS_MAP,
+)
+from fuzzy import find_near_duplicates  # noqa: E402
+from profiling import peak_rss_mb, process_rss_mb, reset_peak_rss  # noqa: E402
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+COUNTRIES = ["United Kingdom", "United States", "Germany", "France", "India", "Japan", "Brazil", "Spain"]
+_LETTERS = np.frombuffer(b"abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)
+_HOMOGLYPHS = [ch for ch in HOMOGLYPHS_MAP if HOMOGLYPHS_MAP[ch].islower()]
+
+
+# === Synthetic data ===
+
+def random_words(rng, n, length):
+    """n random lowercase words of the given length, built as one byte matrix."""
+    codes = rng.choice(_LETTERS, size=(n, length))
+    return codes.view(f"S{length}").ravel().astype(str).astype(object)
+
+
+def make_frame(rows, text_columns=2, str_len=8, dup_ratio=0.1, null_ratio=0.02, homoglyph_density=0.01, seed=0):
+    """
+    Synthetic affiliation-style frame.
+    - "Full Name", "Institution", "Country", "OrgID", "Amount" plus extra text columns
+    - dup_ratio of the rows are copies of other rows
+    - null_ratio of the text cells are missing
+    - homoglyph_density of the text cells carry one Cyrillic look-alike character
+    """
+    rng = np.random.default_rng(seed)
+    unique = max(1, int(rows * (1 - dup_ratio)))
+    data = {
+        "Full Name": " " + random_words(rng, unique, str_len) + " " + random_words(rng, unique, str_len) + " ",
+        "Institution": "university of " + random_words(rng, unique, str_len),
+        "Country": np.array(COUNTRIES, dtype=object)[rng.integers(0, len(COUNTRIES), unique)],
+        "OrgID": rng.integers(10_000_000, 99_999_999, unique).astype(str).astype(object),
+        "Amount": np.round(rng.random(unique) * 1000, 2).astype(str).astype(object),
+    }
+    for i in range(text_columns):
+        data[f"text_{i}"] = random_words(rng, unique, str_len)
+    df = pd.DataFrame(data)
+
+    text_cols = ["Full Name", "Institution"] + [f"text_{i}" for i in range(text_columns)]
+    for col in text_cols:
+        hits = rng.random(unique) < homoglyph_density
+        glyphs = np.array(_HOMOGLYPHS, dtype=object)[rng.integers(0, len(_HOMOGLYPHS), hits.sum())]
+        if hits.any():  # small frames may draw none, and an empty object array cannot join str
+            df.loc[hits, col] = glyphs + df.loc[hits, col].str.slice(1)
+        df.loc[rng.random(unique) < null_ratio, col] = None
+
+    # duplicates: extra rows copied from random existing rows, then shuffled in
+    order = np.concatenate([np.arange(unique), rng.integers(0, unique, rows - unique)])
+    rng.shuffle(order)
+    return df.iloc[order].reset_index(drop=True)
+
+
+# === Benchmarks ===
+
+# the fused case runs the four string cleaners above in one pass
+STRING_STEPS = [
+    ("trim_whitespace", ()),
+    ("capitalize_names", ()),
+    ("fix_text_case", (("mode", "title"),)),
+    ("find_and_replace", (("find_val", "Germany"), ("replace_val", "DE"))),
+]
+
+CASES = {
+    "remove_duplicates": lambda data: remove_duplicates(data["df"].copy()),
+    "trim_whitespace": lambda data: trim_whitespace(data["df"].copy()),
+    "capitalize_names": lambda data: capitalize_names(data["df"].copy()),
+    "fix_text_case": lambda data: fix_text_case(data["df"].copy(), mode="title"),
+    "find_and_replace": lambda data: find_and_replace(data["df"].copy(), "Germany", "DE"),
+    "convert_numbers": lambda data: convert_numbers(data["df"].copy()),
+    "split_column": lambda data: split_column(data["df"].copy(), "Full Name"),
+    "fused_string_transform": lambda data: fused_string_transform(data["df"].copy(), STRING_STEPS),
+    "find_duplicates_and_uniques": lambda data: find_duplicates_and_uniques(data["ids_text"]),
+    "count_ids": lambda data: count_ids(data["ids_text"]),
+    "detect_and_clean_junk_characters": lambda data: detect_and_clean_junk_characters(data["names_text"]),
+    "find_near_duplicates": lambda data: find_near_duplicates(data["df"]["Institution"]),
+}
+
+
+def _time_call(func, data):
+    # the frame copy each case makes is part of every measurement, on purpose:
+    # the app pipeline copies before every step too
+    start = time.perf_counter()
+    func(data)
+    return time.perf_counter() - start
+
+
+def _case_data(rows, **data_kwargs):
+    df = make_frame(rows, **data_kwargs)
+    return {
+        "df": df,
+        "ids_text": "\n".join(df["OrgID"]),
+        "names_text": "\n".join(df["Institution"].fillna("")),
+    }
+
+
+def _measure_peak(name, rows, data_kwargs):
+    """Child side of _peak_memory: MB of resident memory the case adds on top of its input data."""
+    data = _case_data(rows, **data_kwargs)
+    rss_before = process_rss_mb()
+    if rss_before is None or not reset_peak_rss():
+        return None
+    CASES[name](data)
+    return round(peak_rss_mb() - rss_before, 2)
+
+
+def _peak_memory(name, rows, data_kwargs):
+    """
+    Peak extra resident memory of one case in MB, or None where unsupported.
+    Runs in a fresh process: tracemalloc misses Arrow buffers, and in a
+    long-lived process earlier cases leave freed memory that later ones reuse.
+    """
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--measure-peak", name, str(rows),
+                          json.dumps(data_kwargs)], capture_output=True, text=True, check=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def run(sizes, functions=None, repeat=1, track_memory=True, **data_kwargs):
+    results = []
+    for rows in sizes:
+        data = _case_data(rows, **data_kwargs)
+        for name in functions or CASES:
+            seconds = min(_time_call(CASES[name], data) for _ in range(repeat))
+            entry = {"function": name, "rows": rows, "seconds": round(seconds, 4),
+                     "rows_per_sec": round(rows / seconds) if seconds else None}
+            if track_memory:
+                entry["peak_mb"] = _peak_memory(name, rows, data_kwargs)
+            results.append(entry)
+            print(f"{name:<34} {rows:>11,} rows  {seconds:9.4f}s  {entry.get('peak_mb', '-'):>9} MB", flush=True)
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, baseline, threshold=1.25):
+    """Prints new/old time ratios; returns the entries slower than threshold x baseline."""
+    old = {(r["function"], r["rows"]): r for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        before = old.get((r["function"], r["rows"]))
+        if not before or not before["seconds"]:
+            continue
+        ratio = r["seconds"] / before["seconds"]
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{r['function']:<34} {r['rows']:>11,} rows  {before['seconds']:9.4f}s -> {r['seconds']:9.4f}s  x{ratio:.2f}{flag}")
+        if flag:
+            regressions.append(r)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--functions", nargs="+", choices=sorted(CASES), default=None)
+    parser.add_argument("--repeat", type=int, default=1, help="best of N timings")
+    parser.add_argument("--text-columns", type=int, default=2)
+    parser.add_argument("--str-len", type=int, default=8)
+    parser.add_argument("--dup-ratio", type=float, default=0.1)
+    parser.add_argument("--null-ratio", type=float, default=0.02)
+    parser.add_argument("--homoglyph-density", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak-memory pass (one process per case)")
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    # internal: one case's peak memory, run by _peak_memory in a child process
+    parser.add_argument("--measure-peak", nargs=3, metavar=("CASE", "ROWS", "DATA_JSON"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.measure_peak:
+        name, rows, data_json = args.measure_peak
+        print(json.dumps(_measure_peak(name, int(rows), json.loads(data_json))))
+        return 0
+
+    data_kwargs = dict(text_columns=args.text_columns, str_len=args.str_len, dup_ratio=args.dup_ratio,
+                       null_ratio=args.null_ratio, homoglyph_density=args.homoglyph_density, seed=args.seed)
+    results = run(args.sizes, args.functions, args.repeat, not args.no_memory, **data_kwargs)
+    report = {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "data": data_kwargs,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
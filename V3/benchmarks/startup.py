@@ -0,0 +1,75 @@
+"""
+Cold-start timing for cleaner_utils.
+
+Each measurement runs in a fresh interpreter so nothing is cached in-process:
+  - csv_import: `import cleaner_utils` (what every CSV-only session pays)
+  - ocr_first_use: loading OpenCV + pytesseract on the first OCR call
+  - app_first_run: the first run of app.py (all tabs, as a new session sees it)
+    through Streamlit's AppTest, and whether that run imported OpenCV
+
+Usage (from V3/):  python benchmarks/startup.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+V3_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SNIPPET = """
+import time
+start = time.perf_counter()
+import cleaner_utils
+csv_import = time.perf_counter() - start
+start = time.perf_counter()
+cleaner_utils._load_ocr_modules()
+ocr_first_use = time.perf_counter() - start
+print(csv_import, ocr_first_use)
+"""
+
+_APP_SNIPPET = """
+import sys
+import time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file("app.py", default_timeout=120)
+start = time.perf_counter()
+app.run()
+print(time.perf_counter() - start, int("cv2" in sys.modules))
+"""
+
+
+def _run(snippet):
+    return subprocess.run(
+        [sys.executable, "-c", snippet], cwd=V3_DIR, capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+def measure(runs=5):
+    csv_times, ocr_times, app_times, app_opencv = [], [], [], False
+    for _ in range(runs):
+        out = _run(_SNIPPET)
+        csv_times.append(float(out[0]))
+        ocr_times.append(float(out[1]))
+        out = _run(_APP_SNIPPET)
+        app_times.append(float(out[0]))
+        app_opencv = app_opencv or out[1] == "1"
+    csv_ms = statistics.median(csv_times) * 1000
+    ocr_ms = statistics.median(ocr_times) * 1000
+    return {
+        "runs": runs,
+        "csv_import_ms": round(csv_ms, 1),
+        "ocr_first_use_ms": round(ocr_ms, 1),
+        # before lazy loading, the OCR imports were part of every import
+        "eager_import_ms": round(csv_ms + ocr_ms, 1),
+        "saved_for_csv_sessions_pct": round(100 * ocr_ms / (csv_ms + ocr_ms), 1),
+        "app_first_run_ms": round(statistics.median(app_times) * 1000, 1),
+        "app_first_run_imports_opencv": app_opencv,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    print(json.dumps(measure(parser.parse_args().runs), indent=2))
@@ -1,78 +1,214 @@
 import re
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 import unicodedata
 from collections import Counter
 import string
 from collections import defaultdict
 
-#OCR Module#
-import pytesseract
-from PIL import Image
-import cv2
 import numpy as np
 import os
-import pytesseract
-if os.name == "nt":  # Windows only
-    pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+from concurrent.futures import ThreadPoolExecutor
+
+#OCR Module#
+# OpenCV and pytesseract are imported on first OCR use (see _load_ocr_modules),
+# so CSV-only sessions never pay for them.
+_ocr_modules = None
+
+def _load_pytesseract():
+    # pytesseract alone is cheap; the language list needs only this, not OpenCV
+    import pytesseract
+    if os.name == "nt":  # Windows only
+        pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+    return pytesseract
+
+def _load_ocr_modules():
+    global _ocr_modules
+    if _ocr_modules is None:
+        import cv2
+        _ocr_modules = cv2, _load_pytesseract()
+    return _ocr_modules
 
 # === CSV Cleaning Functions ===
 
-def remove_duplicates(df):
+CATEGORY_THRESHOLD = 0.5  # max distinct values / rows for a column to become category
+
+try:
+    import pyarrow  # noqa: F401  (ships with streamlit)
+    ARROW_STRING = pd.StringDtype("pyarrow")
+except ImportError:
+    ARROW_STRING = None
+
+def _text_columns(df, include_category=False):
+    # object in pandas < 3, str / string for StringDtype columns
+    include = ['object', 'string'] + (['category'] if include_category else [])
+    return [
+        col for col in df.select_dtypes(include=include).columns
+        if not isinstance(df[col].dtype, pd.CategoricalDtype)
+        or df[col].cat.categories.inferred_type in ('string', 'empty')
+    ]
+
+def _map_text(values, func):
+    """
+    Applies a vectorized string transform (Series -> Series) to a column.
+    For category columns only the categories are transformed, not every row;
+    categories that become equal are merged.
+    """
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return func(values)
+    new_categories = func(values.cat.categories.to_series(index=None))
+    if new_categories.notna().all() and new_categories.is_unique:
+        return values.cat.rename_categories(new_categories.to_numpy())
+    new_codes, uniques = pd.factorize(new_categories)
+    codes = values.cat.codes.to_numpy()
+    merged = np.where(codes >= 0, new_codes[codes], -1)
+    return pd.Series(pd.Categorical.from_codes(merged, categories=uniques), index=values.index, name=values.name)
+
+def _category_parts(values):
+    """(categories as a Series, row codes, rows per category) of a category column."""
+    codes = values.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+    return pd.Series(values.cat.categories), codes, counts
+
+def _expand_categories(values, codes, converted):
+    """Row values of a category column from its converted categories; missing rows stay missing."""
+    expanded = converted.iloc[np.maximum(codes, 0)].set_axis(values.index).rename(values.name)
+    return expanded.where(codes >= 0)
+
+def compact_frame(df, category_threshold=CATEGORY_THRESHOLD):
+    """Low-cardinality text columns -> category, other text columns -> Arrow-backed strings."""
+    before = df.memory_usage(deep=True).sum()
+    cat_cols, arrow_cols = [], []
+    for col in _text_columns(df):
+        if df[col].nunique() <= category_threshold * len(df):
+            df[col] = df[col].astype('category')
+            cat_cols.append(col)
+        elif ARROW_STRING is not None and df[col].dtype != ARROW_STRING:
+            df[col] = df[col].astype(ARROW_STRING)
+            arrow_cols.append(col)
+    saved_mb = (before - df.memory_usage(deep=True).sum()) / 1024 ** 2
+    return df, (f"Compacted {len(cat_cols)} columns to category and {len(arrow_cols)} to Arrow strings; "
+                f"saved {saved_mb:.2f} MB")
+
+def _duplicates_message(removed):
+    return f"Removed {removed} duplicate rows" if removed else "No duplicates found"
+
+def _blank_rows_message(removed):
+    return f"Removed {removed} completely blank rows"
+
+def remove_duplicates(df, keep='first'):
     before = len(df)
-    df = df.drop_duplicates()
-    return df, f"Removed {before - len(df)} duplicate rows" if before != len(df) else "No duplicates found"
+    df = df.drop_duplicates(keep=keep)
+    return df, _duplicates_message(before - len(df))
 
 def trim_whitespace(df):
-    str_cols = df.select_dtypes(include='object').columns
-    df[str_cols] = df[str_cols].apply(lambda x: x.str.strip())
+    str_cols = _text_columns(df, include_category=True)
+    for col in str_cols:
+        df[col] = _map_text(df[col], lambda x: x.str.strip())
     return df, f"Trimmed whitespace in columns: {', '.join(str_cols)}"
 
-def capitalize_names(df):
+def _name_column(df):
     name_col = [col for col in df.columns if 'name' in col.lower()]
-    if name_col:
-        col_name = name_col[0]
-        exceptions = ['and', 'of', 'the', 'a', 'an', 'in']
-        def smart_title(text):
-            words = str(text).lower().split()
-            return ' '.join([words[0].capitalize()] + [w if w in exceptions else w.capitalize() for w in words[1:]]) if words else text
-        df[col_name] = df[col_name].astype(str).apply(smart_title)
+    return name_col[0] if name_col else None
+
+def capitalize_names(df, stop_words=None):
+    col_name = _name_column(df)
+    if col_name is not None:
+        df[col_name] = smart_title_values(df[col_name], NAME_STOP_WORDS if stop_words is None else stop_words)
         return df, f"Capitalized names in column: {col_name}"
     return df, "No 'name' column found for capitalization"
 
 def drop_blank_rows(df):
     before = len(df)
     df = df.dropna(how='all')
-    return df, f"Removed {before - len(df)} completely blank rows"
+    return df, _blank_rows_message(before - len(df))
+
+# Row filters as (keep-mask function, message function), so several filters can
+# be combined into one boolean mask and applied with a single row selection.
+ROW_FILTERS = {
+    'remove_duplicates': (lambda df, keep='first': ~df.duplicated(keep=keep), _duplicates_message),
+    'drop_blank_rows': (lambda df: df.notna().any(axis=1), _blank_rows_message),
+}
+
+def apply_row_filters(df, filter_steps):
+    """
+    Applies consecutive (name, params) row filters with one combined mask.
+    Every mask is computed on the same input frame; this gives the same rows and
+    counts as running the filters one after another because duplicate and
+    blank-row checks do not depend on which other rows were removed first.
+    That no longer holds for two duplicate passes with different `keep`, so a
+    batch may contain at most one remove_duplicates.
+    Returns (df, [message per step]).
+    """
+    if sum(name == 'remove_duplicates' for name, _ in filter_steps) > 1:
+        raise ValueError("apply_row_filters takes at most one remove_duplicates step")
+    keep = np.ones(len(df), dtype=bool)
+    msgs = []
+    for name, params in filter_steps:
+        mask_func, message = ROW_FILTERS[name]
+        mask = np.asarray(mask_func(df, **dict(params)), dtype=bool)
+        msgs.append(message(int((keep & ~mask).sum())))
+        keep &= mask
+    return (df if keep.all() else df[keep]), msgs
 
 def fill_missing_values(df, fill_value="Missing"):
     missing_before = df.isnull().sum().sum()
-    df = df.fillna(fill_value)
+    for col in df.columns[df.isnull().any()]:
+        try:
+            df[col] = df[col].fillna(fill_value)
+        except TypeError:
+            # category / nullable columns cannot hold the fill value as-is
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].cat.add_categories([fill_value]).fillna(fill_value)
+            else:
+                df[col] = df[col].astype(object).fillna(fill_value)
     missing_after = df.isnull().sum().sum()
     return df, f"Filled {missing_before - missing_after} missing values with '{fill_value}'"
 
-def fix_text_case(df, mode='title'):
-    str_cols = df.select_dtypes(include='object').columns
+def _case_transform(mode):
     if mode == 'lower':
-        df[str_cols] = df[str_cols].apply(lambda x: x.str.lower())
+        return lambda x: x.str.lower()
     elif mode == 'upper':
-        df[str_cols] = df[str_cols].apply(lambda x: x.str.upper())
-    else:
-        df[str_cols] = df[str_cols].apply(lambda x: x.str.title())
+        return lambda x: x.str.upper()
+    return lambda x: x.str.title()
+
+def fix_text_case(df, mode='title'):
+    str_cols = _text_columns(df, include_category=True)
+    transform = _case_transform(mode)
+    for col in str_cols:
+        df[col] = _map_text(df[col], transform)
     return df, f"Formatted text case as '{mode}' in: {', '.join(str_cols)}"
 
 def find_and_replace(df, find_val, replace_val):
-    df = df.replace(find_val, replace_val)
+    cat_cols = [col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)]
+    for col in cat_cols:
+        df[col] = _map_text(df[col], lambda x: x.replace(find_val, replace_val))
+    if cat_cols:
+        other_cols = [col for col in df.columns if col not in cat_cols]
+        df[other_cols] = df[other_cols].replace(find_val, replace_val)
+    else:
+        df = df.replace(find_val, replace_val)
     return df, f"Replaced '{find_val}' with '{replace_val}'"
 
-def convert_numbers(df):
+def convert_numbers(df, sample_size=1000):
     converted_cols = []
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            try:
-                df[col] = pd.to_numeric(df[col], errors='raise')
-                converted_cols.append(col)
-            except:
+    for col in _text_columns(df, include_category=True):
+        values, codes, counts = df[col], None, None
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # parse each category once instead of every row
+            values, codes, counts = _category_parts(values)
+            if values.empty:
                 continue
+        # a cheap sample rejects most text columns before the full parse
+        sample = _sample(values, sample_size)
+        if _unparsed(sample, pd.to_numeric(sample, errors='coerce')).any():
+            continue
+        numeric = pd.to_numeric(values, errors='coerce')
+        failed = _unparsed(values, numeric)
+        if (failed if counts is None else counts[failed]).any():
+            continue
+        df[col] = numeric if codes is None else _expand_categories(df[col], codes, numeric)
+        converted_cols.append(col)
     return df, f"Converted columns to numeric: {', '.join(converted_cols)}" if converted_cols else "No numeric conversions applied"
 
 def split_column(df, col, delimiter=' ', into_two=True):
@@ -80,7 +216,8 @@ def split_column(df, col, delimiter=' ', into_two=True):
         return df, f"Column '{col}' not found for splitting"
     if into_two:
         try:
-            new_cols = df[col].str.split(pat=delimiter, n=1, expand=True)
+            # reindex so a frame (or chunk) with no delimiter still yields both parts
+            new_cols = df[col].str.split(pat=delimiter, n=1, expand=True).reindex(columns=[0, 1])
             df[f"{col}_1"], df[f"{col}_2"] = new_cols[0], new_cols[1]
             return df, f"Split '{col}' into '{col}_1' and '{col}_2'"
         except Exception as e:
@@ -88,54 +225,316 @@ def split_column(df, col, delimiter=' ', into_two=True):
     return df, "Split skipped"
 
 
+# === Fused String Transforms ===
+
+FUSIBLE_STRING_OPS = {'trim_whitespace', 'fix_text_case', 'find_and_replace', 'capitalize_names'}
+
+def can_fuse_string_step(df, name, params):
+    """
+    Whether a step can join a fused pass: it must only rewrite existing text
+    columns value by value, so the text column set stays the same across the batch.
+    """
+    if name not in FUSIBLE_STRING_OPS:
+        return False
+    if name == 'find_and_replace':
+        # a string can only match values of text columns
+        return isinstance(dict(params).get('find_val'), str)
+    if name == 'capitalize_names':
+        col_name = _name_column(df)
+        return col_name is None or col_name in _text_columns(df, include_category=True)
+    return True
+
+def _per_unique(values, func, max_unique_ratio=0.5):
+    """
+    Runs an elementwise Series transform once per distinct value and maps the
+    results back; mostly-distinct columns are transformed directly instead.
+    Missing values are kept as their own value, so they go through func too.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    if len(uniques) > max_unique_ratio * len(values):
+        return func(values)
+    result = func(pd.Series(uniques, name=values.name, dtype=values.dtype))
+    return pd.Series(result.array.take(codes), index=values.index, name=values.name, dtype=result.dtype)
+
+def fused_string_transform(df, steps):
+    """
+    Applies consecutive trim / case / find-and-replace / capitalize steps in
+    one pass per column instead of one full pass per step.
+    - Each column's transforms are chained and run per distinct value
+      (categories for category columns)
+    - Gives the same frame and messages as running the steps one by one;
+      check steps with can_fuse_string_step first
+    Returns (df, [message per step]).
+    """
+    text_cols = _text_columns(df, include_category=True)
+    chains = {col: [] for col in text_cols}
+    msgs = []
+    for name, params in steps:
+        params = dict(params)
+        if name == 'trim_whitespace':
+            for col in text_cols:
+                chains[col].append(lambda x: x.str.strip())
+            msgs.append(f"Trimmed whitespace in columns: {', '.join(text_cols)}")
+        elif name == 'fix_text_case':
+            mode = params.get('mode', 'title')
+            for col in text_cols:
+                chains[col].append(_case_transform(mode))
+            msgs.append(f"Formatted text case as '{mode}' in: {', '.join(text_cols)}")
+        elif name == 'find_and_replace':
+            find_val, replace_val = params['find_val'], params['replace_val']
+            for col in text_cols:
+                chains[col].append(lambda x, f=find_val, r=replace_val: x.replace(f, r))
+            msgs.append(f"Replaced '{find_val}' with '{replace_val}'")
+        elif name == 'capitalize_names':
+            col_name = _name_column(df)
+            if col_name is None:
+                msgs.append("No 'name' column found for capitalization")
+                continue
+            stop_words = params.get('stop_words')
+            stop_words = NAME_STOP_WORDS if stop_words is None else stop_words
+            chains[col_name].append(lambda x, s=stop_words: smart_title_values(x, s))
+            msgs.append(f"Capitalized names in column: {col_name}")
+        else:
+            raise ValueError(f"Cannot fuse operation: {name}")
+
+    for col, chain in chains.items():
+        if not chain:
+            continue
+        def run_chain(values, chain=chain):
+            for transform in chain:
+                values = transform(values)
+            return values
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = _map_text(df[col], run_chain)
+        else:
+            df[col] = _per_unique(df[col], run_chain)
+    return df, msgs
+
+
+# === Type Inference ===
+
+BOOLEAN_VALUES = {'true': True, 'false': False, 'yes': True, 'no': False}
+
+def _unparsed(values, parsed):
+    """Mask of values that did not parse; empty or whitespace-only strings become missing, not failures."""
+    failed = np.array(parsed.isna() & values.notna(), dtype=bool)
+    if failed.any():
+        failed[failed] = values[failed].astype(str).str.strip().ne('').to_numpy()
+    return failed
+
+def _sample(values, sample_size):
+    """Evenly spaced sample of the non-null values, so bad rows at the end are still seen."""
+    values = values.dropna()
+    if len(values) <= sample_size:
+        return values
+    return values.iloc[np.linspace(0, len(values) - 1, sample_size).astype(int)]
+
+def _compact_numeric(numeric):
+    """Smallest dtype that holds the values exactly (nullable Int* when NaNs are present)."""
+    non_null = numeric.dropna()
+    if len(non_null) and (non_null % 1 == 0).all():
+        if numeric.isna().any():
+            for dtype in ('Int8', 'Int16', 'Int32', 'Int64'):
+                info = np.iinfo(dtype.lower())
+                if info.min <= non_null.min() and non_null.max() <= info.max:
+                    return numeric.astype(dtype)
+        return pd.to_numeric(numeric, downcast='integer')
+    as_float32 = numeric.astype('float32')
+    if ((as_float32.astype('float64') == numeric) | numeric.isna()).all():
+        return as_float32
+    return numeric
+
+def _infer_series(values, sample_size, max_failure_ratio, counts=None):
+    """
+    Returns (converted series or None, failed count) for one text column.
+    With counts, values are distinct values (categories) and counts the rows holding
+    each, so failures are still counted in rows.
+    """
+    sample = _sample(values, sample_size)
+    if sample.empty:
+        return None, 0
+    def rows(mask):
+        return int(np.sum(mask if counts is None else counts[mask]))
+    allowed_failures = int(rows(values.notna().to_numpy()) * max_failure_ratio)
+    sample_weights = np.ones(len(sample)) if counts is None else counts[sample.index.to_numpy()]
+    def sample_passes(parsed):
+        failed = _unparsed(sample, parsed)
+        return parsed.notna().any() and sample_weights[failed].sum() <= max_failure_ratio * sample_weights.sum()
+
+    sample_text = sample.astype(str).str.strip().str.lower()
+    if sample_passes(sample_text.map(BOOLEAN_VALUES)):
+        converted = values.astype(str).str.strip().str.lower().map(BOOLEAN_VALUES).astype('boolean')
+        failed = rows(_unparsed(values, converted))
+        return (converted, failed) if failed <= allowed_failures else (None, failed)
+
+    if sample_passes(pd.to_numeric(sample, errors='coerce')):
+        numeric = pd.to_numeric(values, errors='coerce')
+        failed = rows(_unparsed(values, numeric))
+        return (_compact_numeric(numeric), failed) if failed <= allowed_failures else (None, failed)
+
+    date_format = guess_datetime_format(str(sample.iloc[0]))
+    if date_format and sample_passes(pd.to_datetime(sample, format=date_format, errors='coerce')):
+        dates = pd.to_datetime(values, format=date_format, errors='coerce')
+        failed = rows(_unparsed(values, dates))
+        return (dates, failed) if failed <= allowed_failures else (None, failed)
+
+    return None, 0
+
+def infer_column_types(df, sample_size=1000, max_failure_ratio=0.0, category_threshold=CATEGORY_THRESHOLD):
+    """
+    Samples every text column and fully converts only the columns that pass.
+    - Tries boolean, then numeric (downcast / nullable Int*), then datetime
+    - Remaining text columns with few distinct values become category
+    - Category columns are inferred from their categories, not every row
+    - Values that fail conversion become missing; columns with more than
+      max_failure_ratio failures are left untouched
+    Returns the converted frame and a per-column report.
+    """
+    report = []
+    for col in _text_columns(df, include_category=True):
+        before = df[col].memory_usage(deep=True, index=False)
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            categories, codes, counts = _category_parts(df[col])
+            converted, failed = _infer_series(categories, sample_size, max_failure_ratio, counts)
+            if converted is not None:
+                converted = _expand_categories(df[col], codes, converted)
+                if pd.api.types.is_numeric_dtype(converted) and not pd.api.types.is_bool_dtype(converted):
+                    # missing rows can turn int8 categories into float64
+                    converted = _compact_numeric(converted)
+        else:
+            converted, failed = _infer_series(df[col], sample_size, max_failure_ratio)
+            if converted is None and 0 < df[col].nunique() <= category_threshold * len(df):
+                converted = df[col].astype('category')
+        if converted is None:
+            continue
+        df[col] = converted
+        after = df[col].memory_usage(deep=True, index=False)
+        report.append({'Column': col, 'Type': str(df[col].dtype), 'Failed': failed, 'Bytes Saved': before - after})
+    return df, pd.DataFrame(report, columns=['Column', 'Type', 'Failed', 'Bytes Saved'])
+
+def _infer_types_message(report):
+    if report.empty:
+        return "No type conversions applied"
+    details = ', '.join(f"{r.Column} → {r.Type} ({r.Failed} failed)" for r in report.itertuples())
+    saved_mb = report['Bytes Saved'].sum() / 1024 ** 2
+    return f"Inferred types: {details}; saved {saved_mb:.2f} MB"
+
+def infer_types(df, sample_size=1000, max_failure_ratio=0.0, category_threshold=CATEGORY_THRESHOLD):
+    df, report = infer_column_types(df, sample_size, max_failure_ratio, category_threshold)
+    return df, _infer_types_message(report)
+
+
 # === Text Utility Functions ===
 
-def smart_title_text(text):
-    exceptions = ['and', 'of', 'the', 'a', 'an', 'in', 'is']
+NAME_STOP_WORDS = frozenset(['and', 'of', 'the', 'a', 'an', 'in'])
+TEXT_STOP_WORDS = NAME_STOP_WORDS | {'is'}
+
+def parse_stop_words(text):
+    """'and, of, the' -> frozenset of lowercase stop words."""
+    return frozenset(w.strip().lower() for w in re.split(r'[,\s]+', text or '') if w.strip())
+
+def smart_title(text, stop_words=NAME_STOP_WORDS):
     words = str(text).lower().split()
     return ' '.join(
-        [words[0].capitalize()] + [w if w in exceptions else w.capitalize() for w in words[1:]]
+        [words[0].capitalize()] + [w if w in stop_words else w.capitalize() for w in words[1:]]
     ) if words else text
 
+def smart_title_values(values, stop_words=NAME_STOP_WORDS):
+    """Title-cases a Series once per distinct value (factorize) and maps the results back."""
+    stop_words = frozenset(stop_words)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return _map_text(values, lambda cats: smart_title_values(cats, stop_words))
+    codes, uniques = pd.factorize(values)
+    titled = pd.Index([smart_title(v, stop_words) for v in uniques], dtype=object)
+    result = pd.Series(titled.take(codes, allow_fill=True, fill_value=np.nan), index=values.index, name=values.name)
+    return result.astype(values.dtype) if isinstance(values.dtype, pd.StringDtype) else result
+
+def smart_title_text(text, stop_words=TEXT_STOP_WORDS):
+    lines = str(text).splitlines()
+    if len(lines) <= 1:
+        return smart_title(text, stop_words)
+    # repeated lines in large pastes are only title-cased once
+    return '\n'.join(smart_title_values(pd.Series(lines, dtype=object), stop_words))
+
+# Numeric IDs of 6–15 digits (OrgID, AffilID, GroupID) and exactly 8 digits (OrgID);
+# \b keeps both from matching inside longer numbers
+NUMERIC_ID_PATTERN = re.compile(r'\b\d{6,15}\b')
+ORG_ID_PATTERN = re.compile(r'\b\d{8}\b')
+TEXT_VALUE_SEPARATORS = re.compile(r'[\n,\t]+')
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# IDs are counted as int64 keys: digit count * 10**15 + value, so IDs that differ
+# only in leading zeros stay apart and can be printed back as written
+_ID_LENGTH_UNIT = 10 ** 15
+ID_SLICE_CHARS = 4 * 1024 * 1024
+_NON_WORD = re.compile(r'\W')
+
+def _id_keys(ids):
+    count = len(ids)
+    lengths = np.fromiter(map(len, ids), dtype=np.int64, count=count)
+    return lengths * _ID_LENGTH_UNIT + np.fromiter(map(int, ids), dtype=np.int64, count=count)
+
+def _text_slices(text, size=ID_SLICE_CHARS):
+    # cut only before a non-word character, so \b matches exactly as in the whole text
+    start = 0
+    while start < len(text):
+        cut = _NON_WORD.search(text, start + size) if start + size < len(text) else None
+        end = cut.start() if cut else len(text)
+        yield text[start:end]
+        start = end
+
+def numeric_id_keys(text, pattern=NUMERIC_ID_PATTERN):
+    """
+    int64 keys of every ID matching pattern, in input order.
+    The text is scanned slice by slice, so only one slice's ID strings exist at a time.
+    """
+    batches = [_id_keys(pattern.findall(part)) for part in _text_slices(text)]
+    return np.concatenate(batches) if batches else np.empty(0, dtype=np.int64)
+
+def id_key_strings(keys):
+    """ID strings (leading zeros restored) for int64 keys from numeric_id_keys."""
+    lengths, values = np.divmod(np.asarray(keys, dtype=np.int64), _ID_LENGTH_UNIT)
+    ids = np.array([str(v) for v in values.tolist()], dtype=object)
+    digits = np.fromiter(map(len, ids), dtype=np.int64, count=len(ids))
+    for i in np.flatnonzero(digits < lengths):
+        ids[i] = ids[i].zfill(int(lengths[i]))
+    return ids
+
+def count_id_keys(keys, column='ID'):
+    """Count table of int64 ID keys in first-appearance order (hash factorize + bincount)."""
+    codes, unique = pd.factorize(keys)
+    return pd.DataFrame({column: id_key_strings(unique), 'Count': np.bincount(codes, minlength=len(unique))})
+
+def clean_text_values(text):
+    """Comma / newline / tab separated values, lowercased and without punctuation."""
+    return [part.strip().lower().translate(_PUNCTUATION_TABLE) for part in TEXT_VALUE_SEPARATORS.split(text) if part.strip()]
+
+def count_values(text):
+    """
+    Counts values (IDs or text) from mixed input, in first-appearance order.
+    - Numeric IDs of 6–15 digits when the input has any
+    - Otherwise text values (names, institutions, etc.), case-insensitive
+      and punctuation-tolerant
+    Returns a DataFrame with 'Value' and 'Count' columns.
+    """
+    keys = numeric_id_keys(text) if text else np.empty(0, dtype=np.int64)
+    if len(keys):
+        return count_id_keys(keys, column='Value')
+    counts = Counter(clean_text_values(text or ''))
+    return pd.DataFrame(list(counts.items()), columns=['Value', 'Count'])
+
 def find_duplicates_and_uniques(text):
     """
     Detects duplicate and unique values (IDs or text) from mixed input.
-    - Supports numeric IDs of 6–15 digits (OrgID, AffilID, GroupID)
-    - Supports text-based values (names, institutions, etc.)
-    - Case-insensitive and punctuation-tolerant
+    Returns (duplicates, uniques) tables of Value / Count (see count_values).
     """
-    if not text:
-        return "No input provided", ""
-
-    # Try extracting numeric IDs (6–15 digits)
-    ids = re.findall(r'\b\d{6,15}\b', text)
-
-    if ids:
-        # Numeric mode
-        count = Counter(ids)
-    else:
-        # Text mode: split on commas, newlines, or tabs
-        parts = re.split(r'[\n,\t]+', text)
-        # Clean text entries
-        clean_parts = [
-            p.strip().lower().translate(str.maketrans('', '', string.punctuation))
-            for p in parts if p.strip()
-        ]
-        count = Counter(clean_parts)
-
-    # Separate duplicates and uniques
-    duplicates = [k for k, v in count.items() if v > 1]
-    uniques = [k for k, v in count.items() if v == 1]
-
-    duplicates_text = ', '.join(duplicates) if duplicates else "No duplicates found"
-    uniques_text = ', '.join(uniques) if uniques else "No unique values found"
-
-    return duplicates_text, uniques_text
+    counts = count_values(text)
+    repeated = counts['Count'] > 1
+    return counts[repeated].reset_index(drop=True), counts[~repeated].reset_index(drop=True)
 
 def count_ids(text):
-    ids = re.findall(r'\d{8}', text)
-    id_count = Counter(ids)
-    return pd.DataFrame(id_count.items(), columns=['ID', 'Count'])
+    """Counts standalone 8-digit IDs; digits inside longer numbers are not IDs."""
+    return count_id_keys(numeric_id_keys(text, ORG_ID_PATTERN))
 
 def ids_to_lines(text):
     ids = [x.strip() for x in text.replace("\n", ",").split(",") if x.strip()]
@@ -182,6 +581,46 @@ ZERO_WIDTH = {
     '\uFEFF',  # zero width no-break space (BOM)
 }
 
+# ASCII control characters are not "normal" text and get highlighted too
+_ASCII_CONTROL = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+def _classify_char(ch):
+    """Returns (highlighted, cleaned) text for a single character."""
+    # quick keep for normal printable ascii & common whitespace/newlines/tabs
+    if 32 <= ord(ch) <= 126 or ch in "\n\r\t":
+        return ch, ch
+
+    # remove zero-width / invisible characters (but highlight in output)
+    if ch in ZERO_WIDTH:
+        return f"[U+{ord(ch):04X}]", ""
+
+    # direct homoglyph mapping (Cyrillic -> Latin, fullwidth -> ASCII)
+    if ch in HOMOGLYPHS_MAP:
+        return f"[{ch}]", HOMOGLYPHS_MAP[ch]
+
+    # try unicode normalization to ascii base (e.g., é -> e); might be multiple chars.
+    # If nothing maps (including unmapped Cyrillic / Greek / fullwidth), the
+    # character is marked as junk and dropped from the cleaned output.
+    normalized = unicodedata.normalize('NFKD', ch)
+    ascii_equiv = normalized.encode('ascii', 'ignore').decode('ascii', errors='ignore')
+    return f"[{ch}]", ascii_equiv
+
+class _CodepointTable(dict):
+    """str.translate table (codepoint -> replacement) that classifies unseen codepoints on first use."""
+
+    def __init__(self, part):
+        super().__init__()
+        self.part = part  # 0 = highlighted, 1 = cleaned
+        for ch in list(ZERO_WIDTH) + list(HOMOGLYPHS_MAP) + [chr(i) for i in range(128)]:
+            self[ord(ch)] = _classify_char(ch)[part]
+
+    def __missing__(self, codepoint):
+        value = self[codepoint] = _classify_char(chr(codepoint))[self.part]
+        return value
+
+_HIGHLIGHT_TABLE = _CodepointTable(0)
+_CLEAN_TABLE = _CodepointTable(1)
+
 def detect_and_clean_junk_characters(text):
     """
     Detects non-standard characters and attempts to replace them with ASCII equivalents.
@@ -189,68 +628,73 @@ def detect_and_clean_junk_characters(text):
       - highlighted_text: original text but junk chars shown in brackets [⋯]
       - cleaned_text: repaired text (replacing junk look-alikes with Latin equivalents where possible)
     Notes: mapping can be expanded (HOMOGLYPHS_MAP) based on observed inputs.
+    Each codepoint is classified once and cached in the translate tables.
     """
     if text is None:
         return "", ""
 
-    highlighted_parts = []
-    cleaned_parts = []
+    # fast path: plain ASCII text has nothing to highlight or replace
+    if text.isascii() and not _ASCII_CONTROL.search(text):
+        return text, text
 
-    for ch in text:
-        # quick keep for normal printable ascii & common whitespace/newlines/tabs
-        if 32 <= ord(ch) <= 126 or ch in "\n\r\t":
-            highlighted_parts.append(ch)
-            cleaned_parts.append(ch)
-            continue
+    return text.translate(_HIGHLIGHT_TABLE), text.translate(_CLEAN_TABLE)
 
-        # remove zero-width / invisible characters (but highlight in output)
-        if ch in ZERO_WIDTH:
-            highlighted_parts.append(f"[U+{ord(ch):04X}]")
-            # do not add anything to cleaned_parts (effectively removed)
-            continue
+# Anything outside printable ASCII + \n\r\t is treated as a junk candidate
+JUNK_CHAR_PATTERN = r'[^\x20-\x7e\n\r\t]'
 
-        # direct homoglyph mapping (Cyrillic -> Latin, fullwidth -> ASCII)
-        if ch in HOMOGLYPHS_MAP:
-            replacement = HOMOGLYPHS_MAP[ch]
-            highlighted_parts.append(f"[{ch}]")
-            cleaned_parts.append(replacement)
-            continue
+def _junk_rows(values):
+    return values.str.contains(JUNK_CHAR_PATTERN, regex=True).fillna(False).astype(bool)
 
-        # try unicode normalization to ascii base (e.g., é -> e)
-        normalized = unicodedata.normalize('NFKD', ch)
-        ascii_equiv = normalized.encode('ascii', 'ignore').decode('ascii', errors='ignore')
-        if ascii_equiv:
-            # ascii_equiv might be multiple chars; pick it
-            highlighted_parts.append(f"[{ch}]")
-            cleaned_parts.append(ascii_equiv)
+def _scan_junk(df):
+    column_rows, codepoint_counts = [], Counter()
+    for col in _text_columns(df, include_category=True):
+        mask = _junk_rows(df[col])
+        if not mask.any():
             continue
+        found = df[col][mask].astype(object).str.findall(JUNK_CHAR_PATTERN).explode().value_counts()
+        codepoint_counts.update(found.to_dict())
+        column_rows.append({'Column': col, 'Values Affected': int(mask.sum()), 'Junk Characters': int(found.sum())})
+    return column_rows, codepoint_counts
 
-        
-        try:
-            name = unicodedata.name(ch)
-            # crude heuristics: if name contains 'CYRILLIC' or 'GREEK' and a latin lookalike exists
-            if 'CYRILLIC' in name or 'GREEK' in name or 'FULLWIDTH' in name:
-                # We already handled many common cases; highlight and skip (remove) if not mappable
-                highlighted_parts.append(f"[{ch}]")
-                # don't append to cleaned_parts if no safe mapping
-                continue
-        except ValueError:
-            # some control chars might not have a name
-            pass
-
-        # If nothing worked: mark as junk and remove in cleaned output
-        highlighted_parts.append(f"[{ch}]")
-        # cleaned_parts -> nothing (drop)
-
-    highlighted_text = ''.join(highlighted_parts)
-    cleaned_text = ''.join(cleaned_parts)
-    return highlighted_text, cleaned_text
-
-def run_ocr_on_image(
-    pil_image,
-    lang="eng",
-    ocr_mode="auto"
-):
+def scan_junk_characters(df):
+    """
+    Counts junk characters per column and per codepoint.
+    Columns that are pure ASCII are ruled out by one vectorized regex check.
+    Returns (column_counts, codepoint_counts) DataFrames.
+    """
+    column_rows, codepoint_counts = _scan_junk(df)
+    codepoints = pd.DataFrame(
+        [(f"U+{ord(ch):04X}", ch, _classify_char(ch)[1], n) for ch, n in codepoint_counts.most_common()],
+        columns=['Codepoint', 'Character', 'Replacement', 'Count'],
+    )
+    return pd.DataFrame(column_rows, columns=['Column', 'Values Affected', 'Junk Characters']), codepoints
+
+def _repair_junk(df):
+    """clean_junk_characters without the message: returns (df, column_rows, codepoint Counter)."""
+    column_rows, codepoint_counts = _scan_junk(df)
+    for row in column_rows:
+        col = row['Column']
+        df[col] = _map_text(df[col], lambda x: x.where(~_junk_rows(x), x.str.translate(_CLEAN_TABLE)))
+    return df, column_rows, codepoint_counts
+
+def _junk_message(column_rows, codepoint_counts):
+    if not column_rows:
+        return "No junk characters found"
+    per_column = ', '.join(f"{row['Column']} ({row['Values Affected']})" for row in column_rows)
+    top = ', '.join(f"U+{ord(ch):04X} ×{n}" for ch, n in codepoint_counts.most_common(5))
+    return f"Repaired junk characters in: {per_column}; most common: {top}"
+
+def clean_junk_characters(df):
+    """Repairs homoglyph / zero-width / accented junk in every text column (same rules as the text tool)."""
+    df, column_rows, codepoint_counts = _repair_junk(df)
+    return df, _junk_message(column_rows, codepoint_counts)
+
+
+OCR_CONFIG = "--psm 6"
+OCR_FAILED_PREFIX = "OCR failed:"
+
+def _preprocess_for_ocr(pil_image, ocr_mode):
+    cv2, _ = _load_ocr_modules()
 
     # Convert PIL → OpenCV
     img = np.array(pil_image)
@@ -269,9 +713,10 @@ def run_ocr_on_image(
             gray, 150, 255, cv2.THRESH_BINARY
         )[1]
 
-    # OCR config
-    config = "--psm 6"
+    return processed
 
+def _tesseract_to_text(processed, lang, config):
+    _, pytesseract = _load_ocr_modules()
     try:
         text = pytesseract.image_to_string(
             processed,
@@ -279,19 +724,113 @@ def run_ocr_on_image(
             config=config
         )
     except pytesseract.TesseractError as e:
-        return f"OCR failed: {e}"
+        return f"{OCR_FAILED_PREFIX} {e}"
 
     return text.strip()
-    
+
+def run_ocr_on_image(
+    pil_image,
+    lang="eng",
+    ocr_mode="auto",
+    config=OCR_CONFIG
+):
+    processed = _preprocess_for_ocr(pil_image, ocr_mode)
+    return _tesseract_to_text(processed, lang, config)
+
+# Screenshots taller than this are OCR'd in horizontal bands
+TALL_IMAGE_HEIGHT = 4000
+
+def find_band_cuts(gray, band_height=2000, search=200):
+    """
+    Picks cut rows roughly every band_height pixels, preferring the emptiest row
+    within +/- search pixels of each target (row-projection profile).
+    Returns (cuts, ink) where cuts starts at 0 and ends at the image height.
+    """
+    height = gray.shape[0]
+    background = np.median(gray)
+    # pixels that differ clearly from the background count as ink (works for dark mode too)
+    ink = (np.abs(gray.astype(np.int16) - background) > 40).sum(axis=1)
+    cuts = [0]
+    while height - cuts[-1] > band_height:
+        target = cuts[-1] + band_height
+        lo, hi = max(cuts[-1] + 1, target - search), min(height - 1, target + search)
+        window = ink[lo:hi + 1]
+        candidates = np.flatnonzero(window == window.min()) + lo
+        cuts.append(int(candidates[np.argmin(np.abs(candidates - target))]))
+    cuts.append(height)
+    return cuts, ink
+
+def _stitch_band_texts(texts, overlapped, max_overlap_lines=5):
+    """
+    Joins band texts. Where a band overlaps the previous one, lines at its
+    start that repeat the end of the previous band are dropped.
+    """
+    lines = []
+    for text, has_overlap in zip(texts, overlapped):
+        band_lines = text.splitlines()
+        overlap = 0
+        search = min(max_overlap_lines, len(lines), len(band_lines)) if has_overlap else 0
+        for n in range(search, 0, -1):
+            if [l.strip() for l in lines[-n:]] == [l.strip() for l in band_lines[:n]]:
+                overlap = n
+                break
+        lines.extend(band_lines[overlap:])
+    return "\n".join(lines).strip()
+
+def run_tiled_ocr_on_image(
+    pil_image,
+    lang="eng",
+    ocr_mode="auto",
+    config=OCR_CONFIG,
+    band_height=2000,
+    overlap=60,
+    max_workers=None
+):
+    """
+    OCR for very tall screenshots.
+    - Preprocesses the full frame once, then cuts it into horizontal bands at
+      whitespace rows where possible
+    - Bands cut through text get `overlap` extra pixels on each side; repeated
+      lines are removed when the band texts are stitched back together
+    - Bands are OCR'd in parallel threads (each Tesseract call is a subprocess)
+    """
+    processed = _preprocess_for_ocr(pil_image, ocr_mode)
+    cuts, ink = find_band_cuts(processed, band_height)
+    if len(cuts) <= 2:
+        return _tesseract_to_text(processed, lang, config)
+
+    bands, overlapped = [], []
+    for top, bottom in zip(cuts[:-1], cuts[1:]):
+        # a cut through ink (no blank row nearby) gets overlapping bands
+        pad_top = overlap if top > 0 and ink[top] > 0 else 0
+        pad_bottom = overlap if bottom < len(ink) and ink[bottom] > 0 else 0
+        bands.append(processed[max(0, top - pad_top):bottom + pad_bottom])
+        overlapped.append(pad_top > 0)
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(len(bands), os.cpu_count() or 1)) as pool:
+        texts = list(pool.map(lambda band: _tesseract_to_text(band, lang, config), bands))
+    failed = [t for t in texts if t.startswith(OCR_FAILED_PREFIX)]
+    return failed[0] if failed else _stitch_band_texts(texts, overlapped)
     
     #for run_ocr_on_image
-def get_tesseract_languages():
+_tesseract_languages = None
+
+def get_tesseract_languages(refresh=False):
+    """
+    Installed Tesseract languages; `tesseract --list-langs` runs once per process
+    unless refresh=True. No Tesseract caches an empty result too.
+    """
+    global _tesseract_languages
+    if _tesseract_languages is not None and not refresh:
+        return _tesseract_languages
     try:
-        langs = pytesseract.get_languages(config="")
+        langs = _load_pytesseract().get_languages(config="")
     except Exception:
-        return {}
+        _tesseract_languages = {}
+        return _tesseract_languages
     language_map = {}
     for code in langs:
         language_map[f"{code}"] = code
 
+    _tesseract_languages = language_map
     return language_map 
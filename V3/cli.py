@@ -0,0 +1,170 @@
+"""
+Command-line batch runner for cleaning pipelines.
+
+Pipeline definition (JSON, or YAML when PyYAML is installed):
+
+    {
+      "steps": [
+        {"op": "trim_whitespace"},
+        {"op": "remove_duplicates", "params": {"keep": "last"}},
+        {"op": "fill_missing_values", "params": {"fill_value": "NA"}}
+      ],
+      "chunk_rows": 200000
+    }
+
+"op" is any name from pipeline.OPERATIONS. With "chunk_rows" (or --chunk-rows)
+CSV / TSV files are cleaned in streaming mode. Inputs may also be .gz / .zip
+compressed, Parquet or Feather. Each input writes <name>_cleaned.csv and
+<name>_cleaned.log to the output directory.
+
+Usage (from V3/):  python cli.py pipeline.json data/*.csv -o cleaned/ --workers 8
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from loader import CSV_ENGINES, load_table, csv_read_options, input_format
+from pipeline import CleaningPipeline, make_step
+from streaming import clean_csv_in_chunks
+
+
+def load_pipeline_definition(path):
+    with open(path, encoding="utf-8") as f:
+        if path.lower().endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("PyYAML is required for YAML pipeline files (pip install pyyaml)")
+            try:
+                definition = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(e) from e
+        else:
+            definition = json.load(f)  # JSONDecodeError is a ValueError
+    if isinstance(definition, list):
+        definition = {"steps": definition}
+    if not isinstance(definition, dict):
+        raise ValueError("expected an object with \"steps\" or a list of steps")
+    return definition
+
+
+def _hashable(value):
+    return tuple(_hashable(v) for v in value) if isinstance(value, list) else value
+
+
+def build_steps(definition):
+    return [
+        make_step(step["op"], **{k: _hashable(v) for k, v in (step.get("params") or {}).items()})
+        for step in definition.get("steps", [])
+    ]
+
+
+def _step_log(name, msg, m):
+    if m is None:
+        return f"{name}: {msg}"
+    # a combined batch is timed as a whole, on its last step
+    timed = "" if m["Step"] == name else f" for {m['Step']}"
+    return f"{name}: {msg} ({m['Wall (s)']}s wall, {m['CPU (s)']}s CPU{timed}, {m['Rows In']} -> {m['Rows Out']} rows)"
+
+
+def clean_file(input_path, steps, output_dir, chunk_rows=None, step_workers=1, csv_engine="c"):
+    """Cleans one CSV and writes the output and log files. Returns a result dict."""
+    name = os.path.basename(input_path)
+    if name.lower().endswith((".gz", ".zip")):
+        name = os.path.splitext(name)[0]
+    stem = os.path.splitext(name)[0]
+    output_path = os.path.join(output_dir, f"{stem}_cleaned.csv")
+    log_path = os.path.join(output_dir, f"{stem}_cleaned.log")
+    start = time.perf_counter()
+    result = {"input": input_path, "output": output_path, "bytes": os.path.getsize(input_path), "rows": 0}
+    try:
+        # Parquet / Feather inputs are not text, so they are always cleaned in memory
+        if chunk_rows and input_format(input_path) == "csv":
+            _, logs, rows = clean_csv_in_chunks(input_path, steps, chunk_rows=chunk_rows, output_path=output_path,
+                                                **csv_read_options(input_path))
+        else:
+            # the batch run never edits steps, so nothing needs each step's own copy of the frame
+            pipeline = CleaningPipeline(load_table(input_path, engine=csv_engine), copy_free=True,
+                                        workers=step_workers)
+            pipeline.set_steps(steps)
+            df, _ = pipeline.run()
+            logs = [_step_log(name, msg, m) for (name, _), (msg, m) in zip(pipeline.steps, pipeline.step_logs)]
+            df.to_csv(output_path, index=False)
+            rows = len(df)
+        result.update(ok=True, rows=rows, error=None)
+    except Exception as e:
+        logs = []
+        result.update(ok=False, error=f"{type(e).__name__}: {e}")
+    result["seconds"] = time.perf_counter() - start
+
+    with open(log_path, "w", encoding="utf-8") as log:
+        for msg in logs:
+            log.write(f"- {msg}\n")
+        if result["ok"]:
+            log.write(f"Cleaned {result['rows']} rows in {result['seconds']:.2f}s\n")
+        else:
+            log.write(f"FAILED: {result['error']}\n")
+    return result
+
+
+def expand_inputs(patterns):
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        paths.extend(matches if matches else [pattern])
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pipeline", help="pipeline definition (.json / .yaml)")
+    parser.add_argument("inputs", nargs="+", help="input files (CSV / TSV, .gz / .zip, Parquet, Feather) or glob patterns")
+    parser.add_argument("-o", "--output-dir", default="cleaned")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-rows", type=int, default=None, help="stream files in chunks of this many rows")
+    parser.add_argument("--engine", choices=CSV_ENGINES, default="c", help="CSV parser (pyarrow is multithreaded)")
+    parser.add_argument("--step-workers", type=int, default=1,
+                        help="cores per file for column-wise steps (use with fewer --workers on a few large files)")
+    args = parser.parse_args(argv)
+
+    try:
+        definition = load_pipeline_definition(args.pipeline)
+        steps = build_steps(definition)
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Invalid pipeline definition: {e}", file=sys.stderr)
+        return 2
+    chunk_rows = args.chunk_rows or definition.get("chunk_rows")
+    inputs = expand_inputs(args.inputs)
+    missing = [path for path in inputs if not os.path.isfile(path)]
+    if missing:
+        print(f"Input files not found: {', '.join(missing)}", file=sys.stderr)
+        return 2
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(inputs)))) as pool:
+        futures = [pool.submit(clean_file, path, steps, args.output_dir, chunk_rows, args.step_workers, args.engine) for path in inputs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            status = "ok" if result["ok"] else f"FAILED ({result['error']})"
+            print(f"{result['input']}: {result['rows']} rows in {result['seconds']:.2f}s {status}")
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if not r["ok"]]
+    rows = sum(r["rows"] for r in results)
+    mb = sum(r["bytes"] for r in results) / 1024 ** 2
+    print(
+        f"{len(results) - len(failed)}/{len(results)} files cleaned in {elapsed:.2f}s - "
+        f"{rows / elapsed:,.0f} rows/sec, {mb / elapsed:.2f} MB/sec"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
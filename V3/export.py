@@ -0,0 +1,118 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+
+import pandas as pd
+
+# Rows handed to the writer at a time, so CSV text is never built for the whole frame
+EXPORT_CHUNK_ROWS = 100_000
+EXCEL_MAX_ROWS = 1_048_575  # one sheet, minus the header row
+
+
+def _write_csv(df, path):
+    df.to_csv(path, index=False, chunksize=EXPORT_CHUNK_ROWS)
+
+
+def _write_csv_gzip(df, path):
+    # level 1 keeps most of the size reduction at a fraction of the time of gzip's default 9
+    df.to_csv(path, index=False, chunksize=EXPORT_CHUNK_ROWS,
+              compression={"method": "gzip", "compresslevel": 1, "mtime": 0})
+
+
+def _arrow_safe(df):
+    # Parquet columns need one type: object columns mixing e.g. str and int are written as text
+    mixed = [col for col in df.columns
+             if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed")]
+    if not mixed:
+        return df
+    df = df.copy(deep=False)
+    for col in mixed:
+        df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+def _write_parquet(df, path):
+    _arrow_safe(df).to_parquet(path, index=False, compression="snappy")
+
+
+def _write_excel(df, path):
+    if len(df) > EXCEL_MAX_ROWS:
+        raise ValueError(f"Excel sheets hold at most {EXCEL_MAX_ROWS:,} rows; this frame has {len(df):,}")
+    df.to_excel(path, index=False)
+
+
+# Format label -> (file extension, MIME type, writer, module the writer needs)
+EXPORT_FORMATS = {
+    "CSV": (".csv", "text/csv", _write_csv, None),
+    "CSV (gzip)": (".csv.gz", "application/gzip", _write_csv_gzip, None),
+    "Parquet": (".parquet", "application/vnd.apache.parquet", _write_parquet, "pyarrow"),
+    "Excel": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", _write_excel, "openpyxl"),
+}
+
+
+def available_formats():
+    """Export formats whose optional writer dependency is installed."""
+    return [fmt for fmt, (_, _, _, module) in EXPORT_FORMATS.items()
+            if module is None or importlib.util.find_spec(module) is not None]
+
+
+def export_file_name(fmt, stem="cleaned_data"):
+    return stem + EXPORT_FORMATS[fmt][0]
+
+
+class ExportCache:
+    """
+    Download files for the current cleaned frame, written to disk on first
+    request and reused until the data version changes.
+    - One file per format; a new version deletes the files of older versions
+    - Files are written under a temporary name and renamed when complete
+    - A directory it created is removed by close() or once the cache is garbage
+      collected (e.g. with the session that held it); in a directory passed in,
+      close() only deletes the export files
+    """
+
+    def __init__(self, directory=None):
+        self._owns_directory = not directory
+        self.directory = directory or tempfile.mkdtemp(prefix="csv-cleaner-export-")
+        self._files = {}  # format -> (version, path)
+        # downloads are generated off the script thread; two clicks must not write one file
+        self._lock = threading.Lock()
+        self._cleanup = None
+        if self._owns_directory:
+            self._cleanup = weakref.finalize(self, shutil.rmtree, self.directory, ignore_errors=True)
+
+    def path(self, df, version, fmt):
+        """Path of the export of `df` (identified by the hashable `version`) in `fmt`."""
+        with self._lock:
+            cached = self._files.get(fmt)
+            if cached and cached[0] == version and os.path.exists(cached[1]):
+                return cached[1]
+            for old_fmt, (old_version, old_path) in list(self._files.items()):
+                if old_version != version or old_fmt == fmt:
+                    del self._files[old_fmt]
+                    if os.path.exists(old_path):
+                        os.remove(old_path)
+            extension, _, writer, _ = EXPORT_FORMATS[fmt]
+            path = os.path.join(self.directory, "export" + extension)
+            # the real extension stays last: writers like to_excel pick their engine from it
+            partial = os.path.join(self.directory, "export.partial" + extension)
+            writer(df, partial)
+            os.replace(partial, path)
+            self._files[fmt] = (version, path)
+            return path
+
+    def read(self, df, version, fmt):
+        with open(self.path(df, version, fmt), "rb") as f:
+            return f.read()
+
+    def close(self):
+        if self._cleanup is not None:
+            self._cleanup()
+        else:
+            for _, path in self._files.values():
+                if os.path.exists(path):
+                    os.remove(path)
+        self._files = {}
@@ -0,0 +1,198 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Abbreviations common in names and institutions, expanded before comparing
+NAME_ABBREVIATIONS = {
+    "univ": "university",
+    "uni": "university",
+    "inst": "institute",
+    "dept": "department",
+    "coll": "college",
+    "hosp": "hospital",
+    "natl": "national",
+    "intl": "international",
+    "ctr": "center",
+    "centre": "center",
+    "lab": "laboratory",
+    "labs": "laboratories",
+    "tech": "technology",
+    "sci": "science",
+    "assoc": "association",
+    "corp": "corporation",
+}
+_ABBREVIATION = re.compile(r"\b(" + "|".join(map(re.escape, NAME_ABBREVIATIONS)) + r")\b")
+
+# Values are compared as sets of character 3-grams of " value "; longer values
+# are compared on their first MAX_SHINGLE_CHARS characters
+MAX_SHINGLE_CHARS = 64
+NUM_PERM = 64
+# 16 bands of 4 rows: pairs from about 0.5 Jaccard up are likely to share a bucket
+BAND_ROWS = 4
+# values sharing a bucket are only paired with their next BUCKET_WINDOW neighbours,
+# so one crowded bucket cannot make the candidate set quadratic
+BUCKET_WINDOW = 8
+DEFAULT_THRESHOLD = 0.6
+
+SIGNATURE_CHUNK_ROWS = 20_000
+SCORE_CHUNK_PAIRS = 1_000_000
+
+
+# === Normalization ===
+
+def normalize_names(values):
+    """Lowercase, '&' -> 'and', punctuation -> space, abbreviations expanded, whitespace collapsed."""
+    text = pd.Series(values).astype(str).str.lower().str.replace("&", " and ", regex=False)
+    text = text.str.replace(r"[\W_]+", " ", regex=True).str.strip()
+    return text.str.replace(_ABBREVIATION, lambda m: NAME_ABBREVIATIONS[m.group(1)], regex=True)
+
+
+# === MinHash signatures ===
+
+def _permutations(num_perm, seed):
+    # multiply-add hashing modulo 2**64; odd multipliers keep every permutation a bijection
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def minhash_signatures(values, num_perm=NUM_PERM, seed=0):
+    """
+    b-bit MinHash signatures (the top 16 bits of each minimum) of the character
+    3-grams of non-empty strings, as an (n, num_perm) uint16 array.
+    - Characters go through NumPy as a fixed-width code-point matrix, so no
+      Python loop runs per 3-gram
+    - Values are processed shortest first in chunks, so a chunk's width follows
+      its own longest value
+    """
+    n = len(values)
+    a, b = _permutations(num_perm, seed)
+    padded = [" " + value[:MAX_SHINGLE_CHARS - 2] + " " for value in values]
+    lengths = np.fromiter(map(len, padded), dtype=np.int64, count=n)
+    signatures = np.empty((n, num_perm), dtype=np.uint16)
+    order = np.argsort(lengths, kind="stable")
+
+    for start in range(0, n, SIGNATURE_CHUNK_ROWS):
+        rows = order[start:start + SIGNATURE_CHUNK_ROWS]
+        width = int(lengths[rows[-1]])
+        chars = np.array([padded[i] for i in rows], dtype=f"<U{width}").view(np.uint32)
+        chars = chars.reshape(len(rows), width).astype(np.uint64)
+        grams = (chars[:, :-2] << np.uint64(42)) | (chars[:, 1:-1] << np.uint64(21)) | chars[:, 2:]
+        # positions past a value's end repeat its first 3-gram, which leaves every minimum unchanged
+        valid = np.arange(width - 2) < (lengths[rows] - 2)[:, None]
+        grams = np.where(valid, grams, grams[:, :1])
+        hashed = np.empty_like(grams)
+        for p in range(num_perm):
+            np.multiply(grams, a[p], out=hashed)
+            hashed += b[p]
+            signatures[rows, p] = hashed.min(axis=1) >> np.uint64(48)
+    return signatures
+
+
+def signature_similarity(signatures, left, right):
+    """Estimated Jaccard similarity of rows left[i] and right[i]: the share of equal signature slots."""
+    scores = np.empty(len(left), dtype=np.float64)
+    for start in range(0, len(left), SCORE_CHUNK_PAIRS):
+        stop = start + SCORE_CHUNK_PAIRS
+        scores[start:stop] = (signatures[left[start:stop]] == signatures[right[start:stop]]).mean(axis=1)
+    return scores
+
+
+# === Blocking and clustering ===
+
+def candidate_pairs(signatures, band_rows=BAND_ROWS, window=BUCKET_WINDOW):
+    """
+    LSH banding: rows whose signatures agree on every slot of some band share
+    a bucket. Within a bucket, each row is paired with its next `window` rows.
+    Returns (left, right) index arrays of distinct pairs with left < right.
+    """
+    n, num_perm = signatures.shape
+    if band_rows > 4:
+        raise ValueError("A band holds at most 4 signature slots (one 64-bit bucket key)")
+    left, right = [], []
+    for start in range(0, num_perm - band_rows + 1, band_rows):
+        key = np.zeros(n, dtype=np.uint64)
+        for slot in range(start, start + band_rows):
+            key = (key << np.uint64(16)) | signatures[:, slot].astype(np.uint64)
+        order = np.argsort(key, kind="stable")
+        sorted_key = key[order]
+        for offset in range(1, min(window, n - 1) + 1):
+            same = sorted_key[offset:] == sorted_key[:-offset]
+            left.append(order[:-offset][same])
+            right.append(order[offset:][same])
+    left = np.concatenate(left) if left else np.empty(0, dtype=np.int64)
+    right = np.concatenate(right) if right else np.empty(0, dtype=np.int64)
+    # sort + adjacent compare: several times faster than np.unique's hash path on int64
+    codes = np.sort(np.minimum(left, right) * n + np.maximum(left, right))
+    codes = codes[np.concatenate((codes[:1] == codes[:1], codes[1:] != codes[:-1]))]
+    return codes // n, codes % n
+
+
+def connected_components(n, left, right):
+    """Component label (its smallest member) of each of n nodes linked by the given edges."""
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[left], labels[right])
+        merged = labels.copy()
+        np.minimum.at(merged, left, low)
+        np.minimum.at(merged, right, low)
+        merged = merged[merged]  # pointer jumping: follow each label to its own label
+        if np.array_equal(merged, labels):
+            return labels
+        labels = merged
+
+
+def find_near_duplicates(values, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, band_rows=BAND_ROWS,
+                         window=BUCKET_WINDOW):
+    """
+    Groups values spelled differently that likely mean the same thing
+    ("Univ. of Oxford" / "University of Oxford").
+    - Values are normalized first (see normalize_names); equal normalized values always group
+    - Distinct normalized values are indexed by MinHash LSH, so only values sharing
+      a bucket are scored, never every pair
+    - Candidate pairs scoring at least `threshold` (estimated 3-gram Jaccard) are
+      linked; clusters are the linked groups
+    Returns a DataFrame of Cluster / Value / Count / Score with one row per distinct
+    value in a cluster of two or more. Clusters are numbered by total count; each
+    starts with its most frequent value, and Score is the similarity to it.
+    """
+    values = pd.Series(values).dropna()
+    codes, originals = pd.factorize(values)
+    counts = np.bincount(codes, minlength=len(originals))
+    norm_codes, normalized = pd.factorize(normalize_names(originals))
+    normalized = list(normalized)
+
+    # values with nothing left after normalization ("...", "-") are never matched
+    matchable = np.flatnonzero([len(value) > 0 for value in normalized])
+    signatures = minhash_signatures([normalized[i] for i in matchable], num_perm)
+    left, right = candidate_pairs(signatures, band_rows, window)
+    linked = signature_similarity(signatures, left, right) >= threshold
+    labels = connected_components(len(normalized), matchable[left[linked]], matchable[right[linked]])
+
+    # from normalized values back to the distinct original values
+    labels = labels[norm_codes]
+    in_cluster = (np.bincount(labels, minlength=len(normalized))[labels] >= 2) & np.isin(norm_codes, matchable)
+    members = np.flatnonzero(in_cluster)
+    if not len(members):
+        return pd.DataFrame({"Cluster": pd.Series(dtype="int64"), "Value": pd.Series(dtype=values.dtype),
+                             "Count": pd.Series(dtype="int64"), "Score": pd.Series(dtype="float64")})
+
+    cluster_totals = np.bincount(labels[members], weights=counts[members])
+    # each cluster by descending total, then its values by descending count (first seen wins ties)
+    members = members[np.lexsort((members, -counts[members], labels[members], -cluster_totals[labels[members]]))]
+    member_labels = labels[members]
+    starts = np.flatnonzero(np.concatenate(([True], member_labels[1:] != member_labels[:-1])))
+    cluster_number = np.repeat(np.arange(1, len(starts) + 1), np.diff(np.append(starts, len(members))))
+    heads = members[starts][cluster_number - 1]
+
+    signature_row = np.full(len(normalized), -1)
+    signature_row[matchable] = np.arange(len(matchable))
+    scores = signature_similarity(signatures, signature_row[norm_codes[members]], signature_row[norm_codes[heads]])
+    return pd.DataFrame({
+        "Cluster": cluster_number,
+        "Value": originals[members],
+        "Count": counts[members],
+        "Score": scores.round(3),
+    })
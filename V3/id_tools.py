@@ -0,0 +1,201 @@
+import codecs
+import os
+import re
+import tempfile
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from cleaner_utils import (
+    NUMERIC_ID_PATTERN,
+    ORG_ID_PATTERN,
+    ID_SLICE_CHARS,
+    numeric_id_keys,
+    count_id_keys,
+    id_key_strings,
+    clean_text_values,
+)
+
+# Pieces of an input are cut only at characters that separate values, so no ID
+# or text value is ever split between two pieces
+COUNT_SEPARATORS = "\n,\t"
+CONVERT_SEPARATORS = "\n,"
+_CONVERT_SPLIT = re.compile(r"[\n,]")
+
+ID_COLUMN_BATCH_ROWS = 200_000
+
+
+# === Input pieces ===
+
+def iter_file_pieces(source, separators=COUNT_SEPARATORS, chunk_chars=ID_SLICE_CHARS, encoding="utf-8-sig"):
+    """Decoded text of a TXT / CSV file (path or binary file-like) in pieces ending before a separator."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield from iter_file_pieces(f, separators, chunk_chars, encoding)
+        return
+    if hasattr(source, "seek"):
+        source.seek(0)
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    pending = ""
+    while True:
+        block = source.read(chunk_chars)
+        if not block:
+            break
+        pending += decoder.decode(block)
+        cut = max(pending.rfind(sep) for sep in separators)
+        if cut > 0:
+            yield pending[:cut]
+            pending = pending[cut:]
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def iter_column_pieces(values, batch_rows=ID_COLUMN_BATCH_ROWS):
+    """A column's non-missing values as newline-joined pieces of batch_rows values."""
+    values = values.dropna()
+    if pd.api.types.is_float_dtype(values) and (values % 1 == 0).all():
+        # IDs in a column with gaps are read as floats: 12345678.0 -> 12345678
+        values = values.astype("Int64")
+    for start in range(0, len(values), batch_rows):
+        yield "\n".join(values.iloc[start:start + batch_rows].astype(str))
+
+
+# === Counting ===
+
+class ValueCounter:
+    """
+    count_values over an input that arrives in pieces.
+    - Numeric IDs are kept as int64 keys and counted once at the end
+    - Text values are only counted until the first numeric ID shows up, since
+      any ID puts the whole input in numeric mode
+    """
+
+    def __init__(self, pattern=NUMERIC_ID_PATTERN, text_fallback=True):
+        self.pattern = pattern
+        self._keys = []
+        self._text = Counter() if text_fallback else None
+
+    def update(self, piece):
+        keys = numeric_id_keys(piece, self.pattern)
+        if len(keys):
+            self._keys.append(keys)
+            self._text = None
+        elif self._text is not None and not self._keys:
+            self._text.update(clean_text_values(piece))
+
+    def table(self, column="Value"):
+        if self._keys or self._text is None:
+            return count_id_keys(np.concatenate(self._keys or [np.empty(0, dtype=np.int64)]), column)
+        return pd.DataFrame(list((self._text or {}).items()), columns=[column, "Count"])
+
+
+def count_values_in(pieces):
+    counter = ValueCounter()
+    for piece in pieces:
+        counter.update(piece)
+    return counter.table()
+
+
+def find_duplicates_and_uniques_in(pieces):
+    """find_duplicates_and_uniques for pieced input: (duplicates, uniques) Value / Count tables."""
+    counts = count_values_in(pieces)
+    repeated = counts["Count"] > 1
+    return counts[repeated].reset_index(drop=True), counts[~repeated].reset_index(drop=True)
+
+
+def count_ids_in(pieces):
+    """count_ids for pieced input: standalone 8-digit IDs and their counts."""
+    counter = ValueCounter(ORG_ID_PATTERN, text_fallback=False)
+    for piece in pieces:
+        counter.update(piece)
+    return counter.table("ID")
+
+
+# === Comparing two ID lists ===
+
+def id_keys_in(pieces, pattern=NUMERIC_ID_PATTERN):
+    """int64 keys (see numeric_id_keys) of every ID in pieced input."""
+    batches = [numeric_id_keys(piece, pattern) for piece in pieces]
+    return np.concatenate(batches) if batches else np.empty(0, dtype=np.int64)
+
+
+def _sorted_counts(keys):
+    # sorts in place (no copy of the full array), then collapses runs of equal keys
+    keys.sort()
+    if not len(keys):
+        return keys, np.empty(0, dtype=np.int64)
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    return keys[starts], np.diff(np.append(starts, len(keys)))
+
+
+class IdComparison:
+    """
+    Set comparison of two ID lists over sorted int64 arrays.
+    - Each side is sorted once and reduced to (distinct IDs, counts): O(n log n)
+    - Matching uses np.searchsorted of one sorted side into the other
+    - Only keys and counts are kept; ID strings are built when a table is asked for
+    """
+
+    TABLES = ["In both", "Only in left", "Only in right", "Count differs"]
+
+    def __init__(self, left_keys, right_keys):
+        left, left_counts = _sorted_counts(np.array(left_keys, dtype=np.int64))
+        right, right_counts = _sorted_counts(np.array(right_keys, dtype=np.int64))
+        pos = np.searchsorted(right, left).clip(max=max(len(right) - 1, 0))
+        in_right = (right[pos] == left) if len(right) else np.zeros(len(left), dtype=bool)
+        in_left = np.zeros(len(right), dtype=bool)
+        in_left[pos[in_right]] = True
+
+        self.left_total, self.right_total = int(left_counts.sum()), int(right_counts.sum())
+        self.left_distinct, self.right_distinct = len(left), len(right)
+        self._both = (left[in_right], left_counts[in_right], right_counts[pos[in_right]])
+        self._left_only = (left[~in_right], left_counts[~in_right])
+        self._right_only = (right[~in_left], right_counts[~in_left])
+
+    def summary(self):
+        both_keys, left_counts, right_counts = self._both
+        rows = [
+            ("Left list", self.left_distinct, self.left_total),
+            ("Right list", self.right_distinct, self.right_total),
+            ("In both", len(both_keys), None),
+            ("Only in left", len(self._left_only[0]), None),
+            ("Only in right", len(self._right_only[0]), None),
+            ("Count differs", int((left_counts != right_counts).sum()), None),
+        ]
+        return pd.DataFrame(rows, columns=["Set", "Distinct IDs", "Occurrences"]).astype({"Occurrences": "Int64"})
+
+    def table(self, name):
+        """One of TABLES as a DataFrame, ordered by ID length then value."""
+        if name in ("In both", "Count differs"):
+            keys, left_counts, right_counts = self._both
+            if name == "Count differs":
+                differs = left_counts != right_counts
+                keys, left_counts, right_counts = keys[differs], left_counts[differs], right_counts[differs]
+            return pd.DataFrame({"ID": id_key_strings(keys), "Left Count": left_counts, "Right Count": right_counts,
+                                 "Difference": left_counts - right_counts})
+        if name in ("Only in left", "Only in right"):
+            keys, counts = self._left_only if name == "Only in left" else self._right_only
+            return pd.DataFrame({"ID": id_key_strings(keys), "Count": counts})
+        raise ValueError(f"Unknown comparison table: {name}")
+
+
+# === Format conversion ===
+
+def convert_ids(pieces, separator, output_path=None):
+    """
+    ids_to_lines (separator "\\n") / ids_to_csv (separator ",") for pieced input,
+    written straight to a file. Returns (output_path, number of values).
+    """
+    if output_path is None:
+        fd, output_path = tempfile.mkstemp(suffix=".txt" if separator == "\n" else ".csv")
+        os.close(fd)
+    count = 0
+    with open(output_path, "w", encoding="utf-8", newline="") as out:
+        for piece in pieces:
+            values = [value.strip() for value in _CONVERT_SPLIT.split(piece) if value.strip()]
+            if values:
+                out.write((separator if count else "") + separator.join(values))
+                count += len(values)
+    return output_path, count
@@ -0,0 +1,164 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+# Extensions the uploader accepts; compressed files are named like data.csv.gz
+INPUT_EXTENSIONS = ["csv", "tsv", "txt", "gz", "zip", "parquet", "pq", "feather", "arrow"]
+# "pyarrow" parses on all cores and is several times faster than the single-threaded
+# C engine, but it turns ISO date columns into date objects the text cleaners skip,
+# so the C engine stays the default
+CSV_ENGINES = ["c", "pyarrow", "python"]
+
+
+def input_format(name):
+    """'parquet', 'feather' or 'csv' from a file name (compression suffixes ignored)."""
+    name = name.lower()
+    for suffix in (".gz", ".zip"):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    if name.endswith((".parquet", ".pq")):
+        return "parquet"
+    if name.endswith((".feather", ".arrow")):
+        return "feather"
+    return "csv"
+
+
+def csv_read_options(name):
+    """Separator and compression for a CSV-family file name, as read_csv keyword arguments."""
+    name = name.lower()
+    compression = "gzip" if name.endswith(".gz") else "zip" if name.endswith(".zip") else None
+    base = name.rsplit(".", 1)[0] if compression else name
+    return {"sep": "\t" if base.endswith(".tsv") else ",", "compression": compression}
+
+
+def parse_dtype_hints(text):
+    """'OrgID: str, Amount: float64' -> {'OrgID': 'str', 'Amount': 'float64'}."""
+    hints = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        column, sep, dtype = item.rpartition(":")
+        if not sep or not column.strip() or not dtype.strip():
+            raise ValueError(f"Dtype hints must look like 'column: type', got '{item}'")
+        hints[column.strip()] = dtype.strip()
+    return hints
+
+
+def parse_usecols(text):
+    return [col.strip() for col in text.split(",") if col.strip()] or None
+
+
+def load_table(source, name=None, engine=None, usecols=None, dtype=None):
+    """
+    Reads an uploaded or local table into a DataFrame.
+    - Parquet / Feather are read column-wise through Arrow
+    - CSV / TSV (optionally .gz / .zip) go through read_csv with the chosen engine
+      ("pyarrow" is multithreaded)
+    - usecols limits the columns read; dtype maps columns to types
+    - with dtype hints, "pyarrow" falls back to the C engine: pandas applies the
+      hints after Arrow has inferred types, so "OrgID: str" would lose leading zeros
+    """
+    name = name or getattr(source, "name", None) or str(source)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    fmt = input_format(name)
+    if fmt == "parquet":
+        df = pd.read_parquet(source, columns=usecols)
+    elif fmt == "feather":
+        df = pd.read_feather(source, columns=usecols)
+    else:
+        if dtype and engine == "pyarrow":
+            engine = "c"
+        return pd.read_csv(source, engine=engine or "c", usecols=usecols, dtype=dtype, **csv_read_options(name))
+    return df.astype(dtype) if dtype else df
+
+
+def load_with_stats(source, name=None, **options):
+    """load_table plus how long it took and how much memory the frame uses."""
+    start = time.perf_counter()
+    df = load_table(source, name, **options)
+    stats = {
+        "seconds": time.perf_counter() - start,
+        "rows": len(df),
+        "columns": df.shape[1],
+        "memory_mb": df.memory_usage(deep=True).sum() / 1024 ** 2,
+    }
+    return df, stats
+
+
+# === Parsed-frame cache ===
+
+def content_digest(source):
+    """Hash of an upload's bytes (or a local file's), independent of its name."""
+    h = hashlib.blake2b(digest_size=16)
+    if hasattr(source, "getbuffer"):
+        h.update(source.getbuffer())
+    else:
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(block)
+    return h.hexdigest()
+
+
+def load_key(digest, name, engine=None, usecols=None, dtype=None):
+    # the name only matters through the format, separator and compression it implies
+    read_as = (input_format(name),) + tuple(csv_read_options(name).values())
+    return (digest, read_as, engine, tuple(usecols or ()), tuple(sorted((dtype or {}).items())))
+
+
+class FrameCache:
+    """
+    In-memory LRU of parsed frames, meant to be shared by every session in
+    the process so the same file is parsed once.
+    - Key: content hash + load options (see load_key)
+    - Least recently used frames are evicted past max_entries or max_mb
+    - Frames are shared: callers must not modify them in place
+    """
+
+    def __init__(self, max_entries=8, max_mb=2048):
+        self.max_entries = max_entries
+        self.max_mb = max_mb
+        self._frames = OrderedDict()  # key -> (df, stats)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is not None:
+                self._frames.move_to_end(key)
+            return entry
+
+    def put(self, key, df, stats):
+        with self._lock:
+            self._frames[key] = (df, stats)
+            self._frames.move_to_end(key)
+            # the newest frame is kept even when it alone is over max_mb
+            while len(self._frames) > 1 and (
+                len(self._frames) > self.max_entries
+                or sum(s["memory_mb"] for _, s in self._frames.values()) > self.max_mb
+            ):
+                self._frames.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+
+    def __len__(self):
+        return len(self._frames)
+
+
+def cached_load(source, cache, digest=None, name=None, **options):
+    """
+    load_with_stats with a FrameCache lookup in front of it.
+    Pass digest when it is already known to skip hashing the content again.
+    Returns (df, stats, from_cache); the frame may be shared with other sessions.
+    """
+    name = name or getattr(source, "name", None) or str(source)
+    key = load_key(digest or content_digest(source), name, **options)
+    entry = cache.get(key)
+    if entry is not None:
+        return entry[0], entry[1], True
+    df, stats = load_with_stats(source, name, **options)
+    cache.put(key, df, stats)
+    return df, stats, False
@@ -0,0 +1,87 @@
+import io
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from cleaner_utils import run_ocr_on_image, run_tiled_ocr_on_image, OCR_CONFIG, OCR_FAILED_PREFIX, TALL_IMAGE_HEIGHT
+from ocr_cache import image_digest
+from parallel import available_cores
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+RESULT_COLUMNS = ["filename", "language", "mode", "text", "elapsed_sec"]
+
+
+def iter_image_files(uploads):
+    """Yields (filename, bytes) for uploaded images, expanding any ZIP archives."""
+    for upload in uploads:
+        data = upload.getvalue() if hasattr(upload, "getvalue") else upload.read()
+        if upload.name.lower().endswith(".zip"):
+            with zipfile.ZipFile(io.BytesIO(data)) as archive:
+                for info in archive.infolist():
+                    if not info.is_dir() and info.filename.lower().endswith(IMAGE_EXTENSIONS):
+                        yield info.filename, archive.read(info)
+        elif upload.name.lower().endswith(IMAGE_EXTENSIONS):
+            yield upload.name, data
+
+
+def _ocr_worker(filename, data, lang, ocr_mode, config):
+    # runs in a pool process: only bytes and strings cross the process boundary
+    start = time.perf_counter()
+    try:
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(data))
+        if image.height > TALL_IMAGE_HEIGHT:
+            # the pool already uses every core, so bands run one after another
+            text = run_tiled_ocr_on_image(image, lang=lang, ocr_mode=ocr_mode, config=config, max_workers=1)
+        else:
+            text = run_ocr_on_image(image, lang=lang, ocr_mode=ocr_mode, config=config)
+    except Exception as e:
+        # pytesseract exceptions do not survive pickling and would break the whole pool
+        text = f"{OCR_FAILED_PREFIX} {e}"
+    return {"filename": filename, "language": lang, "mode": ocr_mode, "text": text,
+            "elapsed_sec": round(time.perf_counter() - start, 3)}
+
+
+def batch_ocr(files, lang="eng", ocr_mode="auto", config=OCR_CONFIG, max_workers=None, cache=None):
+    """
+    OCRs many (filename, bytes) images across a process pool.
+    - max_workers defaults to the number of available cores
+    - Cache hits are yielded straight away; misses are OCR'd in the pool
+    Yields one result dict per image as results come in (not in input order).
+    """
+    pending = []
+    for filename, data in files:
+        if cache is not None:
+            from PIL import Image
+
+            image = Image.open(io.BytesIO(data))
+            key = cache.make_key(image_digest(image), lang, ocr_mode, config, image.height > TALL_IMAGE_HEIGHT)
+            text = cache.get(key)
+            if text is not None:
+                yield {"filename": filename, "language": lang, "mode": ocr_mode, "text": text, "elapsed_sec": 0.0}
+                continue
+        else:
+            key = None
+        pending.append((filename, data, key))
+
+    if not pending:
+        return
+    max_workers = min(max_workers or available_cores(), len(pending))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_ocr_worker, filename, data, lang, ocr_mode, config): key
+            for filename, data, key in pending
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            key = futures[future]
+            if key is not None and not result["text"].startswith(OCR_FAILED_PREFIX):
+                cache.put(key, result["text"])
+            yield result
+
+
+def results_to_frame(results):
+    return pd.DataFrame(results, columns=RESULT_COLUMNS)
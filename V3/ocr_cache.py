@@ -0,0 +1,102 @@
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from cleaner_utils import run_ocr_on_image, run_tiled_ocr_on_image, OCR_CONFIG, OCR_FAILED_PREFIX
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "OCR_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "csv-cleaner", "ocr_cache.sqlite3"),
+)
+
+
+def image_digest(pil_image):
+    """Content hash of the decoded pixels, so re-encoded copies of an image share a key."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{pil_image.mode}:{pil_image.size}".encode())
+    h.update(pil_image.tobytes())
+    return h.hexdigest()
+
+
+class OCRCache:
+    """
+    Persistent OCR result cache in a local SQLite file.
+    - Key: image content hash + language + OCR mode + Tesseract config
+    - Least recently used entries are evicted past max_entries or max_bytes of text
+    - Survives restarts; safe to share between Streamlit sessions and threads
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=5000, max_bytes=50 * 1024 ** 2):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_cache ("
+                "key TEXT PRIMARY KEY, text TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ocr_cache_last_used ON ocr_cache (last_used)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    @staticmethod
+    def make_key(image_hash, lang, ocr_mode, config=OCR_CONFIG, tiled=False):
+        return f"{image_hash}|{lang}|{ocr_mode}|{config}" + ("|tiled" if tiled else "")
+
+    def get(self, key):
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT text FROM ocr_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE ocr_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+
+    def put(self, key, text):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ocr_cache (key, text, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, text, len(text.encode("utf-8")), time.time()),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn):
+        conn.execute(
+            "DELETE FROM ocr_cache WHERE key IN "
+            "(SELECT key FROM ocr_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        conn.execute(
+            "DELETE FROM ocr_cache WHERE key IN (SELECT key FROM "
+            "(SELECT key, SUM(size) OVER (ORDER BY last_used DESC) AS total FROM ocr_cache) WHERE total > ?)",
+            (self.max_bytes,),
+        )
+
+    def clear(self):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM ocr_cache")
+
+    def __len__(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM ocr_cache").fetchone()[0]
+
+
+def cached_ocr(pil_image, lang="eng", ocr_mode="auto", config=OCR_CONFIG, cache=None, tiled=False):
+    """
+    run_ocr_on_image (or run_tiled_ocr_on_image) with a cache lookup in front of it.
+    Returns (text, from_cache). Failed OCR runs are not cached.
+    """
+    ocr = run_tiled_ocr_on_image if tiled else run_ocr_on_image
+    if cache is None:
+        return ocr(pil_image, lang=lang, ocr_mode=ocr_mode, config=config), False
+    key = cache.make_key(image_digest(pil_image), lang, ocr_mode, config, tiled)
+    text = cache.get(key)
+    if text is not None:
+        return text, True
+    text = ocr(pil_image, lang=lang, ocr_mode=ocr_mode, config=config)
+    if not text.startswith(OCR_FAILED_PREFIX):
+        cache.put(key, text)
+    return text, False
@@ -0,0 +1,223 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from cleaner_utils import (
+    trim_whitespace,
+    capitalize_names,
+    fix_text_case,
+    find_and_replace,
+    convert_numbers,
+    infer_column_types,
+    _infer_types_message,
+    _repair_junk,
+    _junk_message,
+)
+
+BACKENDS = ["auto", "thread", "process"]
+
+# Frames smaller than this (rows x columns) are cleaned serially: pool start-up
+# and handoff would cost more than the work itself
+PARALLEL_MIN_CELLS = 1_000_000
+
+
+def available_cores():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on Windows / macOS
+        return os.cpu_count() or 1
+
+
+# === Partial results ===
+# Every operation runs on a part of the frame and returns (part, partial);
+# combine() turns the partials of all parts, in frame order, into the message
+# the serial cleaner would have given.
+
+def _first_message(messages):
+    return messages[0]
+
+
+def _join_listed_columns(messages):
+    # "Prefix: a, b" messages from contiguous column ranges -> one "Prefix: a, b, c, d"
+    listed = [msg.split(": ", 1) for msg in messages if ": " in msg]
+    if not listed:
+        return messages[0]
+    return f"{listed[0][0]}: " + ", ".join(columns for _, columns in listed if columns)
+
+
+def _infer_part(part, **params):
+    return infer_column_types(part, **params)
+
+
+def _combine_reports(reports):
+    return _infer_types_message(pd.concat(reports, ignore_index=True))
+
+
+def _junk_part(part):
+    part, column_rows, codepoint_counts = _repair_junk(part)
+    return part, (column_rows, codepoint_counts)
+
+
+def _combine_junk(partials):
+    column_rows, codepoint_counts = [], None
+    for rows, counts in partials:
+        column_rows.extend(rows)
+        # updating in column order keeps the serial tie order of most_common()
+        codepoint_counts = counts if codepoint_counts is None else codepoint_counts + counts
+    return _junk_message(column_rows, codepoint_counts)
+
+
+# Operations that treat every column on its own: split into column ranges
+COLUMN_OPERATIONS = {
+    "trim_whitespace": (trim_whitespace, _join_listed_columns),
+    "fix_text_case": (fix_text_case, _join_listed_columns),
+    "find_and_replace": (find_and_replace, _first_message),
+    "convert_numbers": (convert_numbers, _join_listed_columns),
+    "infer_types": (_infer_part, _combine_reports),
+    "clean_junk_characters": (_junk_part, _combine_junk),
+}
+
+# Operations that treat every row on its own: split into row ranges
+ROW_OPERATIONS = {
+    "capitalize_names": (capitalize_names, _first_message),
+}
+
+PARALLEL_OPERATIONS = set(COLUMN_OPERATIONS) | set(ROW_OPERATIONS)
+
+# Arrow string kernels release the GIL, so threads scale for most operations;
+# these run per-value Python code and need separate processes instead
+PROCESS_OPERATIONS = {"capitalize_names", "clean_junk_characters"}
+
+
+# === Partitioning ===
+
+def _is_text(dtype):
+    return dtype == object or isinstance(dtype, (pd.StringDtype, pd.CategoricalDtype))
+
+
+def column_ranges(df, parts):
+    """Contiguous (start, stop) column ranges holding about the same number of text columns."""
+    weights = np.where([_is_text(dtype) for dtype in df.dtypes], 1.0, 0.1)
+    bounds = np.searchsorted(np.cumsum(weights), weights.sum() * np.arange(1, parts) / parts, side="right")
+    bounds = np.unique(np.concatenate([[0], bounds, [df.shape[1]]]))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def row_ranges(df, parts):
+    bounds = np.unique(np.linspace(0, len(df), parts + 1).astype(int))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+# === Shared-memory handoff ===
+# A frame crosses to a worker process as a pickle (protocol 5) whose column
+# buffers are written out-of-band into one shared-memory block, so only the
+# block's name and layout go through the pool's pipe.
+
+def to_shared(obj):
+    """Writes obj into a new shared-memory block; returns (block, handle)."""
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    chunks = [memoryview(payload)] + [buffer.raw() for buffer in buffers]
+    sizes = [chunk.nbytes for chunk in chunks]
+    block = shared_memory.SharedMemory(create=True, size=max(1, sum(sizes)))
+    offset = 0
+    for chunk in chunks:
+        block.buf[offset:offset + chunk.nbytes] = chunk
+        offset += chunk.nbytes
+    return block, (block.name, sizes)
+
+
+def from_shared(handle, unlink=False):
+    """Rebuilds the object behind a handle from to_shared(); unlink frees the block."""
+    name, sizes = handle
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        # copied out, so the frame stays valid (and writable) once the block is gone
+        chunks, offset = [], 0
+        for size in sizes:
+            chunks.append(bytearray(block.buf[offset:offset + size]))
+            offset += size
+    finally:
+        block.close()
+        if unlink:
+            block.unlink()
+    return pickle.loads(chunks[0], buffers=chunks[1:])
+
+
+def _run_part(name, part, params):
+    func = (COLUMN_OPERATIONS.get(name) or ROW_OPERATIONS[name])[0]
+    return func(part, **params)
+
+
+def _process_part(name, handle, params):
+    # runs in a pool process: the part arrives through shared memory
+    result = _run_part(name, from_shared(handle), params)
+    if os.name == "nt":
+        # Windows frees a block with its last open handle, so it could not outlive this call
+        return result, None
+    block, result_handle = to_shared(result)
+    block.close()
+    return None, result_handle
+
+
+# === Executor ===
+
+def parallel_apply(df, name, params=None, workers=None, backend="auto", min_cells=PARALLEL_MIN_CELLS):
+    """
+    Runs one cleaner with the frame split across a thread or process pool.
+    - Column-wise operations get contiguous column ranges, capitalize_names row ranges
+    - backend "auto" uses processes for Python-level operations, threads otherwise
+    - Frames under min_cells cells, or workers=1, run serially
+    Returns (df, msg), the same as the serial cleaner. (The MB saved that
+    infer_types reports can differ slightly with processes: a frame rebuilt in a
+    worker drops unused null bitmaps, so it measures a little smaller.)
+    """
+    params = dict(params or {})
+    if name in COLUMN_OPERATIONS:
+        combine, axis = COLUMN_OPERATIONS[name][1], 1
+    elif name in ROW_OPERATIONS:
+        combine, axis = ROW_OPERATIONS[name][1], 0
+    else:
+        raise ValueError(f"Cannot run operation in parallel: {name}")
+
+    workers = workers or available_cores()
+    ranges = column_ranges(df, workers) if axis == 1 else row_ranges(df, workers)
+    if workers < 2 or len(ranges) < 2 or df.size < min_cells:
+        df, partial = _run_part(name, df, params)
+        return df, combine([partial])
+
+    # shallow copies: a part's new columns must not land in the caller's frame
+    take = (lambda start, stop: df.iloc[:, start:stop]) if axis == 1 else (lambda start, stop: df.iloc[start:stop])
+    parts = [take(start, stop).copy(deep=False) for start, stop in ranges]
+    if backend == "auto":
+        backend = "process" if name in PROCESS_OPERATIONS else "thread"
+    if backend == "process":
+        results = _map_processes(name, parts, params)
+    else:
+        with ThreadPoolExecutor(max_workers=len(parts)) as pool:
+            results = list(pool.map(lambda part: _run_part(name, part, params), parts))
+
+    df = pd.concat([part for part, _ in results], axis=axis)
+    return df, combine([partial for _, partial in results])
+
+
+def _map_processes(name, parts, params):
+    blocks, results = [], []
+    try:
+        handles = []
+        for part in parts:
+            block, handle = to_shared(part)
+            blocks.append(block)
+            handles.append(handle)
+        with ProcessPoolExecutor(max_workers=len(parts)) as pool:
+            for result, result_handle in pool.map(_process_part, [name] * len(parts), handles, [params] * len(parts)):
+                results.append(result if result_handle is None else from_shared(result_handle, unlink=True))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return results
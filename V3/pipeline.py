@@ -0,0 +1,208 @@
+from contextlib import nullcontext
+
+import pandas as pd
+
+from cleaner_utils import (
+    remove_duplicates,
+    trim_whitespace,
+    capitalize_names,
+    drop_blank_rows,
+    fill_missing_values,
+    fix_text_case,
+    find_and_replace,
+    convert_numbers,
+    infer_types,
+    split_column,
+    clean_junk_characters,
+    ROW_FILTERS,
+    apply_row_filters,
+    can_fuse_string_step,
+    fused_string_transform,
+)
+from parallel import PARALLEL_OPERATIONS, parallel_apply
+from profiling import run_instrumented
+
+# Operation name -> cleaner function. Every cleaner takes the frame as its
+# first argument and returns (df, message).
+OPERATIONS = {
+    "remove_duplicates": remove_duplicates,
+    "trim_whitespace": trim_whitespace,
+    "capitalize_names": capitalize_names,
+    "drop_blank_rows": drop_blank_rows,
+    "fill_missing_values": fill_missing_values,
+    "fix_text_case": fix_text_case,
+    "find_and_replace": find_and_replace,
+    "convert_numbers": convert_numbers,
+    "infer_types": infer_types,
+    "split_column": split_column,
+    "clean_junk_characters": clean_junk_characters,
+}
+
+
+# pandas 3 always uses copy-on-write; pandas 2 has it behind an option
+if int(pd.__version__.split(".")[0]) >= 3:
+    COPY_ON_WRITE = "always"
+else:
+    try:
+        pd.get_option("mode.copy_on_write")
+        COPY_ON_WRITE = "option"
+    except KeyError:  # pandas < 2 (OptionError is a KeyError)
+        COPY_ON_WRITE = None
+
+
+def _copy_on_write():
+    if COPY_ON_WRITE == "option":
+        return pd.option_context("mode.copy_on_write", True)
+    return nullcontext()
+
+
+def make_step(name, **params):
+    """Build a hashable step spec: (operation name, sorted params)."""
+    if name not in OPERATIONS:
+        raise ValueError(f"Unknown cleaning operation: {name}")
+    return (name, tuple(sorted(params.items())))
+
+
+def _row_filter_batch(df, steps):
+    return apply_row_filters(df, steps)
+
+
+def _parallel_step(name, workers):
+    def run(df, **params):
+        return parallel_apply(df, name, params, workers)
+    return run
+
+
+class CleaningPipeline:
+    """
+    Ordered list of cleaning steps applied to an untouched original frame.
+    - The result after every step prefix is cached
+    - Changing step k only recomputes steps k onward
+    - Re-running with unchanged steps does no work at all
+    - Every step records timing / row / memory metrics (optionally a profile)
+
+    copy_free mode avoids intermediate full-frame copies:
+    - steps get copy-on-write views instead of deep copies, so cached prefixes
+      share every column a step does not modify
+    - consecutive row filters (duplicates, blank rows) are combined into one
+      boolean mask and applied once
+
+    fuse_strings combines consecutive trim / case / find-and-replace /
+    capitalize steps into one pass per column (same result, fewer scans).
+
+    workers > 1 splits other column- or row-wise steps across that many
+    cores (see parallel.parallel_apply); small frames still run serially.
+    """
+
+    def __init__(self, df, profiler="off", copy_free=False, fuse_strings=True, workers=1):
+        self.original = df
+        self.steps = []
+        self.profiler = profiler
+        self.copy_free = copy_free and COPY_ON_WRITE is not None
+        self.fuse_strings = fuse_strings
+        self.workers = workers
+        # (df, msg, metrics) after steps[:i + 1]; df and metrics are None for
+        # steps inside a combined batch except the last one
+        self._results = []
+
+    def set_copy_free(self, copy_free):
+        copy_free = copy_free and COPY_ON_WRITE is not None
+        if copy_free != self.copy_free:
+            self.copy_free = copy_free
+            self._results = []
+
+    def set_workers(self, workers):
+        # results do not change, but cached timings were measured on another core count
+        if workers != self.workers:
+            self.workers = workers
+            self._results = []
+
+    def set_profiler(self, profiler):
+        # cached steps were measured without (or with another) profiler
+        if profiler != self.profiler:
+            self.profiler = profiler
+            self._results = []
+
+    def set_steps(self, steps):
+        steps = list(steps)
+        keep = 0
+        for old, new in zip(self.steps, steps):
+            if old != new:
+                break
+            keep += 1
+        # setters and failed runs can leave fewer cached results than unchanged steps
+        keep = min(keep, len(self._results))
+        # never resume from the middle of a combined batch
+        while keep and self._results[keep - 1][0] is None:
+            keep -= 1
+        self.steps = steps
+        del self._results[keep:]
+
+    def run(self):
+        with _copy_on_write() if self.copy_free else nullcontext():
+            df = self.result
+            i = len(self._results)
+            while i < len(self.steps):
+                func, batch = self._batch(i, df)
+                if len(batch) > 1:
+                    label = " + ".join(name for name, _ in batch)
+                    step_input = df.copy(deep=False) if self.copy_free else df.copy()
+                    df, msgs, metrics = run_instrumented(label, func, step_input, {"steps": batch}, self.profiler)
+                    self._results.extend((None, msg, None) for msg in msgs[:-1])
+                    self._results.append((df, msgs[-1], metrics))
+                    i += len(batch)
+                    continue
+                name, params = self.steps[i]
+                # cleaners may modify their input, so cached frames are never passed in directly;
+                # under copy-on-write a shallow copy is enough and only modified columns get copied
+                step_input = df.copy(deep=False) if self.copy_free else df.copy()
+                func = _parallel_step(name, self.workers) if self.workers > 1 and name in PARALLEL_OPERATIONS else OPERATIONS[name]
+                df, msg, metrics = run_instrumented(name, func, step_input, dict(params), self.profiler)
+                self._results.append((df, msg, metrics))
+                i += 1
+        return self.result, self.logs
+
+    def _batch(self, start, df):
+        """(combined function, steps) for the batch starting at `start`; fewer than two steps means none."""
+        if self.copy_free:
+            batch = self._filter_batch(start)
+            if len(batch) > 1:
+                return _row_filter_batch, batch
+        if self.fuse_strings:
+            return fused_string_transform, self._string_batch(start, df)
+        return None, []
+
+    def _string_batch(self, start, df):
+        """Consecutive string steps from `start` that can share one pass over `df`."""
+        batch = []
+        for name, params in self.steps[start:]:
+            if not can_fuse_string_step(df, name, params):
+                break
+            batch.append((name, params))
+        return batch
+
+    def _filter_batch(self, start):
+        """Consecutive row-filter steps from `start` (at most one duplicate pass)."""
+        batch = []
+        for name, params in self.steps[start:]:
+            if name not in ROW_FILTERS or (name == "remove_duplicates" and any(n == name for n, _ in batch)):
+                break
+            batch.append((name, params))
+        return batch
+
+    @property
+    def result(self):
+        return self._results[-1][0] if self._results else self.original
+
+    @property
+    def logs(self):
+        return [msg for _, msg, _ in self._results]
+
+    @property
+    def step_logs(self):
+        """(message, metrics) per run step; metrics is None inside a combined batch, whose last step holds them."""
+        return [(msg, metrics) for _, msg, metrics in self._results]
+
+    @property
+    def metrics(self):
+        return [metrics for _, _, metrics in self._results if metrics is not None]
@@ -0,0 +1,100 @@
+import cProfile
+import importlib.util
+import io
+import os
+import pstats
+import time
+
+# pyinstrument is optional (not in requirements.txt): only offered when installed
+PROFILERS = ["off", "cProfile"] + (["pyinstrument"] if importlib.util.find_spec("pyinstrument") else [])
+
+
+def process_rss_mb():
+    """Resident memory of this process in MB (psutil if installed, /proc on Linux), else None."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 ** 2
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def reset_peak_rss():
+    """Resets the kernel's peak-RSS counter (Linux only); returns False where unsupported."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    """Peak resident memory since the last reset_peak_rss(), in MB (Linux only)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _round(value, digits=2):
+    return None if value is None else round(value, digits)
+
+
+def run_instrumented(name, func, df, params, profiler="off"):
+    """
+    Runs one cleaner and measures it.
+    Returns (df, msg, metrics) where metrics holds wall / CPU time, rows in and
+    out, process memory before, at peak and after and, if a profiler is chosen,
+    its report. Memory is process-wide, so concurrent sessions can inflate it.
+    """
+    rows_in = len(df)
+    rss_before = process_rss_mb()
+    peak_tracked = reset_peak_rss()
+    report = None
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+    if profiler == "cProfile":
+        prof = cProfile.Profile()
+        df, msg = prof.runcall(func, df, **params)
+        out = io.StringIO()
+        pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(20)
+        report = out.getvalue()
+    elif profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise ImportError("pyinstrument is not installed (pip install pyinstrument)")
+        prof = Profiler()
+        prof.start()
+        try:
+            df, msg = func(df, **params)
+        finally:
+            prof.stop()
+        report = prof.output_text()
+    else:
+        df, msg = func(df, **params)
+
+    peak = peak_rss_mb() if peak_tracked else None
+    metrics = {
+        "Step": name,
+        "Wall (s)": round(time.perf_counter() - wall_start, 4),
+        "CPU (s)": round(time.process_time() - cpu_start, 4),
+        "Rows In": rows_in,
+        "Rows Out": len(df),
+        "RSS Before (MB)": _round(rss_before),
+        "RSS After (MB)": _round(process_rss_mb()),
+        "Peak RSS (MB)": _round(peak),
+        "Peak Extra (MB)": _round(peak - rss_before) if peak is not None and rss_before is not None else None,
+    }
+    if report is not None:
+        metrics["Profile"] = report
+    return df, msg, metrics
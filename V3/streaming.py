@@ -0,0 +1,308 @@
+import os
+import re
+import shutil
+import tempfile
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from cleaner_utils import _junk_message, _repair_junk
+from pipeline import OPERATIONS
+
+# Cleaners whose result for a row depends only on that row, so they can be
+# applied chunk by chunk without seeing the rest of the file.
+ROW_LOCAL_OPERATIONS = {
+    "trim_whitespace",
+    "drop_blank_rows",
+    "fill_missing_values",
+    "fix_text_case",
+    "find_and_replace",
+    "capitalize_names",
+    "split_column",
+    "clean_junk_characters",
+}
+
+# Operations that need the whole file but have an out-of-core implementation here
+STREAMING_OPERATIONS = ROW_LOCAL_OPERATIONS | {"remove_duplicates"}
+
+DEFAULT_CHUNK_ROWS = 200_000
+
+# "Removed 12 ..." / "Filled 3 ..." - per-chunk counts that add up across chunks
+_COUNT_MSG = re.compile(r'^(\w+) (\d+) ')
+
+
+def _merge_chunk_message(previous, msg):
+    if previous is None or previous == msg:
+        return msg
+    prev_match, match = _COUNT_MSG.match(previous), _COUNT_MSG.match(msg)
+    if prev_match and match and prev_match.group(1) == match.group(1):
+        total = int(prev_match.group(2)) + int(match.group(2))
+        return f"{match.group(1)} {total} " + msg[match.end():]
+    # "Trimmed whitespace in columns: a, b" - a column that is all missing in one
+    # chunk is not text there, so every chunk's list goes into the merged one
+    prefix, sep, listed = msg.partition(": ")
+    prev_prefix, prev_sep, prev_listed = previous.partition(": ")
+    if sep and prev_sep and prefix == prev_prefix:
+        columns = dict.fromkeys(col for col in f"{prev_listed}, {listed}".split(", ") if col)
+        return f"{prefix}: {', '.join(columns)}"
+    # anything else that differs between chunks (e.g. a split that failed on one) is kept
+    return previous if msg in previous.split("; ") else f"{previous}; {msg}"
+
+
+def _merge_chunk_junk(previous, column_rows, codepoint_counts):
+    # per-column and per-codepoint counts add up over chunks; see _junk_message
+    totals, counts = previous if previous is not None else ({}, Counter())
+    for row in column_rows:
+        total = totals.setdefault(row['Column'], {'Column': row['Column'], 'Values Affected': 0,
+                                                  'Junk Characters': 0})
+        total['Values Affected'] += row['Values Affected']
+        total['Junk Characters'] += row['Junk Characters']
+    counts.update(codepoint_counts)
+    return totals, counts
+
+
+# === Out-of-core duplicate removal ===
+
+# Second seed for the upper half of 128-bit digests (hash_key must be 16 chars)
+_HASH_KEY_HI = "csvcleaner-rowhi"
+
+
+class RowHashIndex:
+    """
+    Set of row digests used to drop duplicates without holding the rows.
+    - Rows are hashed with pd.util.hash_pandas_object (64-bit, or 128-bit from two seeds)
+    - Digests live in sorted arrays; lookups are vectorized np.searchsorted calls
+    - Once the in-memory run exceeds max_memory_digests it is spilled to an
+      .npy file in spill_dir and memory-mapped for later lookups
+    """
+
+    def __init__(self, digest_bits=64, max_memory_digests=20_000_000, spill_dir=None):
+        if digest_bits not in (64, 128):
+            raise ValueError("digest_bits must be 64 or 128")
+        self.digest_bits = digest_bits
+        self.max_memory_digests = max_memory_digests
+        self._spill_dir = spill_dir
+        self._owns_spill_dir = False
+        self._memory_run = self._empty()
+        self._spilled_runs = []
+        self._count = 0
+
+    def _empty(self):
+        return np.empty(0, dtype=np.uint64 if self.digest_bits == 64 else "V16")
+
+    def __len__(self):
+        return self._count
+
+    @staticmethod
+    def _as_text(df):
+        # chunks can parse a column differently (int, float once a value is missing,
+        # float when it is all missing), so rows are hashed as text with numbers
+        # written as floats: 1 and 1.0 hash the same, missing values stay missing
+        return pd.DataFrame({
+            i: (values.astype("float64") if pd.api.types.is_numeric_dtype(values)
+                and not pd.api.types.is_bool_dtype(values) else values).astype(str)
+            for i, (_, values) in enumerate(df.items())
+        }, index=df.index)
+
+    def hash_rows(self, df):
+        df = self._as_text(df)
+        lo = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        if self.digest_bits == 64:
+            return lo
+        hi = pd.util.hash_pandas_object(df, index=False, hash_key=_HASH_KEY_HI).to_numpy()
+        return np.ascontiguousarray(np.column_stack([hi, lo])).view("V16").ravel()
+
+    def contains(self, digests):
+        found = np.zeros(len(digests), dtype=bool)
+        for run in [self._memory_run] + self._spilled_runs:
+            if len(run):
+                pos = np.minimum(np.searchsorted(run, digests), len(run) - 1)
+                found |= run[pos] == digests
+        return found
+
+    def add(self, digests):
+        """Record digests; returns a mask of those not seen before (first occurrence wins)."""
+        new = np.zeros(len(digests), dtype=bool)
+        if len(digests) == 0:
+            return new
+        _, first = np.unique(digests, return_index=True)
+        new[first] = True
+        new &= ~self.contains(digests)
+
+        added = np.sort(digests[new], kind="stable")
+        # both inputs are sorted, so the stable sort is a linear merge
+        self._memory_run = np.sort(np.concatenate([self._memory_run, added]), kind="stable")
+        self._count += len(added)
+        if len(self._memory_run) > self.max_memory_digests:
+            self._spill()
+        return new
+
+    def _spill(self):
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="rowhash_")
+            self._owns_spill_dir = True
+        path = os.path.join(self._spill_dir, f"run_{len(self._spilled_runs)}.npy")
+        np.save(path, self._memory_run)
+        self._spilled_runs.append(np.load(path, mmap_mode="r"))
+        self._memory_run = self._empty()
+
+    def close(self):
+        self._spilled_runs = []
+        self._memory_run = self._empty()
+        if self._owns_spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+
+
+def last_occurrence_mask(digests):
+    """Boolean mask keeping the last occurrence of every digest."""
+    keep = np.zeros(len(digests), dtype=bool)
+    _, first_in_reversed = np.unique(digests[::-1], return_index=True)
+    keep[len(digests) - 1 - first_in_reversed] = True
+    return keep
+
+
+class ChunkDeduplicator:
+    """
+    Applies remove_duplicates to a stream of chunks.
+    - keep='first': single pass, rows are dropped as soon as their digest was seen
+    - keep='last': needs the full digest column first; call prepare() with a
+      pass over the same chunks before filtering
+    """
+
+    def __init__(self, keep="first", digest_bits=64, max_memory_digests=20_000_000, spill_dir=None):
+        if keep not in ("first", "last"):
+            raise ValueError("keep must be 'first' or 'last'")
+        self.keep = keep
+        self.index = RowHashIndex(digest_bits, max_memory_digests, spill_dir)
+        self._keep_mask = None
+        self._offset = 0
+        self.removed = 0
+
+    def prepare(self, chunks):
+        parts = [self.index.hash_rows(chunk) for chunk in chunks]
+        digests = np.concatenate(parts) if parts else self.index._empty()
+        self._keep_mask = last_occurrence_mask(digests)
+
+    def filter(self, chunk):
+        if self.keep == "first":
+            mask = self.index.add(self.index.hash_rows(chunk))
+        else:
+            if self._keep_mask is None:
+                raise RuntimeError("prepare() must be called before filtering with keep='last'")
+            mask = self._keep_mask[self._offset:self._offset + len(chunk)]
+            self._offset += len(chunk)
+        self.removed += len(chunk) - int(mask.sum())
+        return chunk[mask]
+
+    @property
+    def message(self):
+        return f"Removed {self.removed} duplicate rows" if self.removed else "No duplicates found"
+
+    def close(self):
+        self.index.close()
+
+
+# === Chunked cleaning ===
+
+def _read_chunks(source, chunk_rows, read_csv_kwargs):
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return pd.read_csv(source, chunksize=chunk_rows, **read_csv_kwargs)
+
+
+def _apply_steps(chunk, steps, dedupers, step_msgs=None):
+    for i, (name, params) in enumerate(steps):
+        if name == "remove_duplicates":
+            chunk = dedupers[i].filter(chunk)
+            continue
+        if name == "clean_junk_characters":
+            chunk, column_rows, codepoint_counts = _repair_junk(chunk)
+            if step_msgs is not None:
+                step_msgs[i] = _merge_chunk_junk(step_msgs[i], column_rows, codepoint_counts)
+            continue
+        chunk, msg = OPERATIONS[name](chunk, **dict(params))
+        if step_msgs is not None:
+            step_msgs[i] = _merge_chunk_message(step_msgs[i], msg)
+    return chunk
+
+
+def _reset(deduper, digest_bits, max_memory_digests):
+    """Fresh copy of a deduplicator so it can filter the stream again from the start."""
+    keep_mask = deduper._keep_mask
+    deduper.close()
+    fresh = ChunkDeduplicator(deduper.keep, digest_bits, max_memory_digests)
+    fresh._keep_mask = keep_mask
+    return fresh
+
+
+def clean_csv_in_chunks(source, steps, chunk_rows=DEFAULT_CHUNK_ROWS, output_path=None,
+                        digest_bits=64, max_memory_digests=20_000_000, **read_csv_kwargs):
+    """
+    Streams a CSV through cleaning steps and writes the result to disk.
+    - source: path or seekable file-like object accepted by pd.read_csv
+    - steps: (name, params) specs as built by pipeline.make_step
+    - Peak memory is bounded by chunk_rows (plus 8-16 bytes per row for duplicate removal)
+    - remove_duplicates with keep='last' reads the source once more to collect digests
+    - Without output_path a temp file is created; it is deleted if cleaning fails
+    Returns (output_path, logs, rows_written).
+    """
+    not_streamable = [name for name, _ in steps if name not in STREAMING_OPERATIONS]
+    if not_streamable:
+        raise ValueError(f"Operations not supported in streaming mode: {', '.join(not_streamable)}")
+
+    dedupers = {}
+    for i, (name, params) in enumerate(steps):
+        if name == "remove_duplicates":
+            dedupers[i] = ChunkDeduplicator(dict(params).get("keep", "first"), digest_bits, max_memory_digests)
+
+    created = None
+    try:
+        for i, deduper in dedupers.items():
+            if deduper.keep == "last":
+                # pass over the chunks as they reach step i, then restart earlier dedupers
+                earlier = {j: d for j, d in dedupers.items() if j < i}
+                deduper.prepare(
+                    _apply_steps(chunk, steps[:i], earlier)
+                    for chunk in _read_chunks(source, chunk_rows, read_csv_kwargs)
+                )
+                for j, d in earlier.items():
+                    dedupers[j] = _reset(d, digest_bits, max_memory_digests)
+
+        if output_path is None:
+            fd, output_path = tempfile.mkstemp(prefix="cleaned_", suffix=".csv")
+            os.close(fd)
+            created = output_path
+
+        step_msgs = [None] * len(steps)
+        header = None
+        rows_written = 0
+        with open(output_path, "w", newline="", encoding="utf-8") as out:
+            for chunk in _read_chunks(source, chunk_rows, read_csv_kwargs):
+                chunk = _apply_steps(chunk, steps, dedupers, step_msgs)
+                # later chunks must keep the column layout of the first one
+                if header is None:
+                    header = list(chunk.columns)
+                    chunk.to_csv(out, index=False)
+                else:
+                    chunk.reindex(columns=header).to_csv(out, index=False, header=False)
+                rows_written += len(chunk)
+    except BaseException:
+        # a failed run must not leave a partial (possibly multi-GB) temp file behind
+        if created is not None and os.path.exists(created):
+            os.remove(created)
+        raise
+    finally:
+        for deduper in dedupers.values():
+            deduper.close()
+
+    for i, deduper in dedupers.items():
+        step_msgs[i] = deduper.message
+    for i, (name, _) in enumerate(steps):
+        if name == "clean_junk_characters" and step_msgs[i] is not None:
+            totals, counts = step_msgs[i]
+            step_msgs[i] = _junk_message(list(totals.values()), counts)
+    logs = [msg for msg in step_msgs if msg is not None]
+    logs.append(f"Wrote {rows_written} rows in chunks of {chunk_rows}")
+    return output_path, logs, rows_written
+
@@ -0,0 +1,10 @@
+import os
+
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def test_app_first_run():
+    app = AppTest.from_file(APP, default_timeout=60).run()
+    assert not app.exception
@@ -0,0 +1,44 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "cleaners.py")
+_spec = importlib.util.spec_from_file_location("bench_cleaners", _PATH)
+bench = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+
+def test_make_frame_shape_and_duplicates():
+    df = bench.make_frame(1000, text_columns=1, dup_ratio=0.2, seed=1)
+    assert len(df) == 1000
+    assert list(df.columns) == ["Full Name", "Institution", "Country", "OrgID", "Amount", "text_0"]
+    assert df.duplicated().sum() >= 150
+    assert bench.make_frame(1000, seed=1).equals(bench.make_frame(1000, seed=1))
+
+
+@pytest.mark.parametrize("name", sorted(bench.CASES))
+def test_every_case_runs(name):
+    assert bench.run([200], [name], track_memory=False)[0]["rows"] == 200
+
+
+def test_peak_memory_counts_arrow_buffers():
+    peak = bench._peak_memory("trim_whitespace", 50_000, {})
+    if peak is None:
+        pytest.skip("peak resident memory is not available on this platform")
+    # the trimmed copies of the text columns alone are several MB of Arrow data
+    assert peak > 1
+
+
+def test_compare_flags_regressions(tmp_path, capsys):
+    baseline = {"results": [{"function": "trim_whitespace", "rows": 10, "seconds": 1.0}]}
+    slower = [{"function": "trim_whitespace", "rows": 10, "seconds": 2.0},
+              {"function": "new_case", "rows": 10, "seconds": 1.0}]
+    assert bench.compare(slower, baseline) == slower[:1]
+    assert "REGRESSION" in capsys.readouterr().out
+
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps(baseline))
+    assert bench.main(["--sizes", "10", "--functions", "trim_whitespace", "--no-memory",
+                       "-o", str(tmp_path / "new.json"), "--compare", str(path), "--threshold", "1000"]) == 0
@@ -0,0 +1,139 @@
+import pandas as pd
+
+from cleaner_utils import (
+    ARROW_STRING,
+    capitalize_names,
+    compact_frame,
+    convert_numbers,
+    fix_text_case,
+    infer_column_types,
+    infer_types,
+    parse_stop_words,
+    smart_title,
+    smart_title_text,
+    smart_title_values,
+    trim_whitespace,
+)
+
+
+# === Type inference ===
+
+def test_convert_numbers_skips_columns_with_a_bad_last_value():
+    df = pd.DataFrame({"ok": ["1", "2", "3"], "bad": ["1", "2", "x"], "name": ["a", "b", "c"]})
+    df, msg = convert_numbers(df)
+    assert df["ok"].tolist() == [1, 2, 3]
+    assert df["bad"].tolist() == ["1", "2", "x"]
+    assert msg == "Converted columns to numeric: ok"
+
+
+def test_empty_strings_become_missing_not_failures():
+    df = pd.DataFrame({"a": ["1", "  ", "3"], "b": ["yes", "", "no"]})
+    numbers, msg = convert_numbers(df.copy())
+    assert numbers["a"].tolist()[::2] == [1.0, 3.0] and pd.isna(numbers["a"].iloc[1])
+    assert msg == "Converted columns to numeric: a"
+    inferred, report = infer_column_types(df)
+    assert str(inferred["a"].dtype) == "Int8" and str(inferred["b"].dtype) == "boolean"
+    assert report["Failed"].tolist() == [0, 0]
+
+
+def test_infer_types_picks_compact_dtypes():
+    df = pd.DataFrame({
+        "small": ["1", "2", "3", "4"],
+        "gaps": ["1", None, "300", "4"],
+        "ratio": ["0.5", "1.25", "2", "3"],
+        "flag": ["yes", "No", "true", "FALSE"],
+        "when": ["2024-01-31", "2024-02-01", "2024-02-02", "2024-02-03"],
+        "text": ["alpha", "beta", "gamma", "delta"],
+    })
+    df, report = infer_column_types(df)
+    assert str(df["small"].dtype) == "int8"
+    assert str(df["gaps"].dtype) == "Int16"
+    assert str(df["ratio"].dtype) == "float32"
+    assert str(df["flag"].dtype) == "boolean" and df["flag"].tolist() == [True, False, True, False]
+    assert str(df["when"].dtype).startswith("datetime64")
+    assert "text" not in set(report["Column"])
+
+
+def test_failure_ratio_allows_some_bad_values():
+    values = [str(i) for i in range(99)] + ["n/a"]
+    strict, _ = infer_column_types(pd.DataFrame({"v": values}))
+    assert strict["v"].tolist() == values
+    lenient, report = infer_column_types(pd.DataFrame({"v": values}), max_failure_ratio=0.05)
+    assert lenient["v"].isna().sum() == 1
+    assert report.loc[0, "Failed"] == 1
+
+
+def test_infer_types_on_empty_and_all_missing_columns():
+    _, msg = infer_types(pd.DataFrame({"a": pd.Series([], dtype=object)}))
+    assert msg == "No type conversions applied"
+    df, _ = infer_types(pd.DataFrame({"a": [None, None]}, dtype=object))
+    assert df["a"].isna().all()
+
+
+# === Compact mode ===
+
+def test_compact_frame_uses_category_and_arrow_strings():
+    df = pd.DataFrame({"Country": ["UK", "US", "UK", "UK"], "Name": ["a", "b", "c", "d"], "Amount": [1, 2, 3, 4]})
+    df, msg = compact_frame(df)
+    assert isinstance(df["Country"].dtype, pd.CategoricalDtype)
+    assert df["Name"].dtype == ARROW_STRING
+    assert df["Amount"].dtype == "int64"
+    assert msg.startswith("Compacted 1 columns to category and 1 to Arrow strings")
+
+
+def test_text_cleaners_work_on_compact_columns():
+    df, _ = compact_frame(pd.DataFrame({"Country": [" uk", "uk ", " uk", None], "Name": [" a", "b ", "c", "d"]}))
+    df, msg = trim_whitespace(df)
+    assert "Country" in msg
+    # categories that become equal are merged
+    assert list(df["Country"].cat.categories) == ["uk"]
+    df, _ = fix_text_case(df, mode="upper")
+    assert df["Country"].tolist()[:3] == ["UK"] * 3 and pd.isna(df["Country"].iloc[3])
+    assert df["Name"].tolist() == ["A", "B", "C", "D"]
+
+
+def test_type_conversion_parses_category_columns():
+    df, _ = compact_frame(pd.DataFrame({"Code": ["1", "2", None, "2"], "Flag": ["yes", "no", "yes", "yes"]}))
+    numbers, msg = convert_numbers(df.copy())
+    assert msg == "Converted columns to numeric: Code"
+    assert numbers["Code"].tolist()[:2] == [1.0, 2.0] and pd.isna(numbers["Code"].iloc[2])
+    inferred, report = infer_column_types(df)
+    assert str(inferred["Code"].dtype) == "Int8" and str(inferred["Flag"].dtype) == "boolean"
+    assert inferred["Flag"].tolist() == [True, False, True, True]
+    assert report["Failed"].tolist() == [0, 0]
+
+
+def test_compact_empty_frame():
+    df, msg = compact_frame(pd.DataFrame())
+    assert df.empty and "0 columns" in msg
+
+
+# === Title case ===
+
+def test_smart_title_keeps_stop_words_lowercase():
+    assert smart_title("UNIVERSITY OF THE west") == "University of the West"
+    assert smart_title("of mice and men") == "Of Mice and Men"
+    assert smart_title("") == ""
+
+
+def test_per_unique_title_case_matches_per_row():
+    values = pd.Series(["univ of oxford", None, "univ of oxford", "ADA lovelace"], dtype=object)
+    titled = smart_title_values(values)
+    assert titled.iloc[0] == titled.iloc[2] == "Univ of Oxford"
+    assert pd.isna(titled.iloc[1])
+    assert titled.iloc[3] == smart_title("ADA lovelace")
+
+
+def test_capitalize_names_with_custom_stop_words():
+    df = pd.DataFrame({"Full Name": ["jan van der berg"], "City": ["den haag"]})
+    df, msg = capitalize_names(df, parse_stop_words("van, der"))
+    assert df["Full Name"].tolist() == ["Jan van der Berg"]
+    assert df["City"].tolist() == ["den haag"]
+    assert msg == "Capitalized names in column: Full Name"
+    _, msg = capitalize_names(pd.DataFrame({"City": ["x"]}))
+    assert msg == "No 'name' column found for capitalization"
+
+
+def test_smart_title_text_by_line():
+    assert smart_title_text("the end is near\nTHE END IS NEAR") == "The End is Near\nThe End is Near"
+    assert parse_stop_words("") == frozenset()
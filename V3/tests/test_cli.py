@@ -0,0 +1,94 @@
+import json
+
+import pandas as pd
+import pytest
+
+from cli import build_steps, clean_file, load_pipeline_definition, main
+
+
+STEPS = {"steps": [
+    {"op": "trim_whitespace"},
+    {"op": "fix_text_case", "params": {"mode": "title"}},
+    {"op": "remove_duplicates"},
+    {"op": "drop_blank_rows"},
+]}
+
+
+def write_input(path):
+    pd.DataFrame({"Name": [" ada ", "ada", None], "City": ["london", "london", None]}).to_csv(path, index=False)
+
+
+def test_log_has_one_line_per_step(tmp_path):
+    write_input(tmp_path / "people.csv")
+    result = clean_file(str(tmp_path / "people.csv"), build_steps(STEPS), str(tmp_path))
+    assert result["ok"] and result["rows"] == 1
+    lines = (tmp_path / "people_cleaned.log").read_text(encoding="utf-8").splitlines()
+    assert [line.split(":")[0] for line in lines[:4]] == [
+        "- trim_whitespace", "- fix_text_case", "- remove_duplicates", "- drop_blank_rows"]
+    assert "duplicate" in lines[2]
+    assert "blank" in lines[3].lower()
+
+
+def test_main_reports_missing_inputs(tmp_path, capsys):
+    definition = tmp_path / "pipeline.json"
+    definition.write_text(json.dumps(STEPS))
+    assert main([str(definition), str(tmp_path / "missing.csv"), "-o", str(tmp_path)]) == 2
+    assert "not found" in capsys.readouterr().err
+
+
+def test_definition_may_be_a_bare_list(tmp_path):
+    path = tmp_path / "steps.json"
+    path.write_text(json.dumps([{"op": "find_and_replace", "params": {"find_val": "a", "replace_val": "b"}}]))
+    steps = build_steps(load_pipeline_definition(str(path)))
+    assert steps == [("find_and_replace", (("find_val", "a"), ("replace_val", "b")))]
+
+
+def test_batch_run_writes_outputs_and_logs(tmp_path, capsys):
+    for name in ("one.csv", "two.csv"):
+        write_input(tmp_path / name)
+    definition = tmp_path / "pipeline.json"
+    definition.write_text(json.dumps({"steps": STEPS["steps"], "chunk_rows": 1000}))
+    out_dir = tmp_path / "cleaned"
+    assert main([str(definition), str(tmp_path / "*.csv"), "-o", str(out_dir), "--workers", "2"]) == 0
+    assert sorted(p.name for p in out_dir.iterdir()) == [
+        "one_cleaned.csv", "one_cleaned.log", "two_cleaned.csv", "two_cleaned.log"]
+    assert "2/2 files cleaned" in capsys.readouterr().out
+
+
+def test_chunk_rows_leaves_parquet_in_memory(tmp_path):
+    pd.DataFrame({"Name": [" ada ", "ada"]}).to_parquet(tmp_path / "people.parquet")
+    result = clean_file(str(tmp_path / "people.parquet"), build_steps(STEPS), str(tmp_path), chunk_rows=1)
+    assert result["ok"], result["error"]
+    assert pd.read_csv(tmp_path / "people_cleaned.csv")["Name"].tolist() == ["Ada"]
+
+
+def test_failed_file_is_reported(tmp_path):
+    write_input(tmp_path / "people.csv")
+    steps = build_steps({"steps": [{"op": "split_column", "params": {"column": "Name"}}]})
+    result = clean_file(str(tmp_path / "people.csv"), steps, str(tmp_path))
+    assert not result["ok"] and result["error"].startswith("TypeError")
+    assert "FAILED" in (tmp_path / "people_cleaned.log").read_text(encoding="utf-8")
+
+
+def test_invalid_definition(tmp_path, capsys):
+    definition = tmp_path / "pipeline.json"
+    definition.write_text(json.dumps({"steps": [{"op": "no_such_step"}]}))
+    write_input(tmp_path / "people.csv")
+    assert main([str(definition), str(tmp_path / "people.csv")]) == 2
+    assert "Invalid pipeline definition" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("name, text", [
+    ("pipeline.json", "{not json"),
+    ("pipeline.json", "42"),
+    ("pipeline.yaml", "steps: [unclosed"),
+    ("pipeline.yaml", "trim_whitespace"),
+])
+def test_malformed_definition(tmp_path, capsys, name, text):
+    if name.endswith(".yaml"):
+        pytest.importorskip("yaml")
+    definition = tmp_path / name
+    definition.write_text(text)
+    write_input(tmp_path / "people.csv")
+    assert main([str(definition), str(tmp_path / "people.csv")]) == 2
+    assert "Invalid pipeline definition" in capsys.readouterr().err
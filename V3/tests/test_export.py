@@ -0,0 +1,80 @@
+import gc
+import os
+
+import pandas as pd
+import pytest
+
+import export
+from export import EXPORT_FORMATS, ExportCache, available_formats, export_file_name
+
+
+def frame():
+    return pd.DataFrame({"Name": ["Ada", "Alan"], "Amount": [1.5, 2.0]})
+
+
+def test_csv_export_is_reused_per_version(tmp_path):
+    cache = ExportCache(str(tmp_path))
+    first = cache.path(frame(), "v1", "CSV")
+    mtime = os.path.getmtime(first)
+    assert cache.path(frame(), "v1", "CSV") == first
+    assert os.path.getmtime(first) == mtime
+    assert pd.read_csv(first).equals(frame())
+
+
+def test_new_version_deletes_older_files(tmp_path):
+    cache = ExportCache(str(tmp_path))
+    gzip_path = cache.path(frame(), "v1", "CSV (gzip)")
+    cache.path(frame().head(1), "v2", "CSV")
+    assert not os.path.exists(gzip_path)
+    assert len(pd.read_csv(cache.path(frame().head(1), "v2", "CSV"))) == 1
+    assert sorted(os.listdir(cache.directory)) == ["export.csv"]
+
+
+def test_writer_gets_a_path_with_the_real_extension(tmp_path, monkeypatch):
+    seen = []
+
+    def writer(df, path):
+        seen.append(path)
+        open(path, "w").close()
+
+    monkeypatch.setitem(EXPORT_FORMATS, "Excel", (".xlsx", "application/octet-stream", writer, None))
+    path = ExportCache(str(tmp_path)).path(frame(), "v1", "Excel")
+    assert seen[0].endswith(".xlsx")
+    assert path.endswith("export.xlsx")
+
+
+def test_directory_removed_on_close_and_garbage_collection():
+    cache = ExportCache()
+    cache.path(frame(), "v1", "CSV")
+    directory = cache.directory
+    cache.close()
+    assert not os.path.exists(directory)
+
+    cache = ExportCache()
+    directory = cache.directory
+    del cache
+    gc.collect()
+    assert not os.path.exists(directory)
+
+
+def test_caller_directory_is_kept(tmp_path):
+    (tmp_path / "other.txt").write_text("keep")
+    cache = ExportCache(str(tmp_path))
+    cache.path(frame(), "v1", "CSV")
+    cache.close()
+    assert os.listdir(tmp_path) == ["other.txt"]
+
+    cache = ExportCache(str(tmp_path))
+    del cache
+    gc.collect()
+    assert os.listdir(tmp_path) == ["other.txt"]
+
+
+def test_excel_row_limit():
+    with pytest.raises(ValueError):
+        export._write_excel(pd.DataFrame({"a": range(export.EXCEL_MAX_ROWS + 1)}), "unused.xlsx")
+
+
+def test_formats_and_file_names():
+    assert "CSV" in available_formats()
+    assert export_file_name("CSV (gzip)") == "cleaned_data.csv.gz"
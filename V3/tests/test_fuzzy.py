@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from fuzzy import candidate_pairs, connected_components, find_near_duplicates, normalize_names
+
+
+def test_normalize_names_expands_abbreviations():
+    assert list(normalize_names(["Univ. of Oxford", "Dept. of Physics & Astronomy"])) == [
+        "university of oxford", "department of physics and astronomy"]
+
+
+def test_spelling_variants_cluster_together():
+    values = ["University of Oxford"] * 3 + ["Univ. of Oxford", "Harvard University", "Harvard Univ", "Zurich"]
+    clusters = find_near_duplicates(values)
+    assert list(clusters["Cluster"]) == [1, 1, 2, 2]
+    # each cluster starts with its most frequent value
+    assert clusters.iloc[0].tolist() == [1, "University of Oxford", 3, 1.0]
+    assert "Zurich" not in set(clusters["Value"])
+
+
+def test_no_near_duplicates():
+    for values in (pd.Series(["Oxford", "Zurich"]), ["abc", "abc", "abc", "abd"], ["Oxford"], [], [None, "..."]):
+        clusters = find_near_duplicates(values)
+        assert clusters.empty
+        assert list(clusters.columns) == ["Cluster", "Value", "Count", "Score"]
+
+
+def test_candidate_pairs_without_shared_buckets():
+    signatures = np.arange(8, dtype=np.uint16).reshape(2, 4)
+    left, right = candidate_pairs(signatures)
+    assert len(left) == len(right) == 0
+
+
+def test_connected_components():
+    labels = connected_components(5, np.array([3, 1]), np.array([4, 3]))
+    assert labels.tolist() == [0, 1, 2, 1, 1]
@@ -0,0 +1,44 @@
+import numpy as np
+
+import cleaner_utils
+from cleaner_utils import (
+    count_id_keys,
+    count_ids,
+    count_values,
+    find_duplicates_and_uniques,
+    id_key_strings,
+    numeric_id_keys,
+)
+
+
+def test_leading_zeros_keep_ids_apart():
+    keys = numeric_id_keys("00123456, 123456\n00123456")
+    assert id_key_strings(keys).tolist() == ["00123456", "123456", "00123456"]
+    table = count_id_keys(keys)
+    assert table.values.tolist() == [["00123456", 2], ["123456", 1]]
+
+
+def test_count_ids_only_counts_standalone_eight_digits():
+    table = count_ids("12345678 123456789 12345678,87654321 abc12345678")
+    assert table.to_dict("list") == {"ID": ["12345678", "87654321"], "Count": [2, 1]}
+
+
+def test_slices_do_not_split_ids():
+    text = "11111111,22222222 33333333\n11111111"
+    sliced = list(cleaner_utils._text_slices(text, 5))
+    assert "".join(sliced) == text and len(sliced) == 4
+    found = [match for part in sliced for match in cleaner_utils.NUMERIC_ID_PATTERN.findall(part)]
+    assert found == ["11111111", "22222222", "33333333", "11111111"]
+
+
+def test_text_values_fall_back_to_case_insensitive_counts():
+    dupes, uniques = find_duplicates_and_uniques("Oxford, oxford.\nCambridge")
+    assert dupes.values.tolist() == [["oxford", 2]]
+    assert uniques.values.tolist() == [["cambridge", 1]]
+
+
+def test_empty_input():
+    assert count_values("").empty
+    assert count_values(None).empty
+    assert count_ids("no ids here").empty
+    assert list(count_id_keys(np.empty(0, dtype=np.int64)).columns) == ["ID", "Count"]
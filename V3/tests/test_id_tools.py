@@ -0,0 +1,103 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cleaner_utils import count_ids, find_duplicates_and_uniques
+from id_tools import (
+    IdComparison,
+    convert_ids,
+    count_ids_in,
+    find_duplicates_and_uniques_in,
+    iter_column_pieces,
+    iter_file_pieces,
+    id_keys_in,
+)
+
+
+# === Pieced input ===
+
+TEXT = "﻿12345678, 12345678\n87654321\toxford\n00000042\n" * 50
+
+
+def test_file_pieces_end_at_separators():
+    pieces = list(iter_file_pieces(io.BytesIO(TEXT.encode("utf-8")), chunk_chars=64))
+    assert len(pieces) > 1
+    assert "".join(pieces) == TEXT.lstrip("﻿")
+    # every piece after the first starts at a separator, so no ID is cut
+    assert all(piece[0] in "\n,\t" for piece in pieces[1:])
+
+
+def test_pieced_results_match_whole_text(tmp_path):
+    path = tmp_path / "ids.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    text = TEXT.lstrip("﻿")
+    assert count_ids_in(iter_file_pieces(str(path), chunk_chars=50)).equals(count_ids(text))
+    dupes, uniques = find_duplicates_and_uniques_in(iter_file_pieces(str(path), chunk_chars=50))
+    expected_dupes, expected_uniques = find_duplicates_and_uniques(text)
+    assert dupes.equals(expected_dupes) and uniques.equals(expected_uniques)
+
+
+def test_column_pieces_restore_float_ids():
+    column = pd.Series([12345678.0, None, 87654321.0])
+    assert list(iter_column_pieces(column, batch_rows=1)) == ["12345678", "87654321"]
+    assert count_ids_in(iter_column_pieces(column)).to_dict("list") == {
+        "ID": ["12345678", "87654321"], "Count": [1, 1]}
+
+
+def test_text_values_stop_counting_once_ids_appear():
+    dupes, _ = find_duplicates_and_uniques_in(["oxford, oxford", "\n12345678, 12345678"])
+    assert dupes.values.tolist() == [["12345678", 2]]
+    dupes, uniques = find_duplicates_and_uniques_in(["oxford, Oxford", ",cambridge"])
+    assert dupes.values.tolist() == [["oxford", 2]] and uniques.values.tolist() == [["cambridge", 1]]
+
+
+def test_convert_ids_writes_one_separator_between_values(tmp_path):
+    path, count = convert_ids(["1,2", "\n3", ",, 4 "], "\n", str(tmp_path / "ids.txt"))
+    assert count == 4
+    assert (tmp_path / "ids.txt").read_text(encoding="utf-8") == "1\n2\n3\n4"
+
+
+def test_empty_inputs(tmp_path):
+    assert list(iter_file_pieces(io.BytesIO(b""))) == []
+    assert count_ids_in([]).empty and list(count_ids_in([]).columns) == ["ID", "Count"]
+    dupes, uniques = find_duplicates_and_uniques_in([])
+    assert dupes.empty and uniques.empty
+    _, count = convert_ids([], ",", str(tmp_path / "ids.csv"))
+    assert count == 0
+
+
+# === Comparing two lists ===
+
+def compare(left, right):
+    return IdComparison(id_keys_in([left]), id_keys_in([right]))
+
+
+def test_comparison_sets():
+    comparison = compare("12345678, 12345678, 23456789, 0001234", "12345678\n34567890\n001234")
+    assert comparison.table("In both").values.tolist() == [["12345678", 2, 1, 1]]
+    # leading zeros make 0001234 and 001234 different IDs
+    assert comparison.table("Only in left")["ID"].tolist() == ["0001234", "23456789"]
+    assert comparison.table("Only in right")["ID"].tolist() == ["001234", "34567890"]
+    assert comparison.table("Count differs")["ID"].tolist() == ["12345678"]
+    summary = comparison.summary().set_index("Set")
+    assert summary.loc["Left list"].tolist() == [3, 4]
+    assert summary.loc["Right list"].tolist() == [3, 3]
+
+
+def test_comparison_matches_python_sets():
+    rng = np.random.default_rng(0)
+    left, right = rng.integers(10**7, 10**7 + 500, 2000), rng.integers(10**7, 10**7 + 500, 1500)
+    comparison = compare(",".join(map(str, left)), ",".join(map(str, right)))
+    assert set(comparison.table("In both")["ID"]) == set(map(str, set(left) & set(right)))
+    assert set(comparison.table("Only in left")["ID"]) == set(map(str, set(left) - set(right)))
+
+
+def test_comparison_with_an_empty_side():
+    comparison = compare("", "12345678")
+    assert comparison.table("In both").empty
+    assert comparison.table("Only in right")["ID"].tolist() == ["12345678"]
+    assert compare("", "").summary()["Distinct IDs"].sum() == 0
+    with pytest.raises(ValueError):
+        comparison.table("Nowhere")
@@ -0,0 +1,69 @@
+import pandas as pd
+
+from cleaner_utils import clean_junk_characters, detect_and_clean_junk_characters, scan_junk_characters
+
+
+# === Text tool ===
+
+def test_homoglyphs_zero_width_and_accents():
+    highlighted, cleaned = detect_and_clean_junk_characters("Pаris​ café Ｘ")
+    assert cleaned == "Paris cafe X"
+    assert highlighted == "P[а]ris[U+200B] caf[é] [Ｘ]"
+
+
+def test_plain_ascii_and_empty_input():
+    assert detect_and_clean_junk_characters("plain text\n") == ("plain text\n", "plain text\n")
+    assert detect_and_clean_junk_characters("") == ("", "")
+    assert detect_and_clean_junk_characters(None) == ("", "")
+
+
+def test_unmappable_characters_are_dropped():
+    assert detect_and_clean_junk_characters("a中b") == ("a[中]b", "ab")
+
+
+def test_control_characters_are_highlighted():
+    highlighted, _ = detect_and_clean_junk_characters("a\x07b")
+    assert highlighted == "a[\x07]b"
+
+
+def test_repeated_characters_give_the_same_result():
+    text = "Mоscow " * 1000
+    assert detect_and_clean_junk_characters(text)[1] == "Moscow " * 1000
+
+
+# === CSV columns ===
+
+def junk_frame():
+    return pd.DataFrame({
+        "Name": ["Pаris", "London", None, "Zürich"],
+        "City": ["ok", "ok", "ok", "ok"],
+        "Amount": [1, 2, 3, 4],
+    })
+
+
+def test_scan_counts_per_column_and_codepoint():
+    columns, codepoints = scan_junk_characters(junk_frame())
+    assert columns.to_dict("records") == [{"Column": "Name", "Values Affected": 2, "Junk Characters": 2}]
+    assert set(codepoints["Codepoint"]) == {"U+0430", "U+00FC"}
+    assert dict(zip(codepoints["Character"], codepoints["Replacement"])) == {"а": "a", "ü": "u"}
+
+
+def test_clean_repairs_only_affected_values():
+    df, msg = clean_junk_characters(junk_frame())
+    assert df["Name"].tolist()[:2] == ["Paris", "London"] and pd.isna(df["Name"].iloc[2])
+    assert df["Name"].iloc[3] == "Zurich"
+    assert msg.startswith("Repaired junk characters in: Name (2)")
+
+
+def test_clean_category_column():
+    df = junk_frame().astype({"Name": "category"})
+    df, _ = clean_junk_characters(df)
+    assert isinstance(df["Name"].dtype, pd.CategoricalDtype)
+    assert "Paris" in set(df["Name"].cat.categories)
+
+
+def test_clean_frame_without_junk():
+    columns, codepoints = scan_junk_characters(pd.DataFrame({"a": ["x"], "b": [1]}))
+    assert columns.empty and codepoints.empty
+    _, msg = clean_junk_characters(pd.DataFrame())
+    assert msg == "No junk characters found"
@@ -0,0 +1,90 @@
+import gzip
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+from loader import (
+    FrameCache,
+    cached_load,
+    content_digest,
+    csv_read_options,
+    input_format,
+    load_table,
+    parse_dtype_hints,
+    parse_usecols,
+)
+
+CSV = "OrgID,Amount\n00012345,1.5\n00067890,2.0\n"
+
+
+def write(path, text):
+    if path.suffix == ".gz":
+        with gzip.open(path, "wt") as f:
+            f.write(text)
+    elif path.suffix == ".zip":
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr(path.stem, text)
+    else:
+        path.write_text(text)
+    return path
+
+
+@pytest.mark.parametrize("name", ["ids.csv", "ids.tsv", "ids.csv.gz", "ids.csv.zip"])
+@pytest.mark.parametrize("engine", ["c", "pyarrow", "python"])
+def test_str_hint_keeps_leading_zeros(tmp_path, name, engine):
+    text = CSV.replace(",", "\t") if ".tsv" in name else CSV
+    df = load_table(str(write(tmp_path / name, text)), engine=engine, dtype={"OrgID": "str"})
+    assert df["OrgID"].tolist() == ["00012345", "00067890"]
+
+
+def test_parquet_usecols_and_dtype(tmp_path):
+    pd.DataFrame({"OrgID": ["001", "002"], "Amount": [1, 2]}).to_parquet(tmp_path / "t.parquet")
+    df = load_table(str(tmp_path / "t.parquet"), usecols=["Amount"], dtype={"Amount": "float64"})
+    assert list(df.columns) == ["Amount"] and df["Amount"].dtype == "float64"
+
+
+def test_name_parsing():
+    assert input_format("data.PARQUET") == "parquet"
+    assert input_format("data.feather.gz") == "feather"
+    assert csv_read_options("data.tsv.gz") == {"sep": "\t", "compression": "gzip"}
+    assert parse_usecols(" a, ,b ") == ["a", "b"]
+    assert parse_usecols("") is None
+    assert parse_dtype_hints("OrgID: str, Amount: float64") == {"OrgID": "str", "Amount": "float64"}
+    with pytest.raises(ValueError):
+        parse_dtype_hints("OrgID")
+
+
+def test_cache_reuses_frames_by_content():
+    first = io.BytesIO(CSV.encode())
+    second = io.BytesIO(CSV.encode())
+    assert content_digest(first) == content_digest(second)
+    cache = FrameCache()
+    df, _, hit = cached_load(first, cache, name="a.csv")
+    again, _, hit_again = cached_load(second, cache, name="b.csv")
+    assert not hit and hit_again and again is df
+    # another format of the same bytes is parsed again
+    _, _, tsv_hit = cached_load(second, cache, name="b.tsv")
+    assert not tsv_hit
+
+
+def test_cache_evicts_least_recently_used():
+    cache = FrameCache(max_entries=2)
+    for key in "abc":
+        cache.put(key, pd.DataFrame(), {"memory_mb": 1})
+    assert len(cache) == 2 and cache.get("a") is None and cache.get("c") is not None
+    big = FrameCache(max_mb=10)
+    big.put("a", pd.DataFrame(), {"memory_mb": 8})
+    big.put("b", pd.DataFrame(), {"memory_mb": 8})
+    assert big.get("a") is None and big.get("b") is not None
+
+
+def test_cache_key_includes_load_options():
+    source = io.BytesIO(CSV.encode())
+    cache = FrameCache()
+    cached_load(source, cache, name="a.csv")
+    _, _, hit = cached_load(source, cache, name="a.csv", dtype={"OrgID": "str"})
+    assert not hit and len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,52 @@
+import io
+import zipfile
+
+from PIL import Image
+
+import ocr_batch
+from cleaner_utils import OCR_FAILED_PREFIX
+from ocr_batch import RESULT_COLUMNS, _ocr_worker, batch_ocr, iter_image_files, results_to_frame
+from ocr_cache import OCRCache, image_digest
+
+
+class Upload(io.BytesIO):
+    def __init__(self, name, data):
+        super().__init__(data)
+        self.name = name
+
+
+def png_bytes(color="white"):
+    out = io.BytesIO()
+    Image.new("RGB", (20, 10), color).save(out, format="PNG")
+    return out.getvalue()
+
+
+def test_zip_archives_are_expanded():
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("shots/a.png", png_bytes())
+        z.writestr("notes.txt", "skip me")
+    files = list(iter_image_files([Upload("b.PNG", png_bytes()), Upload("all.zip", archive.getvalue()),
+                                   Upload("readme.md", b"")]))
+    assert [name for name, _ in files] == ["b.PNG", "shots/a.png"]
+
+
+def test_worker_reports_failures_as_text(monkeypatch):
+    monkeypatch.setattr(ocr_batch, "run_ocr_on_image", lambda image, **kwargs: "text")
+    assert _ocr_worker("a.png", png_bytes(), "eng", "auto", "")["text"] == "text"
+    failed = _ocr_worker("broken.png", b"not an image", "eng", "auto", "")
+    assert failed["text"].startswith(OCR_FAILED_PREFIX)
+    assert list(failed) == RESULT_COLUMNS
+
+
+def test_cached_images_skip_the_pool(tmp_path):
+    cache = OCRCache(str(tmp_path / "ocr.sqlite3"))
+    image = Image.open(io.BytesIO(png_bytes()))
+    cache.put(cache.make_key(image_digest(image), "eng", "auto", ocr_batch.OCR_CONFIG), "cached text")
+    results = list(batch_ocr([("a.png", png_bytes())], cache=cache))
+    assert [(r["filename"], r["text"], r["elapsed_sec"]) for r in results] == [("a.png", "cached text", 0.0)]
+
+
+def test_no_images():
+    assert list(batch_ocr([])) == []
+    assert list(results_to_frame([]).columns) == RESULT_COLUMNS
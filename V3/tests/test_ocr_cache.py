@@ -0,0 +1,55 @@
+from PIL import Image
+
+import ocr_cache
+from cleaner_utils import OCR_FAILED_PREFIX
+from ocr_cache import OCRCache, cached_ocr, image_digest
+
+
+def image(color="white"):
+    return Image.new("RGB", (20, 10), color)
+
+
+def fake_ocr(calls, text="hello"):
+    def ocr(pil_image, lang, ocr_mode, config):
+        calls.append((lang, ocr_mode))
+        return text
+    return ocr
+
+
+def test_digest_follows_pixels_not_encoding():
+    assert image_digest(image()) == image_digest(image().copy())
+    assert image_digest(image()) != image_digest(image("black"))
+
+
+def test_second_call_is_a_cache_hit(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(ocr_cache, "run_ocr_on_image", fake_ocr(calls))
+    cache = OCRCache(str(tmp_path / "ocr.sqlite3"))
+    assert cached_ocr(image(), cache=cache) == ("hello", False)
+    assert cached_ocr(image(), cache=cache) == ("hello", True)
+    # another language is another key
+    assert cached_ocr(image(), lang="deu", cache=cache) == ("hello", False)
+    assert len(calls) == 2
+    # the cache file survives a new instance
+    assert len(OCRCache(str(tmp_path / "ocr.sqlite3"))) == 2
+
+
+def test_failed_ocr_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(ocr_cache, "run_ocr_on_image", fake_ocr([], f"{OCR_FAILED_PREFIX} no tesseract"))
+    cache = OCRCache(str(tmp_path / "ocr.sqlite3"))
+    text, from_cache = cached_ocr(image(), cache=cache)
+    assert text.startswith(OCR_FAILED_PREFIX) and not from_cache
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = OCRCache(str(tmp_path / "ocr.sqlite3"), max_entries=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"  # a is now more recent than b
+    cache.put("c", "3")
+    assert cache.get("b") is None and cache.get("a") == "1" and len(cache) == 2
+    sized = OCRCache(str(tmp_path / "sized.sqlite3"), max_bytes=5)
+    sized.put("a", "abc")
+    sized.put("b", "def")
+    assert sized.get("a") is None and sized.get("b") == "def"
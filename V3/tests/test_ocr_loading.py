@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import cleaner_utils
+
+
+def test_language_list_does_not_import_opencv():
+    snippet = "import sys, cleaner_utils; cleaner_utils.get_tesseract_languages(); print('cv2' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", snippet], cwd=cleaner_utils.os.path.dirname(cleaner_utils.__file__),
+                         capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "False"
+
+
+def test_batch_module_does_not_import_pil():
+    snippet = "import sys, ocr_batch; print('PIL' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", snippet], cwd=cleaner_utils.os.path.dirname(cleaner_utils.__file__),
+                         capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "False"
+
+
+def test_missing_tesseract_is_cached(monkeypatch):
+    calls = []
+
+    class NoTesseract:
+        @staticmethod
+        def get_languages(config=""):
+            calls.append(config)
+            raise OSError("tesseract is not installed")
+
+    monkeypatch.setattr(cleaner_utils, "_load_pytesseract", lambda: NoTesseract)
+    monkeypatch.setattr(cleaner_utils, "_tesseract_languages", None)
+    assert cleaner_utils.get_tesseract_languages() == {}
+    assert cleaner_utils.get_tesseract_languages() == {}
+    assert len(calls) == 1
+    cleaner_utils.get_tesseract_languages(refresh=True)
+    assert len(calls) == 2
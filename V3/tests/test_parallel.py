@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from parallel import column_ranges, from_shared, parallel_apply, row_ranges, to_shared
+from pipeline import OPERATIONS
+
+
+def frame():
+    return pd.DataFrame({
+        "Full Name": [" ada lovelace", "Аlan turing ", None, "grace hopper"] * 5,
+        "City": ["london", "Zürich", "york", None] * 5,
+        "Amount": ["1", "2", "3", "4"] * 5,
+        "Note": ["x ", " y", "z", "w"] * 5,
+    })
+
+
+@pytest.mark.parametrize("name, params", [
+    ("trim_whitespace", {}),
+    ("fix_text_case", {"mode": "upper"}),
+    ("convert_numbers", {}),
+    ("capitalize_names", {}),
+    ("clean_junk_characters", {}),
+])
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_parallel_matches_serial(name, params, backend):
+    serial, serial_msg = OPERATIONS[name](frame(), **params)
+    df, msg = parallel_apply(frame(), name, params, workers=2, backend=backend, min_cells=0)
+    pd.testing.assert_frame_equal(df, serial)
+    assert msg == serial_msg
+
+
+def test_small_frames_run_serially():
+    df, msg = parallel_apply(frame(), "trim_whitespace", workers=4)
+    assert msg == OPERATIONS["trim_whitespace"](frame())[1]
+
+
+def test_unknown_operation():
+    with pytest.raises(ValueError):
+        parallel_apply(frame(), "remove_duplicates", workers=2)
+
+
+def test_shared_memory_round_trip():
+    block, handle = to_shared(frame())
+    block.close()
+    pd.testing.assert_frame_equal(from_shared(handle, unlink=True), frame())
+
+
+def test_ranges_cover_the_frame():
+    assert row_ranges(frame(), 3) == [(0, 6), (6, 13), (13, 20)]
+    ranges = column_ranges(frame(), 2)
+    assert ranges[0][0] == 0 and ranges[-1][1] == 4
+    assert column_ranges(pd.DataFrame(), 2) == []
@@ -0,0 +1,154 @@
+import pandas as pd
+import pytest
+
+from pipeline import OPERATIONS, CleaningPipeline, make_step
+
+
+def sample_frame():
+    return pd.DataFrame({
+        "Full Name": [" ada lovelace ", "alan turing", "alan turing", None],
+        "Country": ["UK", "UK", "UK", None],
+    })
+
+
+STEPS = [make_step("trim_whitespace"), make_step("remove_duplicates"), make_step("drop_blank_rows")]
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Names of the operations run, in order."""
+    calls = []
+    for name, func in list(OPERATIONS.items()):
+        def counted(df, _name=name, _func=func, **params):
+            calls.append(_name)
+            return _func(df, **params)
+        monkeypatch.setitem(OPERATIONS, name, counted)
+    return calls
+
+
+@pytest.mark.parametrize("setter, value", [
+    ("set_profiler", "cProfile"),
+    ("set_copy_free", True),
+    ("set_workers", 2),
+])
+def test_setter_then_set_steps_and_run(setter, value):
+    pipeline = CleaningPipeline(sample_frame())
+    pipeline.set_steps(STEPS)
+    pipeline.run()
+    getattr(pipeline, setter)(value)
+    pipeline.set_steps(STEPS)
+    df, logs = pipeline.run()
+    assert len(df) == 2
+    assert len(logs) == len(STEPS)
+
+
+def test_set_steps_twice_without_run():
+    pipeline = CleaningPipeline(sample_frame())
+    pipeline.set_steps(STEPS)
+    pipeline.set_steps(STEPS + [make_step("fill_missing_values")])
+    df, logs = pipeline.run()
+    assert len(logs) == 4
+
+
+def test_set_steps_after_failed_run():
+    pipeline = CleaningPipeline(sample_frame())
+    pipeline.set_steps([make_step("trim_whitespace"), make_step("split_column", column="Missing")])
+    with pytest.raises(TypeError):  # split_column has no "column" parameter
+        pipeline.run()
+    pipeline.set_steps([make_step("trim_whitespace"), make_step("remove_duplicates")])
+    df, _ = pipeline.run()
+    assert len(df) == 3
+    assert list(df["Full Name"].dropna()) == ["ada lovelace", "alan turing"]
+
+
+def test_copy_free_combines_row_filters():
+    pipeline = CleaningPipeline(sample_frame(), copy_free=True)
+    pipeline.set_steps(STEPS)
+    df, logs = pipeline.run()
+    plain = CleaningPipeline(sample_frame())
+    plain.set_steps(STEPS)
+    assert df.equals(plain.run()[0]) and logs == plain.logs
+    # duplicates + blank rows run as one batch, timed on its last step
+    assert pipeline.step_logs[1][1] is None
+    assert pipeline.step_logs[2][1]["Step"] == "remove_duplicates + drop_blank_rows"
+
+
+def test_fused_steps_keep_one_message_each():
+    steps = [make_step("trim_whitespace"), make_step("fix_text_case", mode="title"),
+             make_step("remove_duplicates"), make_step("drop_blank_rows")]
+    pipeline = CleaningPipeline(sample_frame(), fuse_strings=True)
+    pipeline.set_steps(steps)
+    pipeline.run()
+    step_logs = pipeline.step_logs
+    assert len(step_logs) == len(steps)
+    # trim + case run as one batch, timed on its last step
+    assert step_logs[0][1] is None
+    assert step_logs[1][1]["Step"] == "trim_whitespace + fix_text_case"
+    assert "duplicate" in step_logs[2][0]
+    assert all(metrics is not None for _, metrics in step_logs[1:])
+    assert len(pipeline.metrics) == 3
+
+
+def test_fused_steps_match_separate_runs():
+    steps = [make_step("trim_whitespace"), make_step("capitalize_names"), make_step("fix_text_case", mode="upper"),
+             make_step("find_and_replace", find_val="UK", replace_val="GB")]
+    results = []
+    for fuse_strings in (True, False):
+        pipeline = CleaningPipeline(sample_frame(), fuse_strings=fuse_strings)
+        pipeline.set_steps(steps)
+        results.append(pipeline.run())
+    (fused, fused_logs), (separate, separate_logs) = results
+    assert fused.equals(separate)
+    assert fused_logs == separate_logs
+
+
+def test_unchanged_steps_are_not_rerun():
+    pipeline = CleaningPipeline(sample_frame())
+    pipeline.set_steps(STEPS)
+    pipeline.run()
+    cached = pipeline.step_logs[0][1]
+    pipeline.set_steps(STEPS[:1] + [make_step("fill_missing_values", fill_value="NA")])
+    df, _ = pipeline.run()
+    assert pipeline.step_logs[0][1] is cached
+    assert df["Country"].tolist() == ["UK", "UK", "UK", "NA"]
+
+
+def test_unknown_step():
+    with pytest.raises(ValueError):
+        make_step("no_such_operation")
+
+
+def test_rerun_with_unchanged_steps_does_no_work(calls):
+    pipeline = CleaningPipeline(sample_frame())
+    pipeline.set_steps(STEPS)
+    first, logs = pipeline.run()
+    pipeline.set_steps(list(STEPS))
+    again, _ = pipeline.run()
+    assert again is first
+    assert calls == [name for name, _ in STEPS]
+    assert len(logs) == len(STEPS)
+
+
+def test_changed_step_recomputes_from_there_on(calls):
+    pipeline = CleaningPipeline(sample_frame())
+    pipeline.set_steps(STEPS)
+    pipeline.run()
+    del calls[:]
+    pipeline.set_steps([STEPS[0], make_step("fill_missing_values", fill_value="NA"), STEPS[2]])
+    df, _ = pipeline.run()
+    assert calls == ["fill_missing_values", "drop_blank_rows"]
+    assert df["Country"].tolist() == ["UK", "UK", "UK", "NA"]
+
+
+def test_original_frame_is_not_modified():
+    original = sample_frame()
+    pipeline = CleaningPipeline(original)
+    pipeline.set_steps(STEPS)
+    pipeline.run()
+    assert original.equals(sample_frame())
+
+
+def test_no_steps_returns_original():
+    original = sample_frame()
+    df, logs = CleaningPipeline(original).run()
+    assert df is original and logs == []
@@ -0,0 +1,25 @@
+import importlib.util
+
+import pandas as pd
+import pytest
+
+from cleaner_utils import remove_duplicates
+from profiling import PROFILERS, run_instrumented
+
+
+def test_pyinstrument_only_listed_when_installed():
+    assert ("pyinstrument" in PROFILERS) == (importlib.util.find_spec("pyinstrument") is not None)
+
+
+@pytest.mark.parametrize("profiler", PROFILERS)
+def test_every_listed_profiler_runs(profiler):
+    df, msg, metrics = run_instrumented("remove_duplicates", remove_duplicates, pd.DataFrame({"a": [1, 1, 2]}), {},
+                                        profiler)
+    assert len(df) == 2 and "1 duplicate" in msg
+    assert (metrics["Rows In"], metrics["Rows Out"]) == (3, 2)
+    assert ("Profile" in metrics) == (profiler != "off")
+
+
+def test_empty_frame():
+    _, _, metrics = run_instrumented("remove_duplicates", remove_duplicates, pd.DataFrame(), {})
+    assert metrics["Rows In"] == metrics["Rows Out"] == 0
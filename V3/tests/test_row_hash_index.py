@@ -0,0 +1,85 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pipeline import make_step
+from streaming import ChunkDeduplicator, RowHashIndex, clean_csv_in_chunks, last_occurrence_mask
+
+
+def frame(values):
+    return pd.DataFrame({"a": values, "b": [str(v) for v in values]})
+
+
+@pytest.mark.parametrize("digest_bits", [64, 128])
+def test_first_occurrence_wins_across_chunks(digest_bits):
+    index = RowHashIndex(digest_bits)
+    first = index.add(index.hash_rows(frame([1, 2, 2, 3])))
+    second = index.add(index.hash_rows(frame([3, 4, 1])))
+    assert first.tolist() == [True, True, False, True]
+    assert second.tolist() == [False, True, False]
+    assert len(index) == 4
+
+
+def test_spilled_runs_are_still_searched(tmp_path):
+    index = RowHashIndex(max_memory_digests=2, spill_dir=str(tmp_path))
+    index.add(index.hash_rows(frame([1, 2, 3])))
+    assert os.listdir(tmp_path) == ["run_0.npy"]
+    assert index.add(index.hash_rows(frame([2, 5]))).tolist() == [False, True]
+    index.close()
+
+
+def test_spill_dir_is_removed_on_close():
+    index = RowHashIndex(max_memory_digests=1)
+    index.add(index.hash_rows(frame([1, 2])))
+    spill_dir = index._spill_dir
+    assert os.path.isdir(spill_dir)
+    index.close()
+    assert not os.path.exists(spill_dir)
+
+
+def test_empty_chunk():
+    index = RowHashIndex()
+    assert index.add(index.hash_rows(frame([]))).tolist() == []
+    assert len(index) == 0
+
+
+def test_int_and_float_chunks_hash_the_same():
+    index = RowHashIndex()
+    ints = pd.DataFrame({"a": [1, 2], "b": [None, None]})
+    floats = pd.DataFrame({"a": [1.0, None], "b": pd.Series([None, "x"], dtype="str")})
+    assert index.hash_rows(ints)[0] == index.hash_rows(floats)[0]
+
+
+def test_last_occurrence_mask():
+    assert last_occurrence_mask(np.array([5, 6, 5, 7, 6], dtype=np.uint64)).tolist() == [False, False, True, True, True]
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        RowHashIndex(digest_bits=32)
+    with pytest.raises(ValueError):
+        ChunkDeduplicator(keep=False)
+
+
+@pytest.mark.parametrize("keep", ["first", "last"])
+def test_streamed_dedup_matches_drop_duplicates(tmp_path, keep):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.integers(0, 20, 500), "b": rng.choice(["x", "y"], 500)})
+    source = io.StringIO(df.to_csv(index=False))
+    path, logs, rows = clean_csv_in_chunks(source, [make_step("remove_duplicates", keep=keep)], chunk_rows=37,
+                                           output_path=str(tmp_path / "out.csv"))
+    expected = df.drop_duplicates(keep=keep).reset_index(drop=True)
+    assert pd.read_csv(path).equals(expected)
+    assert logs[0] == f"Removed {len(df) - len(expected)} duplicate rows"
+
+
+def test_dedup_leaves_column_types_to_the_other_steps(tmp_path):
+    source = io.StringIO("a,b\n1e5,x\n1e5,x\n")
+    steps = [make_step("remove_duplicates"), make_step("fix_text_case", mode="upper")]
+    path, logs, rows = clean_csv_in_chunks(source, steps, output_path=str(tmp_path / "out.csv"))
+    assert rows == 1
+    assert open(path).read().splitlines() == ["a,b", "100000.0,X"]
+    assert logs[1] == "Formatted text case as 'upper' in: b"
@@ -0,0 +1,67 @@
+import glob
+import io
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+
+import streaming
+from pipeline import make_step
+from streaming import clean_csv_in_chunks
+
+
+def csv_source(rows):
+    return io.StringIO(pd.DataFrame(rows, columns=["Name", "City"]).to_csv(index=False))
+
+
+ROWS = [[" ada ", "london"], ["alan", "leeds"], [None, None], ["grace ", "york"], ["alan", "leeds"]]
+
+
+def test_chunked_clean_matches_whole_file(tmp_path):
+    steps = [make_step("trim_whitespace"), make_step("drop_blank_rows")]
+    path, logs, rows = clean_csv_in_chunks(csv_source(ROWS), steps, chunk_rows=2,
+                                           output_path=str(tmp_path / "out.csv"))
+    out = pd.read_csv(path)
+    assert rows == 4 and len(out) == 4
+    assert out["Name"].tolist() == ["ada", "alan", "grace", "alan"]
+    assert logs[-1] == "Wrote 4 rows in chunks of 2"
+
+
+def test_messages_cover_every_chunk(tmp_path):
+    # City is all missing in the second chunk, so only the first one trims it
+    rows = [["a", "x"], ["b", "y"], ["c", None], ["d", None]]
+    path, logs, _ = clean_csv_in_chunks(csv_source(rows), [make_step("trim_whitespace")], chunk_rows=2,
+                                        output_path=str(tmp_path / "out.csv"))
+    assert logs[0] == "Trimmed whitespace in columns: Name, City"
+
+
+def test_junk_counts_add_up_over_chunks(tmp_path):
+    rows = [["Pаris", "ok"], ["Zürich", "ok"], ["plain", "ok"], ["plain", "ok"]]
+    path, logs, _ = clean_csv_in_chunks(csv_source(rows), [make_step("clean_junk_characters")], chunk_rows=2,
+                                        output_path=str(tmp_path / "out.csv"))
+    assert pd.read_csv(path)["Name"].tolist() == ["Paris", "Zurich", "plain", "plain"]
+    assert logs[0].startswith("Repaired junk characters in: Name (2); most common: ")
+
+
+def test_empty_input(tmp_path):
+    path, _, rows = clean_csv_in_chunks(io.StringIO("Name,City\n"), [make_step("trim_whitespace")],
+                                        output_path=str(tmp_path / "out.csv"))
+    assert rows == 0
+
+
+def test_unsupported_operation():
+    with pytest.raises(ValueError):
+        clean_csv_in_chunks(csv_source(ROWS), [make_step("convert_numbers")])
+
+
+def test_failed_run_deletes_its_temp_file(monkeypatch):
+    def broken(chunk):
+        raise RuntimeError("cleaner failed")
+
+    monkeypatch.setitem(streaming.OPERATIONS, "trim_whitespace", broken)
+    pattern = os.path.join(tempfile.gettempdir(), "cleaned_*.csv")
+    before = set(glob.glob(pattern))
+    with pytest.raises(RuntimeError):
+        clean_csv_in_chunks(csv_source(ROWS), [make_step("trim_whitespace")], chunk_rows=2)
+    assert set(glob.glob(pattern)) == before
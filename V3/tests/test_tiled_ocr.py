@@ -0,0 +1,52 @@
+import numpy as np
+from PIL import Image
+
+import cleaner_utils
+from cleaner_utils import OCR_FAILED_PREFIX, _stitch_band_texts, find_band_cuts, run_tiled_ocr_on_image
+
+
+def page(height, text_rows):
+    gray = np.full((height, 50), 255, dtype=np.uint8)
+    for row in text_rows:
+        gray[row] = 0
+    return gray
+
+
+def test_cuts_land_on_blank_rows():
+    # a little ink on every row except 1990 and 4050
+    gray = np.full((5000, 50), 255, dtype=np.uint8)
+    gray[:, :5] = 0
+    gray[[1990, 4050], :5] = 255
+    cuts, ink = find_band_cuts(gray, band_height=2000, search=200)
+    assert cuts == [0, 1990, 4050, 5000]
+    assert ink[1990] == ink[4050] == 0
+
+
+def test_short_image_is_one_band():
+    assert find_band_cuts(page(1000, [10]), band_height=2000)[0] == [0, 1000]
+
+
+def test_stitching_drops_repeated_overlap_lines():
+    texts = ["line 1\nline 2\nline 3", "line 3\nline 4", "line 5"]
+    assert _stitch_band_texts(texts, [False, True, False]) == "line 1\nline 2\nline 3\nline 4\nline 5"
+    # without overlap nothing is dropped
+    assert _stitch_band_texts(["a", "a"], [False, False]) == "a\na"
+    assert _stitch_band_texts([], []) == ""
+
+
+def test_tall_image_is_ocrd_in_bands(monkeypatch):
+    monkeypatch.setattr(cleaner_utils, "_preprocess_for_ocr", lambda image, mode: np.asarray(image))
+    seen = []
+
+    def fake_tesseract(band, lang, config):
+        seen.append(band.shape[0])
+        return f"band of {band.shape[0]}"
+
+    monkeypatch.setattr(cleaner_utils, "_tesseract_to_text", fake_tesseract)
+    image = Image.fromarray(page(5000, range(0, 5000, 7)))
+    text = run_tiled_ocr_on_image(image, band_height=2000, max_workers=2)
+    assert len(seen) == 3 and sum(seen) >= 5000
+    assert text.count("band of") == 3
+
+    monkeypatch.setattr(cleaner_utils, "_tesseract_to_text", lambda band, lang, config: f"{OCR_FAILED_PREFIX} boom")
+    assert run_tiled_ocr_on_image(image, band_height=2000).startswith(OCR_FAILED_PREFIX)